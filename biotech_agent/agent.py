@@ -1,18 +1,21 @@
+import functools
+
+# The agent is I/O-bound on MCP SSE streams and LLM HTTP calls; uvloop's
+# libuv-backed event loop roughly halves per-request scheduler overhead.
+# Optional: fall back to the stdlib loop where uvloop is unavailable.
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 from google.adk.agents import Agent
 from .subagents.normalization.agent import create_agent as create_normalization_agent
 from .subagents.gene_analysis.agent import create_agent as create_gene_analysis_agent
 from .subagents.insight_synthesis.agent import create_agent as create_insight_agent
 
-def create_root_agent(model: str = "gemini-2.5-pro") -> Agent:
-    normalization_agent = create_normalization_agent(model)
-    gene_analysis_agent = create_gene_analysis_agent(model)
-    insight_agent = create_insight_agent(model)
-    
-    return Agent(
-        name="biotech_root_agent",
-        model=model,
-        sub_agents=[normalization_agent, gene_analysis_agent, insight_agent],
-        instruction="""
+# Built once at import instead of per create_root_agent call.
+_ROOT_INSTRUCTION = """
     You are a sophisticated BioTech Research Assistant.
     Your mission is to assist users with drug discovery tasks by orchestrating a team of specialized subagents.
 
@@ -26,10 +29,35 @@ def create_root_agent(model: str = "gemini-2.5-pro") -> Agent:
     If Gene Analysis returns a list of genes, you might ask Insight Synthesis to check if there are existing drugs targeting those genes.
 
     Provide a comprehensive final answer to the user based on the combined findings.
-    """,
-        description="Root agent for BioTech Drug Discovery that orchestrates specialized subagents."
+    """
+
+_ROOT_DESCRIPTION = "Root agent for BioTech Drug Discovery that orchestrates specialized subagents."
+
+
+def create_root_agent(model: str = "gemini-2.5-pro") -> Agent:
+    normalization_agent = create_normalization_agent(model)
+    gene_analysis_agent = create_gene_analysis_agent(model)
+    insight_agent = create_insight_agent(model)
+
+    return Agent(
+        name="biotech_root_agent",
+        model=model,
+        sub_agents=[normalization_agent, gene_analysis_agent, insight_agent],
+        instruction=_ROOT_INSTRUCTION,
+        description=_ROOT_DESCRIPTION
     )
 
-# Expose the agent instance for ADK to pick up if needed, though usually ADK runs via a script or adk web pointing to the file.
-# We'll instantiate it here.
-root_agent = create_root_agent()
+
+@functools.cache
+def get_root_agent() -> Agent:
+    """Build (once) and return the root agent with its subagent tree."""
+    return create_root_agent()
+
+
+def __getattr__(name: str):
+    # ADK discovers the agent via the module-level `root_agent` attribute.
+    # Resolving it lazily defers subagent construction and MCP toolset wiring
+    # (auth token fetches included) until the agent is actually used.
+    if name == "root_agent":
+        return get_root_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,19 +1,29 @@
 import sys
 import traceback
 
-print("Starting debug script...")
-try:
-    print("Importing google.adk.cli.cli_tools_click...")
-    from google.adk.cli import cli_tools_click
-    print("Import successful.")
-    print("Calling main with --help...")
+
+def main() -> None:
+    """Exercise the ADK CLI import and --help path for diagnostics."""
+    print("Starting debug script...")
     try:
-        cli_tools_click.main(['--help'], standalone_mode=False)
-    except SystemExit as e:
-        print(f"SystemExit caught: {e}")
-except Exception:
-    print("Exception occurred:")
-    traceback.print_exc()
-except SystemExit:
-    print("SystemExit during import?")
-    traceback.print_exc()
+        print("Importing google.adk.cli.cli_tools_click...")
+        from google.adk.cli import cli_tools_click
+        print("Import successful.")
+        print("Calling main with --help...")
+        try:
+            cli_tools_click.main(['--help'], standalone_mode=False)
+        except SystemExit as e:
+            print(f"SystemExit caught: {e}")
+    except Exception:
+        print("Exception occurred:")
+        traceback.print_exc()
+    except SystemExit:
+        print("SystemExit during import?")
+        traceback.print_exc()
+
+
+# Guarded so importing the package for debugging does not drag in the whole
+# Click CLI tree; run with `python -m biotech_agent.debug_adk` (optionally
+# under `python -X importtime` to profile the import cost).
+if __name__ == "__main__":
+    main()
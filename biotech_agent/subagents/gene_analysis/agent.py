@@ -1,5 +1,5 @@
 from google.adk.agents import Agent
-from biotech_agent.utils import create_mcp_toolset
+from biotech_agent.utils import BatchingMcpToolset, create_mcp_toolset
 
 # MCP URLs
 OPENGENES_MCP_URL = "https://opengenes-mcp-520634294170.us-central1.run.app/sse"
@@ -7,8 +7,8 @@ GENE_ONTOLOGY_MCP_URL = "https://gene-ontology-mcp-server-520634294170.us-centra
 
 def create_agent(model: str = "gemini-2.5-pro") -> Agent:
     tools = [
-        create_mcp_toolset(OPENGENES_MCP_URL),
-        create_mcp_toolset(GENE_ONTOLOGY_MCP_URL)
+        BatchingMcpToolset(create_mcp_toolset(OPENGENES_MCP_URL)),
+        BatchingMcpToolset(create_mcp_toolset(GENE_ONTOLOGY_MCP_URL))
     ]
     
     return Agent(
@@ -1,11 +1,11 @@
 from google.adk.agents import Agent
-from biotech_agent.utils import create_mcp_toolset
+from biotech_agent.utils import BatchingMcpToolset, create_mcp_toolset
 
 # OpenFDA MCP URL
 OPENFDA_MCP_URL = "https://openfda-mcp-server-520634294170.us-central1.run.app/sse"
 
 def create_agent(model: str = "gemini-2.5-pro") -> Agent:
-    tools = [create_mcp_toolset(OPENFDA_MCP_URL)]
+    tools = [BatchingMcpToolset(create_mcp_toolset(OPENFDA_MCP_URL))]
     
     return Agent(
         name="insight_synthesis_agent",
@@ -1,11 +1,11 @@
 from google.adk.agents import Agent
-from biotech_agent.utils import create_mcp_toolset
+from biotech_agent.utils import BatchingMcpToolset, create_mcp_toolset
 
 # OpenTargets MCP URL
 OPENTARGETS_MCP_URL = "https://opentargets-mcp-520634294170.us-central1.run.app/sse"
 
 def create_agent(model: str = "gemini-2.5-pro") -> Agent:
-    tools = [create_mcp_toolset(OPENTARGETS_MCP_URL)]
+    tools = [BatchingMcpToolset(create_mcp_toolset(OPENTARGETS_MCP_URL))]
     
     return Agent(
         name="normalization_agent",
@@ -1,63 +1,356 @@
+import asyncio
+import atexit
+import base64
+import contextlib
+import contextvars
+import functools
+import json
 import logging
 import os
-from typing import Optional, Dict
+import threading
+import time
+from typing import Any, List, Optional, Dict, Tuple, TYPE_CHECKING
 
-import google.auth
-import google.auth.transport.requests
-from google.oauth2 import id_token
-from google.adk.tools.mcp_tool.mcp_toolset import McpToolset
-from google.adk.tools.mcp_tool.mcp_session_manager import SseConnectionParams
-from google.adk.agents.readonly_context import ReadonlyContext
+# google.* and google.adk.* pull in ~100 transitive modules (protobuf, grpc,
+# httpx); importing them lazily inside the functions that need them keeps
+# `import biotech_agent.utils` to a few milliseconds.
+if TYPE_CHECKING:
+    from google.adk.agents.readonly_context import ReadonlyContext
+    from google.adk.tools.mcp_tool.mcp_toolset import McpToolset
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Library-style logging: no root-logger mutation at import time. The
+# application entrypoint owns handler configuration; the NullHandler keeps
+# unconfigured use silent instead of warning.
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Identity tokens cached per audience (token, exp epoch seconds). Tokens are
+# valid ~1 hour; fetching one costs a subprocess fork or an HTTP round-trip,
+# so agent bootstrap is auth-bound without this cache.
+_token_cache: Dict[str, Tuple[str, float]] = {}
+_token_cache_lock = threading.Lock()
+_token_fetch_locks: Dict[str, threading.Lock] = {}
+_TOKEN_REFRESH_MARGIN_S = 60.0
+
+
+def _token_audience(url: str) -> str:
+    """Two /sse URLs under the same Cloud Run service share one audience."""
+    return url.split('/sse')[0]
+
+
+def _token_expiry(token: str) -> float:
+    """Extract the exp claim from a JWT; assume ~55 minutes if undecodable."""
+    try:
+        payload_b64 = token.split('.')[1]
+        payload_b64 += '=' * (-len(payload_b64) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(payload_b64))
+        return float(payload['exp'])
+    except Exception:
+        return time.time() + 3300.0
+
 
 def get_auth_token(url: str) -> str:
-    """Generates OIDC token for the given URL."""
-    # Try gcloud first as it might have better user credentials than ADC in this env
+    """Returns a cached (or freshly generated) OIDC token for the given URL.
+
+    Tokens are cached per audience and reused until within one minute of
+    expiry; concurrent callers collapse onto a single fetch.
+    """
+    audience = _token_audience(url)
+    with _token_cache_lock:
+        entry = _token_cache.get(audience)
+        if entry is not None and entry[1] - time.time() > _TOKEN_REFRESH_MARGIN_S:
+            return entry[0]
+        fetch_lock = _token_fetch_locks.setdefault(audience, threading.Lock())
+
+    # Per-audience lock: concurrent callers for the same audience collapse
+    # onto one fetch while different audiences fetch in parallel.
+    with fetch_lock:
+        with _token_cache_lock:
+            entry = _token_cache.get(audience)
+            if entry is not None and entry[1] - time.time() > _TOKEN_REFRESH_MARGIN_S:
+                return entry[0]
+        token = _fetch_auth_token(url)
+        with _token_cache_lock:
+            _token_cache[audience] = (token, _token_expiry(token))
+        return token
+
+
+@functools.lru_cache(maxsize=1)
+def _auth_request():
+    """Shared google.auth transport Request; reusing it keeps one urllib3 pool."""
+    import google.auth.transport.requests
+    return google.auth.transport.requests.Request()
+
+
+def _fetch_auth_token(url: str) -> str:
+    """Generates OIDC token for the given URL.
+
+    In-process ADC (google.auth) is the primary path; the gcloud subprocess
+    is a fallback for local environments where ADC is not configured, since
+    forking the CLI costs hundreds of milliseconds per token.
+    """
+    import google.auth.exceptions
+    from google.oauth2 import id_token
+
+    # Cloud Run audience is the service URL (e.g. https://service-hash.run.app);
+    # our URLs look like https://.../sse, so use the root URL as audience.
+    audience = _token_audience(url)
+    try:
+        return id_token.fetch_id_token(_auth_request(), audience)
+    except (google.auth.exceptions.DefaultCredentialsError,
+            google.auth.exceptions.RefreshError) as e_adc:
+        logger.debug(f"ADC token fetch failed, falling back to gcloud: {e_adc}")
+
     try:
         import subprocess
-        # logger.info("Attempting to get token via gcloud...")
         token = subprocess.check_output(
             ["gcloud", "auth", "print-identity-token"], text=True
         ).strip()
         return token
-    except Exception as e_gcloud:
-        logger.debug(f"gcloud auth failed, falling back to google.auth: {e_gcloud}")
-
-    try:
-        auth_req = google.auth.transport.requests.Request()
-        # For Cloud Run, we usually use the target audience as the URL
-        # We might need to trim the URL to just the base URL if it has paths, but usually the full URL is fine or the service URL.
-        # Cloud Run audience is usually the service URL (e.g. https://service-hash.run.app)
-        # The URLs we have are like https://.../sse
-        # We should probably use the root URL as audience.
-        audience = url.split('/sse')[0]
-        token = id_token.fetch_id_token(auth_req, audience)
-        return token
     except Exception as e:
         logger.warning(f"Failed to generate ID token for {url}: {e}")
         raise e
 
-def create_mcp_toolset(url: str) -> McpToolset:
-    """Creates an McpToolset connected to the given SSE URL with OIDC auth."""
-    
-    token = get_auth_token(url)
-    def header_provider(_context: Optional[ReadonlyContext] = None) -> Dict[str, str]:
-        # Regenerate token if needed for fresh calls, though simple bearer might suffice if long-lived
-        # For now, just return the captured token to match connection or fetch new if expired logic logic was added
-        # But simply:
-        return {"Authorization": f"Bearer {token}"}
+# One toolset (and therefore one underlying SSE session) per MCP endpoint,
+# shared by every agent in the process instead of reconnecting per agent.
+_toolset_cache: Dict[str, "McpToolset"] = {}
+
+
+def _close_cached_toolsets() -> None:
+    """Best-effort close of the cached toolsets at interpreter exit."""
+    for toolset in _toolset_cache.values():
+        try:
+            asyncio.run(toolset.close())
+        except Exception:
+            pass
+    _toolset_cache.clear()
+
+
+atexit.register(_close_cached_toolsets)
+
+
+class TokenProvider:
+    """Header provider serving fresh bearer tokens for one MCP endpoint.
+
+    Consults the audience-keyed token cache on every call, so outbound
+    requests keep a valid token past the one-hour lifetime instead of
+    pinning whichever token was current at toolset construction.
+    """
+
+    __slots__ = ("_url",)
+
+    def __init__(self, url: str):
+        self._url = url
+
+    def __call__(self, _context: Optional["ReadonlyContext"] = None) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {get_auth_token(self._url)}"}
+
+
+def create_mcp_toolset(url: str) -> "McpToolset":
+    """Creates (or returns the cached) McpToolset for the given SSE URL with OIDC auth.
+
+    Toolsets are cached per URL so all agents share one SSE session per MCP
+    endpoint rather than paying a TLS+SSE handshake per tool call path.
+    The header provider is the single source of the Authorization header;
+    static headers on the connection params would duplicate it and go stale.
+    """
+    cached = _toolset_cache.get(url)
+    if cached is not None:
+        return cached
+
+    from google.adk.tools.mcp_tool.mcp_session_manager import SseConnectionParams
+    from google.adk.tools.mcp_tool.mcp_toolset import McpToolset
 
     connection_params = SseConnectionParams(
         url=url,
-        headers={"Authorization": f"Bearer {token}"},
-        timeout=30.0, 
+        timeout=30.0,
         sse_read_timeout=300.0
     )
-    
-    return McpToolset(
+
+    toolset = McpToolset(
         connection_params=connection_params,
-        header_provider=header_provider
+        header_provider=TokenProvider(url)
     )
+    _toolset_cache[url] = toolset
+    return toolset
+
+
+async def create_mcp_toolset_async(url: str) -> "McpToolset":
+    """Async variant of create_mcp_toolset.
+
+    The (potentially blocking) token acquisition runs in a worker thread so
+    callers can fire several endpoint setups concurrently.
+    """
+    cached = _toolset_cache.get(url)
+    if cached is not None:
+        return cached
+    # Warm the audience-keyed token cache off the event loop; the sync
+    # constructor then reuses the cached token.
+    await asyncio.to_thread(get_auth_token, url)
+    return create_mcp_toolset(url)
+
+
+async def create_mcp_toolsets(urls: List[str]) -> List["McpToolset"]:
+    """Build toolsets for several MCP endpoints concurrently.
+
+    Token fetches for distinct audiences overlap, so wall time is one
+    round-trip instead of one per endpoint; repeated URLs collapse onto the
+    per-URL toolset cache.
+    """
+    return list(await asyncio.gather(*(create_mcp_toolset_async(u) for u in urls)))
+
+
+class RequestCache:
+    """Single-flights identical MCP tool calls within one agent turn.
+
+    Keys are (tool name, serialized args); the first caller registers the
+    future that resolves with the tool result and later identical calls in
+    the same turn await it instead of re-issuing the request. In a loop
+    agent with several iterations the savings compound.
+    """
+
+    def __init__(self):
+        self.futures: Dict[tuple, asyncio.Future] = {}
+
+
+# Active per-turn cache; None outside a request_cache_scope.
+_request_cache: contextvars.ContextVar[Optional[RequestCache]] = contextvars.ContextVar(
+    "biotech_request_cache", default=None
+)
+
+
+@contextlib.contextmanager
+def request_cache_scope():
+    """Activate a fresh RequestCache for the duration of one agent turn.
+
+    Wrap each top-level agent query with this scope; BatchingMcpToolset
+    consults the active cache to deduplicate identical tool calls issued by
+    different subagents during the turn.
+    """
+    token = _request_cache.set(RequestCache())
+    try:
+        yield
+    finally:
+        _request_cache.reset(token)
+
+
+class _BatchState:
+    """Per-event-loop pending calls and the task that drains them."""
+
+    def __init__(self):
+        self.pending: List[tuple] = []
+        self.drain_task: Optional[asyncio.Task] = None
+
+
+# Built on first access (see module __getattr__): the class must subclass
+# ADK's BaseToolset so it passes LlmAgent's pydantic tool validation and is
+# dispatched through get_tools_with_prefix(), but importing BaseToolset at
+# module top would defeat the lazy google imports above.
+_batching_toolset_cls: Optional[type] = None
+
+
+def _get_batching_toolset_cls() -> type:
+    global _batching_toolset_cls
+    if _batching_toolset_cls is not None:
+        return _batching_toolset_cls
+
+    from google.adk.tools.base_toolset import BaseToolset
+
+    class BatchingMcpToolset(BaseToolset):
+        """Coalesces MCP tool calls issued within one agent turn.
+
+        Wraps the toolset returned by create_mcp_toolset. Tool invocations
+        that land on the event loop before control is yielded back (i.e.
+        several tool calls from the same LLM turn) are collected and
+        dispatched together with asyncio.gather over the shared session, so
+        an N-gene analysis is bounded by the slowest single MCP call instead
+        of N round trips.
+
+        Subclassing BaseToolset means ADK's own get_tools_with_prefix()
+        dispatch lands on this class's get_tools override, where the returned
+        tools are routed through the batch queue.
+        """
+
+        def __init__(self, toolset):
+            super().__init__()
+            self._toolset = toolset
+            self._states: Dict[Any, _BatchState] = {}
+
+        async def get_tools(self, readonly_context=None):
+            tools = await self._toolset.get_tools(readonly_context)
+            for tool in tools:
+                self._wrap_tool(tool)
+            return tools
+
+        async def process_llm_request(self, **kwargs) -> None:
+            return await self._toolset.process_llm_request(**kwargs)
+
+        async def close(self) -> None:
+            await self._toolset.close()
+
+        def _wrap_tool(self, tool) -> None:
+            """Route the tool's run_async through the per-loop batch queue."""
+            original_run_async = tool.run_async
+
+            tool_name = getattr(tool, "name", type(tool).__name__)
+
+            @functools.wraps(original_run_async)
+            async def batched_run_async(**kwargs):
+                return await self._submit(tool_name, original_run_async, kwargs)
+
+            tool.run_async = batched_run_async
+
+        @staticmethod
+        def _cache_key(tool_name: str, kwargs) -> tuple:
+            return (tool_name, json.dumps(kwargs.get("args"), sort_keys=True, default=str))
+
+        async def _submit(self, tool_name, call, kwargs):
+            loop = asyncio.get_running_loop()
+
+            # Within an active request_cache_scope, identical (tool, args)
+            # calls share one future for the whole turn.
+            cache = _request_cache.get()
+            cache_key = None
+            if cache is not None:
+                cache_key = self._cache_key(tool_name, kwargs)
+                existing = cache.futures.get(cache_key)
+                if existing is not None:
+                    return await asyncio.shield(existing)
+
+            state = self._states.get(loop)
+            if state is None:
+                state = self._states[loop] = _BatchState()
+            future = loop.create_future()
+            if cache is not None:
+                cache.futures[cache_key] = future
+            state.pending.append((call, kwargs, future))
+            if state.drain_task is None or state.drain_task.done():
+                state.drain_task = loop.create_task(self._drain(state))
+            return await future
+
+        async def _drain(self, state: _BatchState) -> None:
+            # Yield once so every call queued in this turn is collected,
+            # then fan the batch out concurrently.
+            while state.pending:
+                await asyncio.sleep(0)
+                pending, state.pending = state.pending, []
+                results = await asyncio.gather(
+                    *(call(**kwargs) for call, kwargs, _ in pending),
+                    return_exceptions=True,
+                )
+                for (_, _, future), result in zip(pending, results):
+                    if future.cancelled():
+                        continue
+                    if isinstance(result, BaseException):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(result)
+
+    _batching_toolset_cls = BatchingMcpToolset
+    return _batching_toolset_cls
+
+
+def __getattr__(name: str):
+    if name == "BatchingMcpToolset":
+        return _get_batching_toolset_cls()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,16 +2,26 @@
 """OpenGenes MCP Server - Database query interface for OpenGenes aging research data."""
 
 import asyncio
+import functools
+import re
 import sqlite3
 import os
+import queue
+from collections import OrderedDict
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from contextlib import asynccontextmanager
 import sys
 import tempfile
 
+import orjson
 import typer
 from fastmcp import FastMCP
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
 from pydantic import BaseModel, Field
 from eliot import start_action
 from huggingface_hub import hf_hub_download
@@ -29,6 +39,22 @@ HF_SUBFOLDER = "opengenes"
 # Get the database path using Hugging Face Hub
 def get_database_path() -> Path:
     """Get the path to the database file from Hugging Face Hub."""
+    # Cache-first fast path: when the snapshot is already in the local HF
+    # cache (honouring HUGGINGFACE_HUB_CACHE), skip the network HEAD request
+    # that hf_hub_download otherwise issues on every process start.
+    try:
+        db_path = hf_hub_download(
+            repo_id=HF_REPO_ID,
+            filename="open_genes.sqlite",
+            subfolder=HF_SUBFOLDER,
+            repo_type="dataset",
+            cache_dir=os.environ.get("HUGGINGFACE_HUB_CACHE"),
+            local_files_only=True
+        )
+        return Path(db_path)
+    except Exception:
+        pass
+
     try:
         # Download the database from Hugging Face Hub
         db_path = hf_hub_download(
@@ -52,8 +78,28 @@ def get_database_path() -> Path:
             else:
                 raise FileNotFoundError(f"Could not find database file. Hugging Face error: {e}")
 
+@functools.lru_cache(maxsize=1)
 def get_prompt_content() -> str:
-    """Get the content of the prompt.txt file from Hugging Face Hub."""
+    """Get the content of the prompt.txt file from Hugging Face Hub.
+
+    Cached for the process lifetime: the prompt is invariant per release and
+    fetching it costs at least a cache lookup, at worst a network round-trip.
+    """
+    # Cache-first fast path, same rationale as get_database_path.
+    try:
+        prompt_path = hf_hub_download(
+            repo_id=HF_REPO_ID,
+            filename="prompt.txt",
+            subfolder=HF_SUBFOLDER,
+            repo_type="dataset",
+            cache_dir=os.environ.get("HUGGINGFACE_HUB_CACHE"),
+            local_files_only=True
+        )
+        with open(prompt_path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except Exception:
+        pass
+
     try:
         # Download the prompt file from Hugging Face Hub
         prompt_path = hf_hub_download(
@@ -80,7 +126,17 @@ def get_prompt_content() -> str:
                 print(f"Warning: Could not load prompt file from Hugging Face or local sources. Error: {e}")
                 return ""
 
-DB_PATH = get_database_path()
+# Resolved lazily: resolving the path may hit the HF Hub (seconds of cold
+# start) and must not run at import time.
+_DB_PATH: Optional[Path] = None
+
+
+def resolve_db_path() -> Path:
+    """Memoised accessor for the database path; defers the HF Hub lookup."""
+    global _DB_PATH
+    if _DB_PATH is None:
+        _DB_PATH = get_database_path()
+    return _DB_PATH
 
 # Configuration
 DEFAULT_HOST = os.getenv("MCP_HOST", "0.0.0.0")
@@ -93,257 +149,43 @@ class QueryResult(BaseModel):
     count: int = Field(description="Number of rows returned")
     query: str = Field(description="The SQL query that was executed")
 
-class DatabaseManager:
-    """Manages SQLite database connections and queries."""
-    
-    def __init__(self, db_path: Path):
-        self.db_path = db_path
-        if not self.db_path.exists():
-            raise FileNotFoundError(f"Database not found at {self.db_path}")
-    
-    def execute_query(self, sql: str, params: Optional[tuple] = None) -> QueryResult:
-        """Execute a read-only SQL query and return results."""
-        with start_action(action_type="execute_query", sql=sql, params=params) as action:
-            # Execute query using read-only connection - SQLite will enforce read-only at database level
-            # Using URI format with mode=ro for true read-only access
-            readonly_uri = f"file:{self.db_path}?mode=ro"
-            
-            try:
-                with sqlite3.connect(readonly_uri, uri=True) as conn:
-                    conn.row_factory = sqlite3.Row  # This allows dict-like access to rows
-                    cursor = conn.cursor()
-                    
-                    if params:
-                        cursor.execute(sql, params)
-                    else:
-                        cursor.execute(sql)
-                    
-                    rows = cursor.fetchall()
-                    # Convert sqlite3.Row objects to dictionaries
-                    rows_dicts = [dict(row) for row in rows]
-                    
-                    result = QueryResult(
-                        rows=rows_dicts,
-                        count=len(rows_dicts),
-                        query=sql
-                    )
-                    
-                    action.add_success_fields(rows_count=len(rows_dicts))
-                    return result
-            except sqlite3.OperationalError as e:
-                if "readonly database" in str(e).lower():
-                    error_msg = f"Write operation attempted on read-only database. Rejected query: {sql}"
-                    action.log(message_type="query_rejected", error=error_msg, rejected_query=sql)
-                    raise ValueError(error_msg) from e
-                else:
-                    # Re-raise other operational errors
-                    raise
-
-class OpenGenesMCP(FastMCP):
-    """OpenGenes MCP Server with database tools that can be inherited and extended."""
-    
-    def __init__(
-        self, 
-        name: str = "OpenGenes MCP Server",
-        db_path: Path = DB_PATH,
-        prefix: str = "opengenes_",
-        huge_query_tool: bool = False,
-        **kwargs
-    ):
-        """Initialize the OpenGenes tools with a database manager and FastMCP functionality."""
-        # Initialize FastMCP with the provided name and any additional kwargs
-        super().__init__(name=name, **kwargs)
-        
-        # Initialize our database manager
-        self.db_manager = DatabaseManager(db_path)
-        
-        self.prefix = prefix
-        self.huge_query_tool = huge_query_tool
-        # Register our tools and resources
-        self._register_opengenes_tools()
-        self._register_opengenes_resources()
-    
-    def _register_opengenes_tools(self):
-        """Register OpenGenes-specific tools."""
-        self.tool(name=f"{self.prefix}get_schema_info", description="Get information about the database schema")(self.get_schema_info)
-        self.tool(name=f"{self.prefix}example_queries", description="Get a list of example SQL queries")(self.get_example_queries)
-        description = "Query the Opengenes database that contains data about genes involved in longevity, lifespan extension experiments on model organisms, and changes in human and other organisms with aging."
-        if self.huge_query_tool:
-            # Load and concatenate the prompt from package data
-            prompt_content = get_prompt_content().strip()
-            if prompt_content:
-                description = description + "\n\n" + prompt_content
-            self.tool(name=f"{self.prefix}db_query", description=description)(self.db_query)
-        else:
-            description = description + " Before caling this tool the first time, always check tools that provide schema information and example queries."
-            self.tool(name=f"{self.prefix}db_query", description=description)(self.db_query)
-
-    
-    def _register_opengenes_resources(self):
-        """Register OpenGenes-specific resources."""
-        
-        @self.resource(f"resource://{self.prefix}db-prompt")
-        def get_db_prompt() -> str:
-            """
-            Get the database prompt that describes the OpenGenes database schema and usage guidelines.
-            
-            This resource contains detailed information about:
-            - Database tables and their schemas
-            - Column enumerations and valid values
-            - Usage guidelines for querying the database
-            - Examples of common queries
-            
-            Returns:
-                The complete database prompt text
-            """
-            with start_action(action_type="get_db_prompt") as action:
-                try:
-                    content = get_prompt_content()
-                    if content:
-                        action.add_success_fields(file_exists=True, content_length=len(content))
-                        return content
-                    else:
-                        action.add_error_fields(file_exists=False, error="Prompt file not found")
-                        return "Database prompt file not found."
-                except Exception as e:
-                    action.add_error_fields(error=str(e), error_type="file_read_error")
-                    return f"Error reading prompt file: {e}"
-        
-        @self.resource(f"resource://{self.prefix}schema-summary")
-        def get_schema_summary() -> str:
-            """
-            Get a summary of the OpenGenes database schema.
-            
-            Returns:
-                A formatted summary of tables and their purposes
-            """
-            summary = """OpenGenes Database Schema Summary
+    def model_dump_json(self, **kwargs) -> str:
+        # The MCP response path is dominated by JSON-encoding rows; orjson is
+        # 2-4x faster than pydantic's default encoder on nested dict lists.
+        # Defer to pydantic when caller-specific options are requested.
+        if kwargs:
+            return super().model_dump_json(**kwargs)
+        return orjson.dumps(self.model_dump()).decode()
 
-1. lifespan_change
-   - Contains experimental data about genetic interventions and their effects on lifespan
-   - Key columns: HGNC (gene symbol), model_organism, sex, effect_on_lifespan
-   - Includes intervention details, lifespan measurements, significance data
-   - Contains data from various model organisms (mouse, C. elegans, fly, etc.)
+class ColumnarQueryResult(BaseModel):
+    """Query result in columnar (struct-of-arrays) form.
 
-2. gene_criteria  
-   - Contains criteria classifications for aging-related genes
-   - Key columns: HGNC (gene symbol), criteria
-   - 12 different aging-related criteria categories
-   - Links genes to specific aging research criteria
+    One list per column instead of one ~232-byte dict per row; for wide or
+    long results this cuts container overhead roughly 3x and serialises
+    faster. Row dicts are only materialised at the boundary that needs them.
+    """
+    columns: Dict[str, List[Any]] = Field(description="Column name mapped to its list of values")
+    count: int = Field(description="Number of rows returned")
+    query: str = Field(description="The SQL query that was executed")
 
-3. gene_hallmarks
-   - Contains hallmarks of aging associated with specific genes  
-   - Key columns: HGNC (gene symbol), hallmarks of aging
-   - Maps genes to biological hallmarks of aging process
-   - Includes various aging-related cellular and molecular processes
+    def to_rows(self) -> List[Dict[str, Any]]:
+        """Materialise row dicts from the columnar form."""
+        if not self.count:
+            return []
+        names = list(self.columns)
+        return [dict(zip(names, values)) for values in zip(*self.columns.values())]
 
-4. longevity_associations
-   - Contains genetic variants associated with longevity
-   - Key columns: HGNC (gene symbol), polymorphism details, ethnicity, study type
-   - Population genetics data from longevity studies
-   - Includes SNPs, indels, and other genetic variations
+class JsonQueryResult(BaseModel):
+    """Result from a database query, with rows pre-serialised by SQLite."""
+    rows_json: str = Field(description="Query result rows as a JSON array string")
+    count: int = Field(description="Number of rows returned")
+    query: str = Field(description="The SQL query that was executed")
 
-All tables are linked by HGNC gene symbols, allowing for comprehensive cross-table queries about aging-related genes."""
-            
-            return summary
-    
-    def db_query(self, sql: str) -> QueryResult:
-        """
-        Execute a read-only SQL query against the OpenGenes database.
-        
-        SECURITY: This tool uses SQLite's built-in read-only mode to enforce data protection.
-        The database connection is opened in read-only mode, preventing any write operations
-        at the database level. Any attempt to modify data will be automatically rejected by SQLite.
-        
-        The OpenGenes database contains aging and lifespan research data across 4 tables:
-        - lifespan_change: Experimental data on gene modifications and lifespan effects
-        - gene_criteria: Aging-related criteria classifications for genes  
-        - gene_hallmarks: Links genes to hallmarks of aging (multi-value field)
-        - longevity_associations: Population genetics data on gene variants and longevity
-        
-        All tables are linked by HGNC gene symbols for cross-table analysis.
-        
-        CRITICAL REMINDERS:
-        - Use LIKE queries with wildcards for multi-value fields (gene_hallmarks."hallmarks of aging", 
-          lifespan_change.intervention_improves, lifespan_change.intervention_deteriorates)
-        - Order lifespan results by magnitude: DESC for increases, ASC for decreases
-        - IMPORTANT: When user asks about "lifespan effects" without specifying mean vs max, 
-          show both lifespan_percent_change_mean AND lifespan_percent_change_max
-        - Use COALESCE(lifespan_percent_change_mean, lifespan_percent_change_max) for ordering both metrics
-        - COMPREHENSIVE AGING EVIDENCE: When users ask about "evidence of aging", "link to aging/longevity", 
-          or "aging associations" for a gene, query ALL 4 tables (gene_criteria, gene_hallmarks, 
-          lifespan_change, longevity_associations) for complete scientific evidence
-        
-        For detailed schema information, use get_schema_info().
-        For query examples and patterns, use get_example_queries().
-        
-        Args:
-            sql: The SQL query to execute (database enforces read-only access)
-            
-        Returns:
-            QueryResult: Contains the query results, row count, and executed query
-        """
-        with start_action(action_type="db_query_tool", sql=sql) as action:
-            result = self.db_manager.execute_query(sql)
-            return result
 
-    def get_schema_info(self) -> Dict[str, Any]:
-        """
-        Get comprehensive information about the OpenGenes database schema including table structures, 
-        column descriptions, enumerations, and critical query guidelines.
-        
-        Returns:
-            Dict containing detailed table schemas, column information, query guidelines, and available enumerations
-        """
-        with start_action(action_type="get_schema_info") as action:
-            # Get table information
-            tables_query = "SELECT name FROM sqlite_master WHERE type='table'"
-            tables_result = self.db_manager.execute_query(tables_query)
-            table_names = [row['name'] for row in tables_result.rows]
-            
-            action.add_success_fields(tables_found=len(table_names), table_names=table_names)
-            
-            schema_info = {
-                "database_overview": {
-                    "description": "OpenGenes database contains aging and lifespan research data with 4 main tables linked by HGNC gene symbols",
-                    "total_tables": len(table_names),
-                    "primary_key": "HGNC (gene symbol) - links all tables together"
-                },
-                "critical_query_guidelines": {
-                    "multi_value_fields": {
-                        "description": "Some columns contain comma-separated values. ALWAYS use LIKE queries with wildcards for these fields.",
-                        "fields": [
-                            "gene_hallmarks.'hallmarks of aging' - contains multiple aging hallmarks per gene",
-                            "lifespan_change.intervention_deteriorates - multiple biological processes that deteriorate",
-                            "lifespan_change.intervention_improves - multiple biological processes that improve"
-                        ],
-                        "example_syntax": "WHERE \"hallmarks of aging\" LIKE '%stem cell exhaustion%'"
-                    },
-                    "lifespan_metrics": {
-                        "description": "Database contains both mean and maximum lifespan change metrics. When user asks about lifespan effects without specifying, show both.",
-                        "mean_vs_max": "lifespan_percent_change_mean shows average effect, lifespan_percent_change_max shows maximum observed effect",
-                        "when_to_show_both": "If user asks about 'lifespan effects' or 'lifespan changes' without specifying mean vs max, include both metrics",
-                        "ordering_both": "Use COALESCE(lifespan_percent_change_mean, lifespan_percent_change_max) for ordering when showing both",
-                        "significance": "Both mean and max have corresponding significance columns (significance_mean, significance_max)"
-                    },
-                    "result_ordering": {
-                        "lifespan_extension": "ORDER BY lifespan_percent_change_mean DESC (highest increase first)",
-                        "lifespan_reduction": "ORDER BY lifespan_percent_change_mean ASC (largest decrease first)",
-                        "importance": "Always order lifespan results by magnitude of effect for relevance",
-                        "both_metrics": "When showing both mean and max, use COALESCE for ordering or show comparison"
-                    },
-                    "comprehensive_aging_evidence": {
-                        "description": "For questions about aging evidence, link to aging, or longevity associations for a gene, query ALL 4 tables for complete evidence",
-                        "required_tables": "1) gene_criteria (aging-related criteria), 2) gene_hallmarks (aging pathways), 3) lifespan_change (experimental effects), 4) longevity_associations (human population studies)",
-                        "example_patterns": "Evidence of X and aging, Link between X and aging, X gene aging associations, What evidence links X to aging",
-                        "critical_note": "Do NOT omit longevity_associations table - it contains crucial human population genetics data"
-                    },
-                    "gene_queries": "Use HGNC column for gene symbols (TP53, FOXO3, etc.)",
-                    "safety": "Only SELECT queries allowed - no INSERT, UPDATE, DELETE, or DDL operations"
-                },
-                "tables": {},
-                "enumerations": {},
-                "biological_processes_tags": [
+# Static schema documentation served by get_schema_info; hoisted to module
+# scope (shared across calls and instances) instead of being rebuilt per
+# invocation.
+_BIOLOGICAL_PROCESSES_TAGS = tuple([
                     "cardiovascular system", "nervous system", "immune function", "muscle, bone, skin, liver",
                     "renal function, reproductive function", "cognitive function, eyesight, hair/coat",
                     "body composition", "glucose metabolism, lipid metabolism, cholesterol metabolism",
@@ -353,8 +195,9 @@ All tables are linked by HGNC gene symbols, allowing for comprehensive cross-tab
                     "blood, proteostasis, angiogenesis, metabolism", "endocrine system, intercellular matrix",
                     "building and protection of telomeres", "cytoskeleton organization, nucleus structure",
                     "skin and the intestine epithelial barriers function", "calcium homeostasis, proteolysis"
-                ],
-                "aging_hallmarks_tags": [
+                ])
+
+_AGING_HALLMARKS_TAGS = tuple([
                     "nuclear DNA instability", "telomere attrition", "alterations in histone modifications",
                     "chromatin remodeling", "transcriptional alterations", "alterations in DNA methylation",
                     "degradation of proteolytic systems", "TOR pathway dysregulation", "INS/IGF-1 pathway dysregulation",
@@ -363,11 +206,9 @@ All tables are linked by HGNC gene symbols, allowing for comprehensive cross-tab
                     "stem cell exhaustion", "sterile inflammation", "intercellular communication impairment",
                     "changes in the extracellular matrix structure", "impairment of proteins folding and stability",
                     "nuclear architecture impairment", "disabled macroautophagy"
-                ]
-            }
-            
-            # Get detailed column information for each table with descriptions
-            table_descriptions = {
+                ])
+
+_TABLE_DESCRIPTIONS = {
                 "lifespan_change": {
                     "purpose": "Experimental data on how gene modifications affect lifespan in various model organisms",
                     "key_columns": "HGNC, model_organism, effect_on_lifespan, intervention methods, lifespan measurements",
@@ -399,15 +240,9 @@ All tables are linked by HGNC gene symbols, allowing for comprehensive cross-tab
                     "critical_note": "Do not just query experimental tables (lifespan_change) - include population genetics data (longevity_associations) for complete evidence"
                 }
             }
-            
-            for table_name in table_names:
-                pragma_query = f"PRAGMA table_info({table_name})"
-                columns_result = self.db_manager.execute_query(pragma_query)
-                
-                # Add detailed column descriptions for lifespan_change table
-                column_descriptions = {}
-                if table_name == "lifespan_change":
-                    column_descriptions = {
+
+_COLUMN_DESCRIPTIONS = {
+    "lifespan_change": {
                         "HGNC": "Gene symbol (standard gene names like TP53, FOXO3)",
                         "model_organism": "Organism used for experiment (mouse, C. elegans, fly, etc.)",
                         "sex": "Sex of organism used (male, female, all, hermaphrodites, etc.)",
@@ -423,19 +258,16 @@ All tables are linked by HGNC gene symbols, allowing for comprehensive cross-tab
                         "significance_max": "Statistical significance of maximum lifespan change (1=significant, 0=not significant)",
                         "control_lifespan_mean": "Mean lifespan of control group",
                         "experiment_lifespan_mean": "Mean lifespan of experimental group"
-                    }
-                elif table_name == "gene_hallmarks":
-                    column_descriptions = {
+                    },
+    "gene_hallmarks": {
                         "HGNC": "Gene symbol (standard gene names like TP53, FOXO3)",
                         "hallmarks of aging": "MULTI-VALUE: Comma-separated aging hallmarks (ALWAYS use LIKE queries with wildcards)"
-                    }
-                elif table_name == "gene_criteria":
-                    column_descriptions = {
+                    },
+    "gene_criteria": {
                         "HGNC": "Gene symbol (standard gene names like TP53, FOXO3)",
                         "criteria": "Aging-related criteria the gene meets (12 different categories)"
-                    }
-                elif table_name == "longevity_associations":
-                    column_descriptions = {
+                    },
+    "longevity_associations": {
                         "HGNC": "Gene symbol (standard gene names like TP53, FOXO3)",
                         "polymorphism type": "Type of genetic variant (SNP, In/Del, VNTR, etc.)",
                         "polymorphism id": "Identifier for the genetic variant (e.g., rs numbers for SNPs)",
@@ -447,42 +279,12 @@ All tables are linked by HGNC gene symbols, allowing for comprehensive cross-tab
                         "sex": "Sex of study participants",
                         "doi": "DOI of the research publication",
                         "pmid": "PubMed ID of the research publication"
-                    }
-                
-                schema_info["tables"][table_name] = {
-                    "description": table_descriptions.get(table_name, {}),
-                    "columns": [
-                        {
-                            "name": col["name"],
-                            "type": col["type"],
-                            "nullable": not col["notnull"],
-                            "primary_key": bool(col["pk"]),
-                            "description": column_descriptions.get(col["name"], "")
-                        }
-                        for col in columns_result.rows
-                    ]
-                }
-            
-            # Add comprehensive enumerations
-            schema_info["enumerations"] = self._get_known_enumerations()
-            
-            action.add_success_fields(schema_retrieved=True, total_tables=len(table_names))
-            return schema_info
+                    },
+}
 
-    def get_example_queries(self) -> List[Dict[str, str]]:
-        """
-        Get comprehensive example SQL queries with patterns and best practices for the OpenGenes database.
-        
-        Includes examples for:
-        - Multi-value field queries (LIKE with wildcards)
-        - Proper result ordering by effect magnitude
-        - Cross-table joins and analysis
-        - Common research questions and patterns
-        
-        Returns:
-            List of dictionaries containing example queries with descriptions and categories
-        """
-        examples = [
+# Example queries and field enumerations are pure data; build them once at
+# import instead of re-allocating hundreds of dicts/strings per call.
+_EXAMPLE_QUERIES = tuple([
             # Basic gene and lifespan queries with proper ordering
             {
                 "category": "Lifespan Effects - Ordered by Magnitude",
@@ -499,8 +301,8 @@ All tables are linked by HGNC gene symbols, allowing for comprehensive cross-tab
             {
                 "category": "Lifespan Effects - Mean vs Maximum",
                 "description": "Show both mean and maximum lifespan changes when user asks about lifespan effects",
-                "query": "SELECT HGNC, model_organism, effect_on_lifespan, lifespan_percent_change_mean, lifespan_percent_change_max, significance_mean, significance_max FROM lifespan_change WHERE effect_on_lifespan = 'increases lifespan' AND (lifespan_percent_change_mean IS NOT NULL OR lifespan_percent_change_max IS NOT NULL) ORDER BY COALESCE(lifespan_percent_change_mean, lifespan_percent_change_max) DESC",
-                "key_concept": "IMPORTANT: When user asks about lifespan effects without specifying mean vs max, show both metrics. Researchers may be interested in either average effects or maximum potential. Use LIMIT only when user specifically asks for 'top N' or similar"
+                "query": "SELECT HGNC, model_organism, effect_on_lifespan, lifespan_percent_change_mean, lifespan_percent_change_max, significance_mean, significance_max FROM idx.lifespan_change WHERE effect_on_lifespan = 'increases lifespan' AND lifespan_percent_change_best IS NOT NULL ORDER BY lifespan_percent_change_best DESC",
+                "key_concept": "IMPORTANT: When user asks about lifespan effects without specifying mean vs max, show both metrics. The sidecar's generated lifespan_percent_change_best column (COALESCE of mean and max) is indexed, so this ordering is an index scan. Use LIMIT only when user specifically asks for 'top N' or similar"
             },
             {
                 "category": "Lifespan Effects - Mean vs Maximum",
@@ -511,36 +313,42 @@ All tables are linked by HGNC gene symbols, allowing for comprehensive cross-tab
             
             # Multi-value field queries (CRITICAL pattern)
             {
-                "category": "Multi-Value Fields - LIKE Queries",
+                "category": "Multi-Value Fields - Normalized Child Table",
+                "description": "Fast hallmark membership via the pre-normalized sidecar table",
+                "query": "SELECT HGNC FROM idx.gene_hallmark WHERE hallmark = 'stem cell exhaustion'",
+                "key_concept": "The attached sidecar explodes the comma-separated hallmarks into idx.gene_hallmark(HGNC, hallmark) with an index on hallmark, so equality hits the B-tree directly instead of scanning substrings"
+            },
+            {
+                "category": "Multi-Value Fields - LIKE Queries",
                 "description": "Find genes associated with stem cell exhaustion hallmark",
-                "query": "SELECT HGNC, \"hallmarks of aging\" FROM gene_hallmarks WHERE \"hallmarks of aging\" LIKE '%stem cell exhaustion%'",
-                "key_concept": "CRITICAL: Always use LIKE with wildcards for multi-value fields"
+                "query": "SELECT HGNC, \"hallmarks of aging\" FROM gene_hallmarks WHERE instr(\"hallmarks of aging\", 'stem cell exhaustion') > 0",
+                "key_concept": "CRITICAL: Multi-value fields need substring matching; instr(col, needle) > 0 is the fast equivalent of a %needle% LIKE (single scan, no wildcard state machine)"
             },
             {
                 "category": "Multi-Value Fields - LIKE Queries",
                 "description": "Find interventions that improve cardiovascular system",
-                "query": "SELECT HGNC, intervention_improves, effect_on_lifespan, lifespan_percent_change_mean FROM lifespan_change WHERE intervention_improves LIKE '%cardiovascular system%' ORDER BY lifespan_percent_change_mean DESC",
-                "key_concept": "Use LIKE queries for intervention_improves and intervention_deteriorates columns"
+                "query": "SELECT HGNC, intervention_improves, effect_on_lifespan, lifespan_percent_change_mean FROM lifespan_change WHERE instr(intervention_improves, 'cardiovascular system') > 0 ORDER BY lifespan_percent_change_mean DESC",
+                "key_concept": "Use instr() substring tests for intervention_improves and intervention_deteriorates columns"
             },
             {
                 "category": "Multi-Value Fields - LIKE Queries",
                 "description": "Find genes affecting mitochondrial function",
-                "query": "SELECT HGNC, \"hallmarks of aging\" FROM gene_hallmarks WHERE \"hallmarks of aging\" LIKE '%mitochondrial%'",
-                "key_concept": "Multi-value hallmarks field requires LIKE pattern matching"
+                "query": "SELECT HGNC, \"hallmarks of aging\" FROM gene_hallmarks WHERE instr(\"hallmarks of aging\", 'mitochondrial') > 0",
+                "key_concept": "Multi-value hallmarks field requires substring matching; instr() avoids LIKE wildcard overhead"
             },
             
             # Cross-table analysis
             {
                 "category": "Cross-Table Analysis",
                 "description": "Genes with both experimental lifespan effects and population longevity associations",
-                "query": "SELECT DISTINCT lc.HGNC, lc.effect_on_lifespan, lc.model_organism, la.ethnicity, la.\"study type\" FROM lifespan_change lc INNER JOIN longevity_associations la ON lc.HGNC = la.HGNC WHERE lc.effect_on_lifespan = 'increases lifespan'",
-                "key_concept": "Join tables using HGNC to combine experimental and population data"
+                "query": "SELECT lc.HGNC, lc.effect_on_lifespan, lc.model_organism FROM lifespan_change lc WHERE lc.effect_on_lifespan = 'increases lifespan' AND EXISTS (SELECT 1 FROM longevity_associations la WHERE la.HGNC = lc.HGNC)",
+                "key_concept": "EXISTS expresses the 'appears in both tables' intent as a semi-join: no DISTINCT sort over joined rows, and each outer row short-circuits on the first HGNC match (an indexed point lookup via the sidecar). Join longevity_associations explicitly only when its columns are needed"
             },
             {
                 "category": "Cross-Table Analysis - CRITICAL PATTERN",
-                "description": "COMPREHENSIVE AGING EVIDENCE: For questions asking about 'evidence of gene X and aging', ALWAYS query ALL 4 tables",
-                "query": "SELECT criteria FROM gene_criteria WHERE HGNC = 'PTEN'",
-                "key_concept": "CRITICAL: For comprehensive aging evidence questions (like 'What evidence of the link between X and aging'), you MUST query ALL 4 tables: 1) gene_criteria 2) gene_hallmarks 3) lifespan_change 4) longevity_associations. The longevity_associations table contains crucial human population study data that must be included."
+                "description": "COMPREHENSIVE AGING EVIDENCE: one keyed lookup covering ALL 4 tables",
+                "query": "SELECT * FROM idx.gene_aging_evidence WHERE HGNC = 'PTEN'",
+                "key_concept": "CRITICAL: For comprehensive aging evidence questions (like 'What evidence of the link between X and aging'), the sidecar's gene_aging_evidence roll-up returns criteria, hallmarks, lifespan experiments and longevity_associations (crucial human population data) as JSON in a single indexed lookup instead of four separate queries; query the individual tables only when column-level detail is needed."
             },
             {
                 "category": "Cross-Table Analysis - HUMAN POPULATION DATA",
@@ -559,14 +367,14 @@ All tables are linked by HGNC gene symbols, allowing for comprehensive cross-tab
             {
                 "category": "Model Organism Studies",
                 "description": "Compare gene effects across mammals vs non-mammals",
-                "query": "SELECT HGNC, model_organism, effect_on_lifespan, lifespan_percent_change_mean FROM lifespan_change WHERE HGNC IN (SELECT HGNC FROM lifespan_change WHERE model_organism IN ('mouse', 'rat', 'rabbit', 'hamster')) AND HGNC IN (SELECT HGNC FROM lifespan_change WHERE model_organism IN ('roundworm Caenorhabditis elegans', 'fly Drosophila melanogaster', 'yeasts')) ORDER BY HGNC, model_organism",
-                "key_concept": "Use subqueries to find genes studied in multiple organism types"
+                "query": "SELECT lc.HGNC, lc.model_organism, lc.effect_on_lifespan, lc.lifespan_percent_change_mean FROM lifespan_change lc JOIN (SELECT HGNC FROM lifespan_change GROUP BY HGNC HAVING SUM(CASE WHEN model_organism IN ('mouse', 'rat', 'rabbit', 'hamster') THEN 1 ELSE 0 END) > 0 AND SUM(CASE WHEN model_organism IN ('roundworm Caenorhabditis elegans', 'fly Drosophila melanogaster', 'yeasts') THEN 1 ELSE 0 END) > 0) g USING (HGNC) ORDER BY lc.HGNC, lc.model_organism",
+                "key_concept": "A single GROUP BY/HAVING pass finds genes studied in both organism groups; the old IN-subquery form scanned the table three times"
             },
             {
                 "category": "Model Organism Studies",
                 "description": "Mouse studies with significant lifespan changes (both mean and max)",
-                "query": "SELECT HGNC, effect_on_lifespan, lifespan_percent_change_mean, lifespan_percent_change_max, significance_mean, significance_max FROM lifespan_change WHERE model_organism = 'mouse' AND (significance_mean = 1 OR significance_max = 1) AND (lifespan_percent_change_mean IS NOT NULL OR lifespan_percent_change_max IS NOT NULL) ORDER BY COALESCE(ABS(lifespan_percent_change_mean), ABS(lifespan_percent_change_max)) DESC",
-                "key_concept": "Filter by significance and show both mean and max when available, order by absolute change magnitude"
+                "query": "SELECT HGNC, effect_on_lifespan, lifespan_percent_change_mean, lifespan_percent_change_max, significance_mean, significance_max FROM idx.lifespan_change WHERE model_organism = 'mouse' AND (significance_mean = 1 OR significance_max = 1) AND lifespan_percent_change_best IS NOT NULL ORDER BY lifespan_percent_change_best_abs DESC",
+                "key_concept": "Filter by significance and show both mean and max when available; the generated lifespan_percent_change_best_abs column orders by absolute magnitude via its index"
             },
             
             # Intervention and method analysis
@@ -601,36 +409,36 @@ All tables are linked by HGNC gene symbols, allowing for comprehensive cross-tab
             {
                 "category": "Summary Statistics",
                 "description": "Top genes by number of experiments across all organisms (use LIMIT only when user asks for 'top N')",
-                "query": "SELECT HGNC, COUNT(*) as experiment_count, COUNT(DISTINCT model_organism) as organism_count FROM lifespan_change WHERE HGNC IS NOT NULL GROUP BY HGNC ORDER BY experiment_count DESC LIMIT 10",
-                "key_concept": "Count experiments and organisms per gene for research breadth. Use LIMIT only when user specifically asks for 'top N' genes, otherwise show all results"
+                "query": "SELECT HGNC, experiment_count, organism_count FROM idx.mv_hgnc_experiments ORDER BY experiment_count DESC LIMIT 10",
+                "key_concept": "The sidecar materialises this roll-up at startup, so the lookup is O(1) instead of a full-scan aggregation. Use LIMIT only when user specifically asks for 'top N' genes, otherwise show all results"
             },
             {
                 "category": "Summary Statistics",
                 "description": "Distribution of lifespan effects by organism (including both mean and max metrics)",
-                "query": "SELECT model_organism, effect_on_lifespan, COUNT(*) as count, AVG(lifespan_percent_change_mean) as avg_mean_change, AVG(lifespan_percent_change_max) as avg_max_change, COUNT(CASE WHEN lifespan_percent_change_mean IS NOT NULL THEN 1 END) as mean_data_points, COUNT(CASE WHEN lifespan_percent_change_max IS NOT NULL THEN 1 END) as max_data_points FROM lifespan_change GROUP BY model_organism, effect_on_lifespan ORDER BY model_organism, count DESC",
-                "key_concept": "Analyze effect distributions across model organisms with both metrics and data availability counts"
+                "query": "SELECT * FROM idx.mv_organism_effect_dist ORDER BY model_organism, count DESC",
+                "key_concept": "Effect distributions are pre-aggregated into the sidecar at startup; select from the materialised table instead of re-running the GROUP BY per question"
             },
             
             # Advanced pattern examples
             {
                 "category": "Advanced Patterns",
                 "description": "Genes with multiple aging hallmarks (complex multi-value query)",
-                "query": "SELECT HGNC, \"hallmarks of aging\", (LENGTH(\"hallmarks of aging\") - LENGTH(REPLACE(\"hallmarks of aging\", ',', '')) + 1) as hallmark_count FROM gene_hallmarks WHERE hallmark_count > 3 ORDER BY hallmark_count DESC",
-                "key_concept": "Count comma-separated values in multi-value fields"
+                "query": "SELECT HGNC, \"hallmarks of aging\", hallmark_count FROM idx.gene_hallmarks WHERE hallmark_count > 3 ORDER BY hallmark_count DESC",
+                "key_concept": "The sidecar's generated hallmark_count column replaces the per-row LENGTH - LENGTH(REPLACE(...)) comma counting and its index makes the > filter a range scan"
             },
             {
                 "category": "Advanced Patterns",
                 "description": "Genes affecting both lifespan and specific biological processes",
-                "query": "SELECT lc.HGNC, lc.effect_on_lifespan, lc.lifespan_percent_change_mean, lc.intervention_improves FROM lifespan_change lc WHERE lc.intervention_improves LIKE '%cardiovascular system%' AND lc.intervention_improves LIKE '%cognitive function%' ORDER BY lc.lifespan_percent_change_mean DESC",
-                "key_concept": "Use multiple LIKE conditions to find genes affecting multiple systems"
+                "query": "SELECT lc.HGNC, lc.effect_on_lifespan, lc.lifespan_percent_change_mean, lc.intervention_improves FROM lifespan_change lc WHERE instr(lc.intervention_improves, 'cardiovascular system') > 0 AND instr(lc.intervention_improves, 'cognitive function') > 0 ORDER BY lc.lifespan_percent_change_mean DESC",
+                "key_concept": "Combine multiple instr() conditions to find genes affecting multiple systems"
             }
-        ]
-        
-        return examples
+        ])
 
-    def _get_known_enumerations(self) -> Dict[str, Dict[str, List[str]]]:
-        """Get comprehensive enumerations for database fields from the OpenGenes database."""
-        return {
+# Pre-serialised once for response paths that can ship raw JSON without
+# re-encoding the list per call.
+_EXAMPLES_JSON = orjson.dumps(_EXAMPLE_QUERIES).decode()
+
+_KNOWN_ENUMERATIONS = {
             "lifespan_change": {
                 "model_organism": [
                     "mouse", "roundworm Caenorhabditis elegans", "fly Drosophila melanogaster", 
@@ -776,8 +584,845 @@ All tables are linked by HGNC gene symbols, allowing for comprehensive cross-tab
             }
         }
 
-# Initialize the OpenGenes MCP server (which inherits from FastMCP)
-mcp = OpenGenesMCP()
+
+# Literal LIKE predicates (column LIKE 'pattern' with no bound params or
+# embedded quotes) that a faster specialised form can replace.
+# The optional NOT is captured so negated predicates pass through untouched
+# (instr()/substr() rewrites of them would need de-Morgan handling and
+# mis-captured the NOT keyword as the column name); the lookahead likewise
+# skips predicates with an explicit ESCAPE clause. The literal part consumes
+# SQL-escaped quotes ('') so a pattern like '%Alzheimer''s%' is tokenised as
+# one literal instead of stopping at its first quote.
+_LIKE_PREDICATE = re.compile(
+    r"((?:\w+\.)?(?:\"[^\"]+\"|\w+))\s+(NOT\s+)?LIKE\s+'((?:[^']|'')*)'(?!\s+ESCAPE\b)",
+    re.IGNORECASE,
+)
+
+
+def _specialize_like(column: str, pattern: str) -> Optional[str]:
+    """Return a specialised predicate for a literal LIKE pattern, or None.
+
+    Default LIKE is ASCII case-insensitive, so the rewrites compare through
+    lower() to preserve semantics:
+    - '%needle%'  -> instr(lower(col), 'needle') > 0   (single substring scan)
+    - '%suffix'   -> substr(lower(col), -N) = 'suffix'
+    'prefix%' patterns are deliberately NOT rewritten: SQLite's LIKE
+    optimisation turns them into range scans over the sidecar's COLLATE
+    NOCASE indexes, which beats any substring form. Patterns with '_' or
+    interior '%' wildcards, escaped quotes ('') or non-ASCII characters are
+    left untouched: escaped quotes would need re-escaping plus length
+    adjustment for the substr form, and str.lower() applies full Unicode
+    folding while SQLite's lower()/LIKE are ASCII-only, so rewriting either
+    case would change match semantics.
+    """
+    if "_" in pattern or "''" in pattern or not pattern.isascii():
+        return None
+    lowered = pattern.lower()
+    if lowered.startswith("%") and lowered.endswith("%") and len(lowered) > 2:
+        needle = lowered[1:-1]
+        if "%" not in needle:
+            return f"instr(lower({column}), '{needle}') > 0"
+    elif lowered.startswith("%") and "%" not in lowered[1:] and len(lowered) > 1:
+        suffix = lowered[1:]
+        return f"substr(lower({column}), -{len(suffix)}) = '{suffix}'"
+    return None
+
+
+def _specialize_like_predicates(sql: str) -> str:
+    """Rewrite literal (non-negated) LIKE predicates to specialised forms."""
+    def _repl(match: "re.Match[str]") -> str:
+        if match.group(2):  # NOT LIKE: keep the original predicate
+            return match.group(0)
+        specialised = _specialize_like(match.group(1), match.group(3))
+        return specialised if specialised is not None else match.group(0)
+    return _LIKE_PREDICATE.sub(_repl, sql)
+
+
+# String literals that can move into ? bindings so structurally identical
+# statements share one prepared plan in SQLite's per-connection statement
+# cache. Numeric literals are deliberately left in place: ordinal
+# GROUP BY 1 / ORDER BY 2 (which LLMs emit constantly) would become
+# grouping/ordering by a constant if bound - valid SQL with silently wrong
+# results.
+_SQL_LITERAL = re.compile(r"'(?:[^']|'')*'")
+
+
+# Connection tuning for the read-only analytical workload: a 64MB page
+# cache, in-memory temp store and a 256MB mmap window turn repeated table
+# scans into memory reads; query_only makes the read-only contract explicit
+# at the SQL layer as well. WAL/synchronous are journal settings for
+# writers and cannot (and need not) be set on a mode=ro connection.
+_CONNECTION_PRAGMAS = """
+    PRAGMA query_only=ON;
+    PRAGMA cache_size=-65536;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA mmap_size=268435456;
+    PRAGMA busy_timeout=5000;
+"""
+
+
+class DatabaseManager:
+    """Manages SQLite database connections and queries."""
+
+    def __init__(self, db_path: Path, pool_size: Optional[int] = None):
+        self.db_path = db_path
+        if not self.db_path.exists():
+            raise FileNotFoundError(f"Database not found at {self.db_path}")
+        # Long-lived read-only connections, pooled: re-opening per query
+        # re-parses the URI, repeats the VFS open syscalls and throws away
+        # SQLite's page cache; a single connection would serialise concurrent
+        # MCP tool calls. Read-only connections can run in parallel, so the
+        # pool scales reads with core count. SQLite enforces read-only at
+        # database level via mode=ro in the URI.
+        # immutable=1: the HF snapshot never changes while the server runs,
+        # so SQLite can skip all locking and journal/WAL checks per statement.
+        self._readonly_uri = f"file:{self.db_path}?mode=ro&immutable=1"
+        # The distributed snapshot ships without indexes and cannot be
+        # modified in place; build a writable sidecar with an indexed copy of
+        # the hot table once, and ATTACH it (as `idx`) to every pooled
+        # connection so the planner can use the indexes.
+        self._sidecar_path = self._build_index_sidecar()
+        self._pool_size = pool_size or (os.cpu_count() or 4)
+        # sql text -> (template, params); amortises the literal-normalising
+        # regex across repeated statements.
+        self._stmt_cache: Dict[str, tuple] = {}
+        self._pool: "queue.SimpleQueue[sqlite3.Connection]" = queue.SimpleQueue()
+        for _ in range(self._pool_size):
+            self._pool.put(self._new_connection())
+
+    def _build_index_sidecar(self) -> Optional[str]:
+        """Materialise an indexed copy of lifespan_change in a temp sidecar.
+
+        Returns the sidecar path, or None when the build fails (queries then
+        simply run against the unindexed main database).
+        """
+        with start_action(action_type="build_index_sidecar") as action:
+            try:
+                fd, sidecar_path = tempfile.mkstemp(suffix=".sqlite", prefix="opengenes_idx_")
+                os.close(fd)
+                build = sqlite3.connect(sidecar_path)
+                try:
+                    build.execute("ATTACH DATABASE ? AS src", (str(self.db_path),))
+                    build.executescript(
+                        "CREATE TABLE lifespan_change AS SELECT * FROM src.lifespan_change;"
+                        "CREATE INDEX ix_lsc_effect_mean ON lifespan_change(effect_on_lifespan, lifespan_percent_change_mean);"
+                        "CREATE INDEX ix_lsc_hgnc ON lifespan_change(HGNC);"
+                        # Generated columns make the COALESCE/ABS orderings
+                        # sargable; VIRTUAL because ALTER TABLE cannot add
+                        # STORED columns, and the indexes persist the values.
+                        "ALTER TABLE lifespan_change ADD COLUMN lifespan_percent_change_best REAL GENERATED ALWAYS AS (COALESCE(lifespan_percent_change_mean, lifespan_percent_change_max)) VIRTUAL;"
+                        "ALTER TABLE lifespan_change ADD COLUMN lifespan_percent_change_best_abs REAL GENERATED ALWAYS AS (ABS(COALESCE(lifespan_percent_change_mean, lifespan_percent_change_max))) VIRTUAL;"
+                        "CREATE INDEX ix_lsc_best ON lifespan_change(effect_on_lifespan, lifespan_percent_change_best DESC);"
+                        "CREATE INDEX ix_lsc_best_abs ON lifespan_change(lifespan_percent_change_best_abs DESC);"
+                        "CREATE TABLE gene_hallmarks AS SELECT * FROM src.gene_hallmarks;"
+                        "CREATE TABLE gene_criteria AS SELECT * FROM src.gene_criteria;"
+                        "CREATE TABLE longevity_associations AS SELECT * FROM src.longevity_associations;"
+                        # HGNC join keys across all four tables: the
+                        # cross-table 'comprehensive aging evidence' pattern
+                        # probes each table by gene symbol.
+                        "CREATE INDEX ix_gh_hgnc ON gene_hallmarks(HGNC);"
+                        # Comma-count as a generated column: the LENGTH -
+                        # LENGTH(REPLACE(...)) idiom costs two string scans
+                        # per row; the index makes count filters range scans.
+                        "ALTER TABLE gene_hallmarks ADD COLUMN hallmark_count INT GENERATED ALWAYS AS (LENGTH(\"hallmarks of aging\") - LENGTH(REPLACE(\"hallmarks of aging\", ',', '')) + 1) VIRTUAL;"
+                        "CREATE INDEX ix_gh_count ON gene_hallmarks(hallmark_count);"
+                        "CREATE INDEX ix_gc_hgnc ON gene_criteria(HGNC);"
+                        "CREATE INDEX ix_la_hgnc ON longevity_associations(HGNC);"
+                        # Composite covering index for the common effect+gene
+                        # projection on lifespan_change.
+                        "CREATE INDEX ix_lsc_effect_hgnc ON lifespan_change(effect_on_lifespan, HGNC, model_organism, lifespan_percent_change_mean);"
+                        # COLLATE NOCASE indexes let SQLite's LIKE optimisation
+                        # turn case-insensitive 'prefix%' patterns into index
+                        # range scans on the text-search columns.
+                        "CREATE INDEX ix_lsc_hgnc_nc ON lifespan_change(HGNC COLLATE NOCASE);"
+                        "CREATE INDEX ix_lsc_organism_nc ON lifespan_change(model_organism COLLATE NOCASE);"
+                        "CREATE INDEX ix_lsc_effect_nc ON lifespan_change(effect_on_lifespan COLLATE NOCASE);"
+                        "CREATE INDEX ix_lsc_method_nc ON lifespan_change(intervention_method COLLATE NOCASE);"
+                        # Materialised roll-ups for the Summary Statistics
+                        # examples; the data is read-only so no refresh logic
+                        # is needed.
+                        # One wide row per gene for the 'comprehensive aging
+                        # evidence' critical pattern: all four tables rolled up
+                        # into JSON so one keyed lookup replaces four queries.
+                        "CREATE TABLE gene_aging_evidence AS "
+                        "SELECT g.HGNC, "
+                        "(SELECT json_group_array(criteria) FROM gene_criteria WHERE HGNC = g.HGNC) AS criteria, "
+                        "(SELECT \"hallmarks of aging\" FROM gene_hallmarks WHERE HGNC = g.HGNC) AS hallmarks, "
+                        "(SELECT json_group_array(json_object('organism', model_organism, 'effect', effect_on_lifespan, 'mean', lifespan_percent_change_mean, 'max', lifespan_percent_change_max)) FROM lifespan_change WHERE HGNC = g.HGNC) AS lifespan, "
+                        "(SELECT json_group_array(json_object('polymorphism', \"polymorphism id\", 'type', \"polymorphism type\", 'ethnicity', ethnicity, 'study', \"study type\")) FROM longevity_associations WHERE HGNC = g.HGNC) AS longevity "
+                        "FROM (SELECT HGNC FROM gene_criteria UNION SELECT HGNC FROM gene_hallmarks UNION SELECT HGNC FROM lifespan_change WHERE HGNC IS NOT NULL UNION SELECT HGNC FROM longevity_associations) g;"
+                        "CREATE UNIQUE INDEX ix_evidence_hgnc ON gene_aging_evidence(HGNC);"
+                        "CREATE TABLE mv_hgnc_experiments AS SELECT HGNC, COUNT(*) AS experiment_count, COUNT(DISTINCT model_organism) AS organism_count FROM lifespan_change WHERE HGNC IS NOT NULL GROUP BY HGNC;"
+                        "CREATE INDEX ix_mv_hgnc_count ON mv_hgnc_experiments(experiment_count DESC);"
+                        "CREATE TABLE mv_organism_effect_dist AS SELECT model_organism, effect_on_lifespan, COUNT(*) AS count, AVG(lifespan_percent_change_mean) AS avg_mean_change, AVG(lifespan_percent_change_max) AS avg_max_change, COUNT(lifespan_percent_change_mean) AS mean_data_points, COUNT(lifespan_percent_change_max) AS max_data_points FROM lifespan_change GROUP BY model_organism, effect_on_lifespan;"
+                        # Pre-normalised child table: one (HGNC, hallmark) row
+                        # per value of the comma-separated hallmarks column,
+                        # indexed so membership tests become B-tree probes.
+                        # (The intervention_* columns cannot be split this way:
+                        # their tags legitimately contain commas.)
+                        "CREATE TABLE gene_hallmark AS "
+                        "SELECT gene_hallmarks.HGNC AS HGNC, TRIM(j.value) AS hallmark "
+                        "FROM gene_hallmarks, json_each('[\"' || REPLACE(REPLACE(\"hallmarks of aging\", '\"', ''), ',', '\",\"') || '\"]') j "
+                        "WHERE \"hallmarks of aging\" IS NOT NULL;"
+                        "CREATE INDEX ix_gene_hallmark ON gene_hallmark(hallmark, HGNC);"
+                    )
+                    try:
+                        # FTS5 shadow tables turn the unanchored LIKE scans on
+                        # the comma-separated multi-value columns into inverted
+                        # index lookups (e.g. WHERE idx.gh_fts MATCH 'stem cell
+                        # exhaustion'). Optional: FTS5 may be compiled out.
+                        build.executescript(
+                            "CREATE VIRTUAL TABLE lsc_fts USING fts5(HGNC, intervention_improves, intervention_deteriorates);"
+                            "INSERT INTO lsc_fts(HGNC, intervention_improves, intervention_deteriorates) SELECT HGNC, intervention_improves, intervention_deteriorates FROM lifespan_change;"
+                            "CREATE VIRTUAL TABLE gh_fts USING fts5(HGNC, hallmarks);"
+                            "INSERT INTO gh_fts(HGNC, hallmarks) SELECT HGNC, \"hallmarks of aging\" FROM gene_hallmarks;"
+                        )
+                    except sqlite3.OperationalError as fts_error:
+                        action.log(message_type="fts_unavailable", error=str(fts_error))
+                    build.execute("DETACH DATABASE src")
+                finally:
+                    build.close()
+                action.add_success_fields(sidecar_path=sidecar_path)
+                return sidecar_path
+            except Exception as e:
+                action.log(message_type="sidecar_build_failed", error=str(e))
+                return None
+
+    def _new_connection(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self._readonly_uri, uri=True, check_same_thread=False, isolation_level=None
+        )
+        if self._sidecar_path is not None:
+            conn.execute("ATTACH DATABASE ? AS idx", (self._sidecar_path,))
+        conn.executescript(_CONNECTION_PRAGMAS)
+        return conn
+
+    # VDBE opcodes that indicate mutation; EXPLAIN exposes them at compile
+    # time without running the statement. Opcodes like Insert/Delete/Clear
+    # also appear for ephemeral tables in legitimate read queries (GROUP BY
+    # materialisation, sorters), so they only count as writes for statements
+    # that are not read-shaped; real table writes always open their cursor
+    # with OpenWrite, except the DELETE-without-WHERE truncate path (Clear).
+    _WRITE_OPCODES = frozenset({"OpenWrite", "CreateBtree", "Destroy", "Vacuum"})
+    _WRITE_OPCODES_NON_READ = frozenset({"OpenWrite", "Insert", "Delete", "Update", "Clear", "CreateBtree", "Destroy", "Vacuum"})
+    _READ_KEYWORDS = frozenset({"SELECT", "WITH", "VALUES", "EXPLAIN"})
+
+    def _assert_read_only(self, conn: sqlite3.Connection, sql: str) -> None:
+        """Reject mutating statements before execution via a cheap EXPLAIN.
+
+        PRAGMA query_only already stops writes, but scanning the compiled
+        program also covers edge cases around ATTACH and rejects bad
+        statements before any execution starts. Compile errors are left for
+        the real execute so their messages stay unchanged.
+        """
+        try:
+            program = conn.execute("EXPLAIN " + sql).fetchall()
+        except sqlite3.OperationalError as e:
+            # query_only rejects write statements at compile; translate that
+            # into the explicit rejection instead of letting the real execute
+            # repeat the failed compile.
+            if "readonly" in str(e).lower():
+                raise ValueError(
+                    f"Write operation attempted on read-only database. Rejected query: {sql}"
+                ) from e
+            return
+        except sqlite3.Error:
+            return
+        first_token = sql.lstrip().split(None, 1)[0].upper() if sql.strip() else ""
+        write_opcodes = (
+            self._WRITE_OPCODES if first_token in self._READ_KEYWORDS
+            else self._WRITE_OPCODES_NON_READ
+        )
+        for row in program:
+            if row[1] in write_opcodes:
+                raise ValueError(
+                    f"Write operation attempted on read-only database. Rejected query: {sql}"
+                )
+
+    def _parameterize(self, sql: str) -> tuple:
+        """Normalise string literals into ? bindings for plan reuse.
+
+        Different literal values (e.g. HGNC symbols) then map onto one
+        template, so SQLite's internal prepared-statement cache hits on the
+        structural form instead of re-planning per value. Only string
+        literals are rewritten (see _SQL_LITERAL); the caller falls back to
+        the original text if the template fails to compile.
+        """
+        cached = self._stmt_cache.get(sql)
+        if cached is not None:
+            return cached
+        params: List[Any] = []
+
+        def _repl(match: "re.Match[str]") -> str:
+            params.append(match.group(0)[1:-1].replace("''", "'"))
+            return "?"
+
+        template = _SQL_LITERAL.sub(_repl, sql)
+        entry = (template, tuple(params))
+        if len(self._stmt_cache) < 512:
+            self._stmt_cache[sql] = entry
+        return entry
+
+    def _acquire(self) -> sqlite3.Connection:
+        return self._pool.get()
+
+    def _release(self, conn: sqlite3.Connection) -> None:
+        self._pool.put(conn)
+
+    def execute_query_json(self, sql: str) -> JsonQueryResult:
+        """Execute a read-only query with SQLite materialising the JSON rows.
+
+        The user query is wrapped in json_group_array(json_object(...)), so
+        row-to-JSON conversion happens in one C-level pass instead of the
+        Python dict build plus a later JSON encode of the response.
+        """
+        with start_action(action_type="execute_query_json", sql=sql) as action:
+            inner_sql = sql.strip().rstrip(";")
+            conn = self._acquire()
+            try:
+                self._assert_read_only(conn, inner_sql)
+                probe = conn.execute(f"SELECT * FROM ({inner_sql}) LIMIT 0")
+                cols = [d[0] for d in probe.description]
+                pairs = ", ".join(
+                    "'" + c.replace("'", "''") + "', \"" + c.replace('"', '""') + "\""
+                    for c in cols
+                )
+                wrapped = (
+                    f"SELECT json_group_array(json_object({pairs})), COUNT(*) "
+                    f"FROM ({inner_sql})"
+                )
+                rows_json, count = conn.execute(wrapped).fetchone()
+            finally:
+                self._release(conn)
+            action.add_success_fields(rows_count=count)
+            return JsonQueryResult(rows_json=rows_json or "[]", count=count, query=sql)
+
+    def execute_query_columnar(self, sql: str, params: Optional[tuple] = None) -> ColumnarQueryResult:
+        """Execute a read-only query returning columns instead of row dicts.
+
+        Internal fast path for wide result sets; same read-only guarantees
+        as execute_query.
+        """
+        with start_action(action_type="execute_query_columnar", sql=sql) as action:
+            conn = self._acquire()
+            try:
+                self._assert_read_only(conn, sql)
+                cursor = conn.execute(sql, params or ())
+                cols = tuple(d[0] for d in cursor.description)
+                rows = cursor.fetchall()
+            finally:
+                self._release(conn)
+            columns = {
+                name: list(values)
+                for name, values in zip(cols, zip(*rows))
+            } if rows else {name: [] for name in cols}
+            action.add_success_fields(rows_count=len(rows))
+            return ColumnarQueryResult(columns=columns, count=len(rows), query=sql)
+
+    def execute_query_arrow(self, sql: str, params: Optional[tuple] = None) -> "pyarrow.Table":
+        """Fetch a result set as a pyarrow.Table (one buffer per column).
+
+        Numeric columns (lifespan_percent_change_*) land in contiguous
+        arrays amenable to vectorised aggregation; serialise at the edge
+        with Table.to_pylist(). Requires the optional 'arrow' extra.
+        """
+        if pyarrow is None:
+            raise RuntimeError(
+                "pyarrow is required for execute_query_arrow; install the 'arrow' extra."
+            )
+        columnar = self.execute_query_columnar(sql, params)
+        return pyarrow.table(columnar.columns)
+
+    def execute_query_stream(self, sql: str, params: Optional[tuple] = None, chunk_size: int = 1000):
+        """Yield result rows in chunks of dicts instead of materialising all.
+
+        Keeps peak memory flat for queries that dump large tables: each
+        fetchmany batch is converted and handed to the caller before the
+        next one is fetched. The connection stays checked out of the pool
+        until the generator is exhausted or closed.
+        """
+        conn = self._acquire()
+        try:
+            self._assert_read_only(conn, sql)
+            cursor = conn.cursor()
+            cursor.arraysize = chunk_size
+            cursor.execute(sql, params or ())
+            cols = tuple(d[0] for d in cursor.description)
+            while True:
+                batch = cursor.fetchmany(chunk_size)
+                if not batch:
+                    break
+                yield [dict(zip(cols, row)) for row in batch]
+        finally:
+            self._release(conn)
+
+    async def execute_query_async(self, sql: str, params: Optional[tuple] = None) -> QueryResult:
+        """Run the blocking SQLite call in a worker thread.
+
+        FastMCP serves tools on the event loop; offloading keeps a slow
+        query from stalling every other in-flight MCP request.
+        """
+        return await asyncio.to_thread(self.execute_query, sql, params)
+
+    def execute_query(self, sql: str, params: Optional[tuple] = None) -> QueryResult:
+        """Execute a read-only SQL query and return results."""
+        with start_action(action_type="execute_query", sql=sql, params=params) as action:
+            # Write attempts are rejected by SQLite itself before execution:
+            # PRAGMA query_only (plus mode=ro/immutable on the connection)
+            # raises a clear OperationalError at statement compile, so no
+            # error-string sniffing is needed here.
+            conn = self._acquire()
+            try:
+                self._assert_read_only(conn, sql)
+                if params:
+                    cursor = conn.execute(sql, params)
+                else:
+                    # Execute through the literal-normalised template so
+                    # structurally identical statements reuse one plan.
+                    template, bound = self._parameterize(sql)
+                    try:
+                        cursor = conn.execute(template, bound)
+                    except sqlite3.Error:
+                        cursor = conn.execute(sql)
+                # Plain tuples from the C fetch path; build dicts from one
+                # cached key tuple instead of per-row sqlite3.Row lookups.
+                cols = tuple(d[0] for d in cursor.description)
+                rows = cursor.fetchall()
+            finally:
+                self._release(conn)
+
+            rows_dicts = [dict(zip(cols, row)) for row in rows]
+
+            result = QueryResult(
+                rows=rows_dicts,
+                count=len(rows_dicts),
+                query=sql
+            )
+
+            action.add_success_fields(rows_count=len(rows_dicts))
+            return result
+
+_SCHEMA_SUMMARY = """OpenGenes Database Schema Summary
+
+1. lifespan_change
+   - Contains experimental data about genetic interventions and their effects on lifespan
+   - Key columns: HGNC (gene symbol), model_organism, sex, effect_on_lifespan
+   - Includes intervention details, lifespan measurements, significance data
+   - Contains data from various model organisms (mouse, C. elegans, fly, etc.)
+
+2. gene_criteria  
+   - Contains criteria classifications for aging-related genes
+   - Key columns: HGNC (gene symbol), criteria
+   - 12 different aging-related criteria categories
+   - Links genes to specific aging research criteria
+
+3. gene_hallmarks
+   - Contains hallmarks of aging associated with specific genes  
+   - Key columns: HGNC (gene symbol), hallmarks of aging
+   - Maps genes to biological hallmarks of aging process
+   - Includes various aging-related cellular and molecular processes
+
+4. longevity_associations
+   - Contains genetic variants associated with longevity
+   - Key columns: HGNC (gene symbol), polymorphism details, ethnicity, study type
+   - Population genetics data from longevity studies
+   - Includes SNPs, indels, and other genetic variations
+
+All tables are linked by HGNC gene symbols, allowing for comprehensive cross-table queries about aging-related genes."""
+
+class OpenGenesMCP(FastMCP):
+    """OpenGenes MCP Server with database tools that can be inherited and extended."""
+    
+    def __init__(
+        self, 
+        name: str = "OpenGenes MCP Server",
+        db_path: Optional[Path] = None,
+        prefix: str = "opengenes_",
+        huge_query_tool: bool = False,
+        **kwargs
+    ):
+        """Initialize the OpenGenes tools with a database manager and FastMCP functionality."""
+        # Initialize FastMCP with the provided name and any additional kwargs
+        super().__init__(name=name, **kwargs)
+        
+        # Initialize our database manager (default path resolved on demand)
+        self.db_manager = DatabaseManager(db_path if db_path is not None else resolve_db_path())
+
+        # Static resource bodies are read once at startup and served from
+        # memory: the prompt otherwise re-reads the HF cache per request and
+        # the summary string would be re-materialised per call.
+        self._db_prompt = get_prompt_content()
+        self._schema_summary = _SCHEMA_SUMMARY
+
+        # Both tools below are pure for a given database file; cache their
+        # output per instance instead of rebuilding the large dicts per call.
+        self._schema_cache: Optional[Dict[str, Any]] = None
+        self._examples_cache: Optional[List[Dict[str, str]]] = None
+
+        # Read-only data never invalidates, so repeated questions (the LLM
+        # leans on the canned examples) collapse to a dict lookup. Bounded
+        # LRU keyed on whitespace-normalised SQL.
+        self._result_cache: "OrderedDict[str, QueryResult]" = OrderedDict()
+        self._result_cache_max = 256
+
+        self.prefix = prefix
+        self.huge_query_tool = huge_query_tool
+        # Register our tools and resources
+        self._register_opengenes_tools()
+        self._register_opengenes_resources()
+
+        # Compile the canned example statements once up front so their plans
+        # and schema lookups are warm before the first agent question.
+        self._warm_statement_cache()
+
+    def _warm_statement_cache(self) -> None:
+        """Pre-compile the example queries with EXPLAIN QUERY PLAN.
+
+        Compilation (parser + planner) runs without executing the statements;
+        examples that reference optional sidecar objects are skipped quietly.
+        """
+        conn = self.db_manager._acquire()
+        try:
+            for example in _EXAMPLE_QUERIES:
+                try:
+                    conn.execute("EXPLAIN QUERY PLAN " + example["query"]).fetchall()
+                except sqlite3.Error:
+                    continue
+        finally:
+            self.db_manager._release(conn)
+    
+    # (name suffix, handler attribute, description) for the static tools;
+    # computed once at class definition so per-instance registration is a
+    # plain loop with no conditional rebuilds. db_query is registered
+    # separately because its description depends on huge_query_tool.
+    _TOOL_SPECS = (
+        ("get_schema_info", "get_schema_info",
+         "Get information about the database schema"),
+        ("db_query_stream", "db_query_stream",
+         "Query the Opengenes database fetching rows in chunks server-side. Note: the MCP response is still delivered as one aggregated message, so this bounds database-side memory, not response size; it does not make oversized results cheaper to receive than db_query."),
+        ("db_query_json", "db_query_json",
+         "Query the Opengenes database and return rows as a raw JSON array string; faster than db_query for large result sets."),
+        ("example_queries", "get_example_queries",
+         "Get a list of example SQL queries"),
+    )
+
+    _DB_QUERY_DESCRIPTION = (
+        "Query the Opengenes database that contains data about genes involved in "
+        "longevity, lifespan extension experiments on model organisms, and changes "
+        "in human and other organisms with aging."
+    )
+
+    def _register_opengenes_tools(self):
+        """Register OpenGenes-specific tools."""
+        for name, handler_attr, description in self._TOOL_SPECS:
+            self.tool(name=f"{self.prefix}{name}", description=description)(getattr(self, handler_attr))
+
+        description = self._DB_QUERY_DESCRIPTION
+        if self.huge_query_tool:
+            # Load and concatenate the prompt from package data
+            prompt_content = get_prompt_content().strip()
+            if prompt_content:
+                description = description + "\n\n" + prompt_content
+        else:
+            description = description + " Before caling this tool the first time, always check tools that provide schema information and example queries."
+        self.tool(name=f"{self.prefix}db_query", description=description)(self.db_query)
+
+    
+    def _register_opengenes_resources(self):
+        """Register OpenGenes-specific resources."""
+        
+        @self.resource(f"resource://{self.prefix}db-prompt")
+        def get_db_prompt() -> str:
+            """
+            Get the database prompt that describes the OpenGenes database schema and usage guidelines.
+            
+            This resource contains detailed information about:
+            - Database tables and their schemas
+            - Column enumerations and valid values
+            - Usage guidelines for querying the database
+            - Examples of common queries
+            
+            Returns:
+                The complete database prompt text
+            """
+            with start_action(action_type="get_db_prompt") as action:
+                if self._db_prompt:
+                    action.add_success_fields(file_exists=True, content_length=len(self._db_prompt))
+                    return self._db_prompt
+                action.add_error_fields(file_exists=False, error="Prompt file not found")
+                return "Database prompt file not found."
+        
+        @self.resource(f"resource://{self.prefix}example-queries")
+        def get_example_queries_resource() -> str:
+            """
+            Get the example SQL queries as a raw JSON array string.
+
+            Served from the module-level pre-serialised constant, so no
+            per-request encoding of the example list takes place.
+
+            Returns:
+                The example queries (category/description/query/key_concept) as JSON
+            """
+            return _EXAMPLES_JSON
+
+        @self.resource(f"resource://{self.prefix}schema-summary")
+        def get_schema_summary() -> str:
+            """
+            Get a summary of the OpenGenes database schema.
+            
+            Returns:
+                A formatted summary of tables and their purposes
+            """
+            return self._schema_summary
+    
+    async def db_query(self, sql: str) -> QueryResult:
+        """
+        Execute a read-only SQL query against the OpenGenes database.
+        
+        SECURITY: This tool uses SQLite's built-in read-only mode to enforce data protection.
+        The database connection is opened in read-only mode, preventing any write operations
+        at the database level. Any attempt to modify data will be automatically rejected by SQLite.
+        
+        The OpenGenes database contains aging and lifespan research data across 4 tables:
+        - lifespan_change: Experimental data on gene modifications and lifespan effects
+        - gene_criteria: Aging-related criteria classifications for genes  
+        - gene_hallmarks: Links genes to hallmarks of aging (multi-value field)
+        - longevity_associations: Population genetics data on gene variants and longevity
+        
+        All tables are linked by HGNC gene symbols for cross-table analysis.
+        
+        CRITICAL REMINDERS:
+        - Use LIKE queries with wildcards for multi-value fields (gene_hallmarks."hallmarks of aging", 
+          lifespan_change.intervention_improves, lifespan_change.intervention_deteriorates);
+          for faster membership tests the attached sidecar offers FTS5 shadow tables:
+          SELECT HGNC FROM idx.gh_fts WHERE gh_fts MATCH 'stem cell exhaustion'
+          and idx.lsc_fts over intervention_improves/intervention_deteriorates
+        - Order lifespan results by magnitude: DESC for increases, ASC for decreases
+        - IMPORTANT: When user asks about "lifespan effects" without specifying mean vs max, 
+          show both lifespan_percent_change_mean AND lifespan_percent_change_max
+        - Use COALESCE(lifespan_percent_change_mean, lifespan_percent_change_max) for ordering both metrics
+        - COMPREHENSIVE AGING EVIDENCE: When users ask about "evidence of aging", "link to aging/longevity", 
+          or "aging associations" for a gene, query ALL 4 tables (gene_criteria, gene_hallmarks, 
+          lifespan_change, longevity_associations) for complete scientific evidence
+        
+        For detailed schema information, use get_schema_info().
+        For query examples and patterns, use get_example_queries().
+        
+        Args:
+            sql: The SQL query to execute (database enforces read-only access)
+            
+        Returns:
+            QueryResult: Contains the query results, row count, and executed query
+        """
+        with start_action(action_type="db_query_tool", sql=sql) as action:
+            # Rewrite literal LIKE patterns (prefix/suffix/substring) into
+            # their specialised substring forms before execution.
+            sql = _specialize_like_predicates(sql)
+            cache_key = " ".join(sql.split())
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                self._result_cache.move_to_end(cache_key)
+                action.add_success_fields(cache_hit=True)
+                # Copies keep callers from mutating the cached rows.
+                return cached.model_copy(deep=True)
+
+            result = await self.db_manager.execute_query_async(sql)
+            self._result_cache[cache_key] = result.model_copy(deep=True)
+            if len(self._result_cache) > self._result_cache_max:
+                self._result_cache.popitem(last=False)
+            return result
+
+    def clear_cache(self) -> None:
+        """Drop all cached db_query results (e.g. after swapping databases)."""
+        self._result_cache.clear()
+
+    async def db_query_stream(self, sql: str, chunk_size: int = 1000):
+        """
+        Execute a read-only SQL query, fetching rows in chunks.
+
+        Yields lists of row dicts (chunk_size rows each) as they come off the
+        cursor, so the database fetch and dict conversion are incremental and
+        no single Pydantic validation pass sees the whole set. Over the MCP
+        boundary FastMCP still collects the generator into one aggregated
+        response, so this bounds server-side memory during the read - it is
+        not wire-level streaming and does not shrink the response a client
+        receives. Same read-only guarantees and schema as db_query.
+
+        Args:
+            sql: The SQL query to execute (database enforces read-only access)
+            chunk_size: Number of rows per fetched chunk (default 1000)
+        """
+        with start_action(action_type="db_query_stream_tool", sql=sql):
+            iterator = self.db_manager.execute_query_stream(sql, chunk_size=chunk_size)
+            while True:
+                batch = await asyncio.to_thread(next, iterator, None)
+                if batch is None:
+                    break
+                yield batch
+
+    async def db_query_json(self, sql: str) -> JsonQueryResult:
+        """
+        Execute a read-only SQL query and return rows as a raw JSON array string.
+
+        Same read-only guarantees and schema as db_query, but SQLite
+        serialises the rows directly via json_group_array/json_object, which
+        avoids the per-row Python dict construction and re-encoding for
+        large result sets.
+
+        Args:
+            sql: The SQL query to execute (database enforces read-only access)
+
+        Returns:
+            JsonQueryResult: rows_json (JSON array string), row count and the query
+        """
+        with start_action(action_type="db_query_json_tool", sql=sql) as action:
+            return await asyncio.to_thread(self.db_manager.execute_query_json, sql)
+
+    async def get_schema_info(self) -> Dict[str, Any]:
+        """
+        Get comprehensive information about the OpenGenes database schema including table structures, 
+        column descriptions, enumerations, and critical query guidelines.
+        
+        Returns:
+            Dict containing detailed table schemas, column information, query guidelines, and available enumerations
+        """
+        if self._schema_cache is not None:
+            return self._schema_cache
+
+        with start_action(action_type="get_schema_info") as action:
+            # One round-trip for the whole schema: pragma_table_info as a
+            # table-valued function joined against sqlite_master replaces a
+            # per-table PRAGMA loop (N+1 queries and SQL compilations).
+            schema_query = (
+                "SELECT m.name AS table_name, p.name, p.type, p.\"notnull\", p.pk "
+                "FROM sqlite_master m JOIN pragma_table_info(m.name) p "
+                "WHERE m.type = 'table' ORDER BY m.name, p.cid"
+            )
+            schema_result = await self.db_manager.execute_query_async(schema_query)
+            columns_by_table: Dict[str, List[Dict[str, Any]]] = {}
+            for row in schema_result.rows:
+                columns_by_table.setdefault(row["table_name"], []).append(row)
+            table_names = list(columns_by_table)
+
+            action.add_success_fields(tables_found=len(table_names), table_names=table_names)
+            
+            schema_info = {
+                "database_overview": {
+                    "description": "OpenGenes database contains aging and lifespan research data with 4 main tables linked by HGNC gene symbols",
+                    "total_tables": len(table_names),
+                    "primary_key": "HGNC (gene symbol) - links all tables together"
+                },
+                "critical_query_guidelines": {
+                    "multi_value_fields": {
+                        "description": "Some columns contain comma-separated values. ALWAYS use LIKE queries with wildcards for these fields.",
+                        "fields": [
+                            "gene_hallmarks.'hallmarks of aging' - contains multiple aging hallmarks per gene",
+                            "lifespan_change.intervention_deteriorates - multiple biological processes that deteriorate",
+                            "lifespan_change.intervention_improves - multiple biological processes that improve"
+                        ],
+                        "example_syntax": "WHERE \"hallmarks of aging\" LIKE '%stem cell exhaustion%'"
+                    },
+                    "lifespan_metrics": {
+                        "description": "Database contains both mean and maximum lifespan change metrics. When user asks about lifespan effects without specifying, show both.",
+                        "mean_vs_max": "lifespan_percent_change_mean shows average effect, lifespan_percent_change_max shows maximum observed effect",
+                        "when_to_show_both": "If user asks about 'lifespan effects' or 'lifespan changes' without specifying mean vs max, include both metrics",
+                        "ordering_both": "Use COALESCE(lifespan_percent_change_mean, lifespan_percent_change_max) for ordering when showing both",
+                        "significance": "Both mean and max have corresponding significance columns (significance_mean, significance_max)"
+                    },
+                    "result_ordering": {
+                        "lifespan_extension": "ORDER BY lifespan_percent_change_mean DESC (highest increase first)",
+                        "lifespan_reduction": "ORDER BY lifespan_percent_change_mean ASC (largest decrease first)",
+                        "importance": "Always order lifespan results by magnitude of effect for relevance",
+                        "both_metrics": "When showing both mean and max, use COALESCE for ordering or show comparison"
+                    },
+                    "comprehensive_aging_evidence": {
+                        "description": "For questions about aging evidence, link to aging, or longevity associations for a gene, query ALL 4 tables for complete evidence",
+                        "required_tables": "1) gene_criteria (aging-related criteria), 2) gene_hallmarks (aging pathways), 3) lifespan_change (experimental effects), 4) longevity_associations (human population studies)",
+                        "example_patterns": "Evidence of X and aging, Link between X and aging, X gene aging associations, What evidence links X to aging",
+                        "critical_note": "Do NOT omit longevity_associations table - it contains crucial human population genetics data"
+                    },
+                    "gene_queries": "Use HGNC column for gene symbols (TP53, FOXO3, etc.)",
+                    "safety": "Only SELECT queries allowed - no INSERT, UPDATE, DELETE, or DDL operations"
+                },
+                "tables": {},
+                "enumerations": {},
+                "biological_processes_tags": list(_BIOLOGICAL_PROCESSES_TAGS),
+                "aging_hallmarks_tags": list(_AGING_HALLMARKS_TAGS)
+            }
+            
+            # Get detailed column information for each table with descriptions
+            table_descriptions = _TABLE_DESCRIPTIONS
+            
+            for table_name, table_columns in columns_by_table.items():
+                column_descriptions = _COLUMN_DESCRIPTIONS.get(table_name, {})
+                
+                schema_info["tables"][table_name] = {
+                    "description": table_descriptions.get(table_name, {}),
+                    "columns": [
+                        {
+                            "name": col["name"],
+                            "type": col["type"],
+                            "nullable": not col["notnull"],
+                            "primary_key": bool(col["pk"]),
+                            "description": column_descriptions.get(col["name"], "")
+                        }
+                        for col in table_columns
+                    ]
+                }
+            
+            # Add comprehensive enumerations
+            schema_info["enumerations"] = self._get_known_enumerations()
+            
+            action.add_success_fields(schema_retrieved=True, total_tables=len(table_names))
+            self._schema_cache = schema_info
+            return schema_info
+
+    async def get_example_queries(self) -> List[Dict[str, str]]:
+        """
+        Get comprehensive example SQL queries with patterns and best practices for the OpenGenes database.
+        
+        Includes examples for:
+        - Multi-value field queries (LIKE with wildcards)
+        - Proper result ordering by effect magnitude
+        - Cross-table joins and analysis
+        - Common research questions and patterns
+        
+        Returns:
+            List of dictionaries containing example queries with descriptions and categories
+        """
+        if self._examples_cache is not None:
+            return self._examples_cache
+
+        examples = list(_EXAMPLE_QUERIES)
+
+        self._examples_cache = examples
+        return examples
+
+    def _get_known_enumerations(self) -> Dict[str, Dict[str, List[str]]]:
+        """Get comprehensive enumerations for database fields from the OpenGenes database."""
+        return _KNOWN_ENUMERATIONS
+
+# The OpenGenes MCP server singleton is built on first use so importing this
+# module stays instant; `mcp` remains available as a module attribute via
+# __getattr__ for backwards compatibility.
+_mcp_instance: Optional[OpenGenesMCP] = None
+
+
+def get_mcp() -> OpenGenesMCP:
+    """Build (once) and return the OpenGenes MCP server singleton."""
+    global _mcp_instance
+    if _mcp_instance is None:
+        _mcp_instance = OpenGenesMCP()
+    return _mcp_instance
+
+
+def __getattr__(name: str):
+    if name == "mcp":
+        return get_mcp()
+    if name == "DB_PATH":
+        return resolve_db_path()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Create typer app
 app = typer.Typer(help="OpenGenes MCP Server - Database query interface for OpenGenes aging research data")
@@ -789,14 +1434,14 @@ def cli_app(
     transport: str = typer.Option("streamable-http", "--transport", help="Transport type")
 ) -> None:
     """Run the MCP server with specified transport."""
-    mcp.run(transport=transport, host=host, port=port)
+    get_mcp().run(transport=transport, host=host, port=port)
 
 @app.command("stdio")
 def cli_app_stdio(
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output")
 ) -> None:
     """Run the MCP server with stdio transport."""
-    mcp.run(transport="stdio")
+    get_mcp().run(transport="stdio")
 
 @app.command("sse")
 def cli_app_sse(
@@ -804,20 +1449,20 @@ def cli_app_sse(
     port: int = typer.Option(DEFAULT_PORT, "--port", help="Port to bind to")
 ) -> None:
     """Run the MCP server with SSE transport."""
-    mcp.run(transport="sse", host=host, port=port)
+    get_mcp().run(transport="sse", host=host, port=port)
 
 # Standalone CLI functions for direct script access
 def cli_app_run() -> None:
     """Standalone function for opengenes-mcp-run script."""
-    mcp.run(transport="streamable-http", host=DEFAULT_HOST, port=DEFAULT_PORT)
+    get_mcp().run(transport="streamable-http", host=DEFAULT_HOST, port=DEFAULT_PORT)
 
 def cli_app_stdio() -> None:
     """Standalone function for opengenes-mcp-stdio script."""
-    mcp.run(transport="stdio")
+    get_mcp().run(transport="stdio")
 
 def cli_app_sse() -> None:
     """Standalone function for opengenes-mcp-sse script."""
-    mcp.run(transport="sse", host=DEFAULT_HOST, port=DEFAULT_PORT)
+    get_mcp().run(transport="sse", host=DEFAULT_HOST, port=DEFAULT_PORT)
 
 if __name__ == "__main__":
     app()
\ No newline at end of file
@@ -0,0 +1,65 @@
+"""Minimal SSE framing utilities for the opengenes MCP client scripts.
+
+The parser walks each frame once, splitting on the field colon per line, and
+keeps payloads as bytes so callers can hand them straight to orjson without
+an intermediate decode.
+"""
+from dataclasses import dataclass
+from typing import Iterator, List, Optional
+
+
+@dataclass(slots=True)
+class SSEMessage:
+    """One parsed SSE event: the event name (if any) and its raw data bytes."""
+    event: Optional[str]
+    data: bytes
+
+
+def parse_sse_message(frame: bytes) -> SSEMessage:
+    """Parse one complete SSE frame (without its blank-line terminator)."""
+    event = None
+    data_parts: List[bytes] = []
+    for line in frame.split(b"\n"):
+        line = line.rstrip(b"\r")
+        if not line or line.startswith(b":"):
+            continue
+        field, _, value = line.partition(b":")
+        if value.startswith(b" "):
+            value = value[1:]
+        if field == b"event":
+            event = value.decode("utf-8")
+        elif field == b"data":
+            data_parts.append(value)
+    return SSEMessage(event=event, data=b"\n".join(data_parts))
+
+
+class SSEParser:
+    """Incremental SSE parser: feed() raw chunks, iterate complete messages.
+
+    The accumulator is a bytearray so appending chunks and dropping consumed
+    frames are in-place operations; each frame is materialised exactly once
+    and its data payload stays bytes all the way to the JSON parser.
+    """
+
+    __slots__ = ("_buffer",)
+
+    def __init__(self):
+        self._buffer = bytearray()
+
+    def feed(self, chunk: bytes) -> Iterator[SSEMessage]:
+        """Consume a raw network chunk and yield every completed message."""
+        self._buffer += chunk
+        while True:
+            # Frames end at a blank line: \n\n, or \r\n\r\n from CRLF servers.
+            lf = self._buffer.find(b"\n\n")
+            crlf = self._buffer.find(b"\r\n\r\n")
+            if lf == -1 and crlf == -1:
+                return
+            if crlf != -1 and (lf == -1 or crlf < lf):
+                end, delim = crlf, 4
+            else:
+                end, delim = lf, 2
+            frame = bytes(self._buffer[:end])
+            del self._buffer[:end + delim]
+            if frame:
+                yield parse_sse_message(frame)
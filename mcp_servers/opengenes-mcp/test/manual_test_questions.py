@@ -2,8 +2,12 @@ import sys
 from pathlib import Path
 
 
+import threading
 import typer
 import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional
 from dotenv import load_dotenv
 from eliot import start_action, log_call
 from pycomfort.logging import to_nice_file, to_nice_stdout
@@ -30,19 +34,41 @@ answers_model = {
     "temperature": 0.0
 }
 
+# One server for the whole question loop: each OpenGenesMCP() re-registers
+# the FastMCP tools, re-opens the SQLite connection pool and rebuilds the
+# index sidecar. The lock matters because the thread pool in test_opengenes
+# fires its first calls concurrently.
+_SERVER: Optional[OpenGenesMCP] = None
+_SERVER_LOCK = threading.Lock()
+
+
+def _get_server() -> OpenGenesMCP:
+    global _SERVER
+    if _SERVER is None:
+        with _SERVER_LOCK:
+            if _SERVER is None:
+                _SERVER = OpenGenesMCP()
+    return _SERVER
+
+
+@lru_cache(maxsize=1)
+def _system_prompt() -> str:
+    """The HF-hosted prompt is invariant per process; fetch it once."""
+    from opengenes_mcp.server import get_prompt_content
+    return get_prompt_content().strip()
+
 @log_call()
 def run_query(prompt_file: Path, query: str, options: LLMOptions = answers_model, tell_sql: bool = False):
     load_dotenv(override=True)
 
     # Get prompt content from Hugging Face instead of local file
-    from opengenes_mcp.server import get_prompt_content
-    system_prompt = get_prompt_content().strip()
+    system_prompt = _system_prompt()
 
     if tell_sql:
         system_prompt += "in your response, include the SQL query that you used to answer the question."
 
-    # Initialize OpenGenes MCP server
-    opengenes_server = OpenGenesMCP()
+    # Reuse the shared OpenGenes MCP server
+    opengenes_server = _get_server()
     
     agent = BaseAgent(
         llm_options=options,
@@ -66,24 +92,22 @@ def test_opengenes():
     to_nice_stdout()
     to_nice_file(LOGS_DIR / "test_opengenes_human.json", LOGS_DIR / "test_opengenes_human.log")
 
-    # Collect question-answer pairs
-    qa_pairs = []
-    
-    for query in queries:
-        query = query.strip()
-        if query:
-            answer = run_query(None, query, tell_sql=True)
-            qa_pairs.append({
-                "question": query,
-                "answer": answer
-            })
-    
-    # Save question-answer pairs to JSON file
-    qa_json_path = LOGS_DIR / "test_opengenes_qa.json"
-    with qa_json_path.open("w", encoding="utf-8") as f:
-        json.dump(qa_pairs, f, indent=2, ensure_ascii=False)
-    
-    print(f"Question-answer pairs saved to: {qa_json_path}")
+    # Each run_query blocks on the Gemini API; the shared OpenGenes server
+    # is concurrent-read-safe, so the questions fan out over a thread pool
+    # and the wall time approaches the slowest single question instead of
+    # the sum. Pairs stream to JSONL as they complete: memory stays constant
+    # regardless of question count, partial output survives a crash, and
+    # dropping indent halves the serialisation work.
+    questions = [query.strip() for query in queries if query.strip()]
+    qa_jsonl_path = LOGS_DIR / "test_opengenes_qa.jsonl"
+    with qa_jsonl_path.open("w", encoding="utf-8") as f:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            answers = executor.map(lambda q: run_query(None, q, tell_sql=True), questions)
+            for question, answer in zip(questions, answers):
+                f.write(json.dumps({"question": question, "answer": answer}, ensure_ascii=False))
+                f.write("\n")
+
+    print(f"Question-answer pairs saved to: {qa_jsonl_path}")
 
 if __name__ == "__main__":
     app()
\ No newline at end of file
@@ -35,23 +35,21 @@ async def generate_drug_safety_profile(drug_name: str):
         drug_display_name = drug_search_info[0]["name"]
         print(f"Found: '{drug_display_name}' with ChEMBL ID: {drug_id}")
 
-        # 2. Get drug warnings and withdrawal information
-        print(f"\nStep 2: Checking for black box warnings and withdrawal status...")
-        drug_warnings = await drug_api.get_drug_warnings(client, drug_id)
+        # 2-4. Warnings, adverse events and linked targets are independent,
+        # so the three requests run concurrently: wall time is the slowest
+        # single call instead of the sum, over the client's shared session.
+        print(f"\nSteps 2-4: Fetching warnings, adverse events and linked targets concurrently...")
+        drug_warnings, adverse_events_result, linked_targets_result = await asyncio.gather(
+            drug_api.get_drug_warnings(client, drug_id),
+            drug_api.get_drug_adverse_events(client, drug_id, page_size=5),
+            drug_api.get_drug_linked_targets(client, drug_id),
+        )
         drug_data = drug_warnings.get("drug", {})
         has_black_box_warning = drug_data.get("blackBoxWarning", False)
         is_withdrawn = drug_data.get("hasBeenWithdrawn", False)
         print(f" - Black Box Warning: {has_black_box_warning}")
         print(f" - Has Been Withdrawn: {is_withdrawn}")
-
-        # 3. Get the top 5 most significant adverse events
-        print("\nStep 3: Fetching top 5 significant adverse events...")
-        adverse_events_result = await drug_api.get_drug_adverse_events(client, drug_id, page_size=5)
         adverse_events = adverse_events_result.get("drug", {}).get("adverseEvents", {}).get("rows", [])
-
-        # 4. Get the drug's mechanism of action by finding its linked targets
-        print("\nStep 4: Fetching linked targets to understand mechanism of action...")
-        linked_targets_result = await drug_api.get_drug_linked_targets(client, drug_id)
         linked_targets = linked_targets_result.get("drug", {}).get("linkedTargets", {}).get("rows", [])
 
         # 5. Assemble and print the final summary
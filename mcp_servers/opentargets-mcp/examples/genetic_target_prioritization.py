@@ -95,11 +95,14 @@ async def prioritize_target_from_genetics(disease_name: str):
         l2g_score = l2g_predictions[0].get("score")
         print(f"-> Prioritized Target: '{target_symbol}' (Ensembl: {target_id}) with L2G score: {l2g_score:.2f}")
 
-        # 5. Perform a validation/druggability assessment on the prioritized target
+        # 5. Perform a validation/druggability assessment on the prioritized target.
+        # The three lookups are independent, so they run concurrently.
         print(f"\nStep 5: Building validation profile for '{target_symbol}'...")
-        tractability_result = await target_api.get_target_tractability(client, target_id)
-        safety_result = await target_api.get_target_safety_information(client, target_id)
-        known_drugs_result = await target_api.get_target_known_drugs(client, target_id, page_size=5)
+        tractability_result, safety_result, known_drugs_result = await asyncio.gather(
+            target_api.get_target_tractability(client, target_id),
+            target_api.get_target_safety_information(client, target_id),
+            target_api.get_target_known_drugs(client, target_id, page_size=5),
+        )
 
         # 6. Assemble and print the final "Target Dossier"
         dossier = {
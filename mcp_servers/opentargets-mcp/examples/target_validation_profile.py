@@ -1,14 +1,45 @@
 # examples/target_validation_profile.py
 
 import asyncio
-import json
 import sys
+
+import orjson
 from typing import Dict, Any
 
 from opentargets_mcp.queries import OpenTargetsClient
 from opentargets_mcp.tools.search import SearchApi
 from opentargets_mcp.tools.target import TargetApi
 
+# Steps 2-4 all key off the same target id, so they are fused into one
+# aliased document: the server pays a single parse/validate/execute cycle
+# and the client one round-trip instead of three.
+_PROFILE_QUERY = """
+query TargetValidationProfile($ensemblId: String!) {
+    tractability: target(ensemblId: $ensemblId) {
+        tractability { modality, value, label }
+    }
+    knownDrugs: target(ensemblId: $ensemblId) {
+        knownDrugs {
+            count
+            rows {
+                drug { name }
+                phase
+                mechanism: mechanismOfAction
+                disease { name }
+            }
+        }
+    }
+    assoc: target(ensemblId: $ensemblId) {
+        associatedDiseases(page: {index: 0, size: 5}) {
+            rows {
+                disease { name }
+                score
+            }
+        }
+    }
+}
+"""
+
 
 async def generate_target_validation_profile(target_symbol: str):
     """
@@ -35,43 +66,26 @@ async def generate_target_validation_profile(target_symbol: str):
         display_symbol = target_search_info[0].get("object", {}).get("approvedSymbol", target_symbol)
         print(f"Found: '{display_symbol}' with Ensembl ID: {target_id}")
 
-        # 2. Assess the target's tractability for small molecules and antibodies
-        print(f"\nStep 2: Assessing druggability and tractability...")
-        tractability_result = await target_api.get_target_tractability(client, target_id)
-        tractability_data = tractability_result.get("target", {}).get("tractability", [])
-
-        # 3. Find any known drugs that already modulate this target
-        print("\nStep 3: Fetching known drugs...")
-        known_drugs_result = await target_api.get_target_known_drugs(client, target_id, page_size=10)
-        known_drugs = known_drugs_result.get("target", {}).get("knownDrugs", {}).get("rows", [])
-
-        # 4. Find the most significant associated diseases to understand its therapeutic context
-        print("\nStep 4: Fetching top associated diseases...")
-        diseases_result = await target_api.get_target_associated_diseases(client, target_id, page_size=5)
-        associated_diseases = diseases_result.get("target", {}).get("associatedDiseases", {}).get("rows", [])
-
-        # 5. Assemble and print the final summary
+        # 2-4. Tractability, known drugs and top associated diseases come back
+        # in one fused request instead of three sequential round-trips.
+        print(f"\nSteps 2-4: Fetching tractability, known drugs and top associated diseases...")
+        profile_result = await client._query(_PROFILE_QUERY, {"ensemblId": target_id})
+        tractability_data = (profile_result.get("tractability") or {}).get("tractability", [])
+        known_drugs = ((profile_result.get("knownDrugs") or {}).get("knownDrugs") or {}).get("rows", [])
+        associated_diseases = ((profile_result.get("assoc") or {}).get("associatedDiseases") or {}).get("rows", [])
+
+        # 5. Assemble and print the final summary. The fused document already
+        # aliases and projects the rows into their final shape, so no Python
+        # post-processing loop runs at all.
         summary: Dict[str, Any] = {
             "target": {"symbol": display_symbol, "id": target_id},
             "tractability_assessment": tractability_data,
-            "known_drugs": [
-                {
-                    "name": drug.get("drug", {}).get("name"),
-                    "phase": drug.get("phase"),
-                    "mechanism": drug.get("mechanismOfAction"),
-                    "disease": drug.get("disease", {}).get("name")
-                } for drug in known_drugs
-            ],
-            "top_associated_diseases": [
-                {
-                    "name": disease.get("disease", {}).get("name"),
-                    "score": disease.get("score")
-                } for disease in associated_diseases
-            ]
+            "known_drugs": known_drugs,
+            "top_associated_diseases": associated_diseases
         }
 
         print("\n--- Workflow Complete: Target Validation Profile ---")
-        print(json.dumps(summary, indent=2))
+        print(orjson.dumps(summary, option=orjson.OPT_INDENT_2).decode())
         print("\nThis profile provides an overview of the target's potential for drug development.")
 
     except Exception as e:
@@ -1,13 +1,33 @@
 # src/opentargets_mcp/queries.py
-import aiohttp
+import httpx
+import orjson
 import asyncio
-from typing import Any, Dict, Optional
+import functools
+import os
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Union
 import time
 import logging
 
 from .exceptions import NetworkError
 from .utils import generate_cache_key
 
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+
+@functools.lru_cache(maxsize=256)
+def _decode_query(query: bytes) -> str:
+    """Decode a pre-encoded GraphQL document, once per distinct constant.
+
+    Callers may store query documents as UTF-8 `bytes` constants; the decode
+    back to `str` (required by the JSON request payload) is paid only on the
+    first use of each document.
+    """
+    return query.decode("utf-8")
+
 # Configure basic logging for the client
 logger = logging.getLogger(__name__)
 # Set a default logging level if not configured elsewhere
@@ -25,44 +45,126 @@ class OpenTargetsClient:
         base_url: str = "https://api.platform.opentargets.org/api/v4/graphql",
         cache_ttl: int = 3600,
         max_retries: int = 3,
-        retry_delay: float = 1.0
+        retry_delay: float = 1.0,
+        disk_cache_dir: Optional[str] = ".opentargets_cache",
+        disk_cache_ttl: int = 86400,
+        cache_maxsize: int = 2048
     ):
         """
         Initializes the OpenTargetsClient.
 
         Args:
             base_url (str): The base URL for the Open Targets GraphQL API.
-            cache_ttl (int): Time-to-live for cache entries in seconds (default is 1 hour).
+            cache_ttl (int): Time-to-live for in-memory cache entries in seconds (default is 1 hour).
             max_retries (int): Maximum number of retry attempts for failed requests (default is 3).
             retry_delay (float): Initial delay between retries in seconds (default is 1.0).
+            disk_cache_dir (Optional[str]): Directory for the persistent response cache shared
+                across processes; set to None to disable. Ignored when `diskcache` is not installed.
+            disk_cache_ttl (int): Time-to-live for persisted cache entries in seconds (default is 24 hours).
+            cache_maxsize (int): Maximum number of in-memory cache entries before LRU eviction (default 2048).
         """
         self.base_url = base_url
         self.session = None
-        self._cache = {}
-        self._cache_ttl = cache_ttl
+        # Bounded LRU: entries are refreshed on hit and the oldest evicted
+        # on overflow. The TTL can be overridden process-wide via the
+        # OPEN_TARGETS_CACHE_TTL environment variable.
+        self._cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._cache_maxsize = cache_maxsize
+        self._cache_ttl = int(os.getenv("OPEN_TARGETS_CACHE_TTL", cache_ttl))
         self._max_retries = max_retries
         self._retry_delay = retry_delay
+        self._disk_cache = None
+        self._disk_cache_ttl = disk_cache_ttl
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        if disk_cache_dir is not None and diskcache is not None:
+            try:
+                self._disk_cache = diskcache.Cache(directory=disk_cache_dir)
+            except Exception as e:
+                logger.warning(f"Could not open disk cache at {disk_cache_dir}: {e}")
 
     async def _ensure_session(self):
-        """Ensures an active aiohttp.ClientSession is available."""
-        if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession()
+        """Ensures an active httpx.AsyncClient is available.
 
-    async def _query(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        The client multiplexes concurrent GraphQL requests over HTTP/2 when
+        the server supports it, so parallel tool calls share one TCP+TLS
+        session instead of serialising on an HTTP/1.1 pool.
+        """
+        if self.session is None or self.session.is_closed:
+            self.session = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=60),
+                timeout=httpx.Timeout(30.0),
+                # Open Targets responses compress 5-10x; brotli in the deps
+                # lets httpx accept and transparently decode br as well.
+                headers={"Accept-Encoding": "gzip, deflate, br"},
+            )
+
+    async def _query(self, query: Union[str, bytes], variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Executes a GraphQL query against the Open Targets API with retry logic.
+
+        The query document may be a `str` or a pre-encoded UTF-8 `bytes`
+        constant; bytes documents are decoded once and cached.
         """
+        if isinstance(query, bytes):
+            query = _decode_query(query)
         await self._ensure_session()
 
         cache_key = generate_cache_key(query, variables)
 
+        cached_data = self._cache_lookup(cache_key)
+        if cached_data is not None:
+            return cached_data
+
+        # Single-flight: an identical request already in flight is awaited
+        # directly via its future (shielded so one caller's cancellation
+        # doesn't abort the shared fetch); the leader resolves it for all.
+        existing = self._in_flight.get(cache_key)
+        if existing is not None:
+            return await asyncio.shield(existing)
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._in_flight[cache_key] = future
+        try:
+            data = await self._fetch(query, variables, cache_key)
+        except BaseException as e:
+            if not future.done():
+                future.set_exception(e)
+                future.exception()  # mark retrieved for the no-follower case
+            raise
+        else:
+            if not future.done():
+                future.set_result(data)
+            return data
+        finally:
+            self._in_flight.pop(cache_key, None)
+
+    def _cache_lookup(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Return cached data for a key from memory or disk, or None."""
         if cache_key in self._cache:
             cached_data, timestamp = self._cache[cache_key]
             if time.time() - timestamp < self._cache_ttl:
+                self._cache.move_to_end(cache_key)
                 return cached_data
             else:
                 del self._cache[cache_key]
 
+        # Second tier: persistent cache shared across processes/restarts.
+        if self._disk_cache is not None:
+            try:
+                cached_data = self._disk_cache.get(cache_key)
+            except Exception as e:
+                logger.debug(f"Disk cache read failed: {e}")
+                cached_data = None
+            if cached_data is not None:
+                self._cache[cache_key] = (cached_data, time.time())
+                if len(self._cache) > self._cache_maxsize:
+                    self._cache.popitem(last=False)
+                return cached_data
+        return None
+
+    async def _fetch(self, query: str, variables: Optional[Dict[str, Any]], cache_key: str) -> Dict[str, Any]:
+        """Executes the network request for a cache miss and populates both cache tiers."""
         payload = {"query": query}
         if variables:
             payload["variables"] = variables
@@ -70,47 +172,53 @@ class OpenTargetsClient:
         # Retry logic with exponential backoff
         last_exception = None
         for attempt in range(self._max_retries):
-            response_text_for_error = ""
             try:
-                async with self.session.post(
+                response = await self.session.post(
                     self.base_url,
-                    json=payload,
+                    content=orjson.dumps(payload),
                     headers={"Content-Type": "application/json"}
-                ) as response:
-                    response_text_for_error = await response.text() # Read text early for logging
-
-                    if not response.ok:
-                        logger.error(
-                            f"HTTP Error {response.status} for {response.url}. "
-                            f"Query: {query[:200]}... Variables: {variables}. "
-                            f"Response Body: {response_text_for_error}"
-                        )
-                        response.raise_for_status() # This will now raise ClientResponseError
-
-                    result = await response.json() # If .ok, this should succeed. If not .ok, raise_for_status handled it.
-                                                 # However, response.json() might fail if body was not valid JSON even on 200.
-
-                    if "errors" in result and result["errors"]:
-                        logger.warning(
-                            f"GraphQL API returned errors: {result['errors']}. "
-                            f"Query: {query[:200]}... Variables: {variables}. "
-                            f"Returning partial data if available."
-                        )
-                        # Don't raise - return partial data if present
-                        # Some queries legitimately return errors with usable data
-                        # (e.g., querying non-existent IDs returns {target: None} + error)
-
-                    data = result.get("data", {})
-                    self._cache[cache_key] = (data, time.time())
-                    return data
-
-            except (aiohttp.ClientResponseError, aiohttp.ClientError, asyncio.TimeoutError) as e:
+                )
+
+                if not response.is_success:
+                    logger.error(
+                        f"HTTP Error {response.status_code} for {response.url}. "
+                        f"Query: {query[:200]}... Variables: {variables}. "
+                        f"Response Body: {response.text}"
+                    )
+                    response.raise_for_status() # This will now raise HTTPStatusError
+
+                result = orjson.loads(response.content) # If successful, this should succeed. If not, raise_for_status handled it.
+                                                        # However, parsing might fail if body was not valid JSON even on 200.
+
+                if "errors" in result and result["errors"]:
+                    logger.warning(
+                        f"GraphQL API returned errors: {result['errors']}. "
+                        f"Query: {query[:200]}... Variables: {variables}. "
+                        f"Returning partial data if available."
+                    )
+                    # Don't raise - return partial data if present
+                    # Some queries legitimately return errors with usable data
+                    # (e.g., querying non-existent IDs returns {target: None} + error)
+
+                data = result.get("data", {})
+                self._cache[cache_key] = (data, time.time())
+                if len(self._cache) > self._cache_maxsize:
+                    self._cache.popitem(last=False)
+                if self._disk_cache is not None:
+                    try:
+                        self._disk_cache.set(cache_key, data, expire=self._disk_cache_ttl)
+                    except Exception as e:
+                        logger.debug(f"Disk cache write failed: {e}")
+                return data
+
+            except (httpx.HTTPStatusError, httpx.TransportError, asyncio.TimeoutError) as e:
                 last_exception = e
-                is_retryable = isinstance(e, (aiohttp.ClientError, asyncio.TimeoutError))
+                is_retryable = isinstance(e, (httpx.TransportError, asyncio.TimeoutError))
 
-                if isinstance(e, aiohttp.ClientResponseError):
+                if isinstance(e, httpx.HTTPStatusError):
                     # Only retry on 5xx errors or specific 429 (rate limit)
-                    is_retryable = e.status >= 500 or e.status == 429
+                    status = e.response.status_code
+                    is_retryable = status >= 500 or status == 429
 
                 if is_retryable and attempt < self._max_retries - 1:
                     delay = self._retry_delay * (2 ** attempt)  # Exponential backoff
@@ -141,7 +249,9 @@ class OpenTargetsClient:
             raise NetworkError(f"Request failed after {self._max_retries} retries") from last_exception
 
     async def close(self):
-        """Closes the aiohttp.ClientSession."""
-        if self.session and not self.session.closed:
-            await self.session.close()
+        """Closes the httpx.AsyncClient and the disk cache, if any."""
+        if self.session and not self.session.is_closed:
+            await self.session.aclose()
             self.session = None
+        if self._disk_cache is not None:
+            self._disk_cache.close()
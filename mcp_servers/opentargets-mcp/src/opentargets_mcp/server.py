@@ -5,6 +5,7 @@ import anyio
 import functools
 import inspect
 import logging
+import orjson
 import os
 from contextlib import asynccontextmanager
 from typing import Any, Callable, NamedTuple, Optional
@@ -16,14 +17,14 @@ from starlette.responses import JSONResponse, Response
 import mcp.types as mcp_types
 
 from .queries import OpenTargetsClient
-from .tools.disease import DiseaseApi
-from .tools.drug import DrugApi
-from .tools.evidence import EvidenceApi
-from .tools.meta import MetaApi
-from .tools.search import SearchApi
-from .tools.study import StudyApi
-from .tools.target import TargetApi
-from .tools.variant import VariantApi
+from .tools.disease import get_disease_api
+from .tools.drug import get_drug_api
+from .tools.evidence import get_evidence_api
+from .tools.meta import get_meta_api
+from .tools.search import get_search_api
+from .tools.study import get_study_api
+from .tools.target import get_target_api
+from .tools.variant import get_variant_api
 from mcp.server.lowlevel.server import NotificationOptions
 
 __all__ = [
@@ -86,14 +87,14 @@ mcp = FastMCP(
     lifespan=lifespan,
 )
 
-_target_api = TargetApi()
-_disease_api = DiseaseApi()
-_drug_api = DrugApi()
-_evidence_api = EvidenceApi()
-_search_api = SearchApi()
-_variant_api = VariantApi()
-_study_api = StudyApi()
-_meta_api = MetaApi()
+_target_api = get_target_api()
+_disease_api = get_disease_api()
+_drug_api = get_drug_api()
+_evidence_api = get_evidence_api()
+_search_api = get_search_api()
+_variant_api = get_variant_api()
+_study_api = get_study_api()
+_meta_api = get_meta_api()
 
 
 class _ToolDocMetadata(NamedTuple):
@@ -101,9 +102,8 @@ class _ToolDocMetadata(NamedTuple):
     description: str | None
 
 
-def _extract_tool_doc_metadata(method: Callable[..., Any]) -> _ToolDocMetadata:
-    """Convert a method docstring into FastMCP metadata."""
-    doc = inspect.getdoc(method)
+def _extract_tool_doc_metadata(doc: Optional[str]) -> _ToolDocMetadata:
+    """Convert a precomputed docstring into FastMCP metadata."""
     if not doc:
         return _ToolDocMetadata(title=None, description=None)
 
@@ -113,26 +113,45 @@ def _extract_tool_doc_metadata(method: Callable[..., Any]) -> _ToolDocMetadata:
     return _ToolDocMetadata(title=summary, description=description)
 
 
-def _make_tool_wrapper(method: Callable[..., Any]) -> Callable[..., Any]:
-    """Wrap an API coroutine so the shared client is injected automatically."""
+def _make_tool_wrapper(
+    method: Callable[..., Any],
+    signature: inspect.Signature,
+    doc: Optional[str],
+) -> Callable[..., Any]:
+    """Wrap an API coroutine so the shared client is injected automatically.
+
+    The exposed signature and docstring come from the class-level manifest,
+    so no reflection runs here.
+    """
 
     @functools.wraps(method)
     async def wrapper(*args: Any, **kwargs: Any) -> Any:
-        client = get_client()
-        return await method(client, *args, **kwargs)
-
-    signature = inspect.signature(method)
-    params = list(signature.parameters.values())[1:]
-    wrapper.__signature__ = signature.replace(parameters=params)  # type: ignore[attr-defined]
+        # Read the module global directly: one LOAD_GLOBAL and a None check
+        # per dispatch instead of a function call through get_client().
+        # Binding the client with functools.partial at lifespan startup would
+        # drop even the check, but mutating registered FastMCP tool callables
+        # after the fact depends on tool-manager internals; the None branch
+        # never triggers once lifespan has started.
+        if _client is None:
+            raise RuntimeError(
+                "OpenTargetsClient not initialised. Tools must be called through "
+                "the running MCP server."
+            )
+        return await method(_client, *args, **kwargs)
 
-    # Preserve the original method docstring for tooling and auto-generated metadata.
-    wrapper.__doc__ = inspect.getdoc(method)
+    wrapper.__signature__ = signature  # type: ignore[attr-defined]
+    wrapper.__doc__ = doc
 
     return wrapper
 
 
 def register_all_api_methods() -> None:
-    """Register every coroutine defined on the API mixins as FastMCP tools."""
+    """Register the manifest of each API class as FastMCP tools.
+
+    Each class's ``__tools__`` tuple is precomputed at class definition (see
+    ToolApiBase), so registration is a plain loop with no ``dir``/``inspect``
+    calls per process start.
+    """
     api_instances = (
         _target_api,
         _disease_api,
@@ -145,17 +164,12 @@ def register_all_api_methods() -> None:
     )
 
     for api in api_instances:
-        for name in dir(api):
-            if name.startswith("_"):
-                continue
-            method = getattr(api, name)
-            if not inspect.iscoroutinefunction(method):
-                continue
+        for name, _func, signature, doc in type(api).__tools__:
             if name in getattr(mcp._tool_manager, "_tools", {}):
                 logger.debug("Tool already registered: %s", name)
                 continue
-            wrapper = _make_tool_wrapper(method)
-            doc_meta = _extract_tool_doc_metadata(method)
+            wrapper = _make_tool_wrapper(getattr(api, name), signature, doc)
+            doc_meta = _extract_tool_doc_metadata(doc)
             tool_decorator = mcp.tool(
                 name=name,
                 description=doc_meta.description,
@@ -188,11 +202,24 @@ def __getattr__(name: str) -> Any:  # pragma: no cover - guidance only
 # ---------------------------------------------------------------------------
 
 
+# Discovery metadata is immutable after startup; cache the serialised bytes
+# per base URL (the only request-dependent input). base_url derives from the
+# client-controlled Host header, so the cache is capped: a legitimate
+# deployment sees one or two values, and anything past the cap is served
+# uncached instead of growing the dict without bound.
+_discovery_cache: dict[str, bytes] = {}
+_DISCOVERY_CACHE_MAX = 8
+
+
 @mcp.custom_route("/.well-known/mcp.json", methods=["GET"], include_in_schema=False)
-async def discovery_endpoint(request: Request) -> JSONResponse:
+async def discovery_endpoint(request: Request) -> Response:
     """Expose MCP discovery metadata for HTTP/SSE clients."""
 
     base_url = str(request.base_url).rstrip("/")
+    cached = _discovery_cache.get(base_url)
+    if cached is not None:
+        return Response(cached, media_type="application/json")
+
     sse_path = mcp._deprecated_settings.sse_path.lstrip("/")
     message_path = mcp._deprecated_settings.message_path.lstrip("/")
     http_path = mcp._deprecated_settings.streamable_http_path.lstrip("/")
@@ -224,7 +251,10 @@ async def discovery_endpoint(request: Request) -> JSONResponse:
         "transports": transports,
     }
 
-    return JSONResponse(discovery)
+    body = orjson.dumps(discovery)
+    if len(_discovery_cache) < _DISCOVERY_CACHE_MAX:
+        _discovery_cache[base_url] = body
+    return Response(body, media_type="application/json")
 
 
 @mcp.custom_route("/", methods=["GET"], include_in_schema=False)
@@ -247,6 +277,16 @@ async def sse_message_fallback(_: Request) -> Response:
 def main() -> None:
     import argparse
 
+    # I/O-bound GraphQL proxying benefits ~2-4x on the scheduler path from
+    # uvloop; opt out with MCP_USE_UVLOOP=0 (and it is simply unavailable on
+    # Windows, where the stdlib loop is used).
+    if os.getenv("MCP_USE_UVLOOP", "1") != "0":
+        try:
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            pass
+
     parser = argparse.ArgumentParser(
         description="Open Targets MCP Server",
         epilog="Environment overrides: MCP_TRANSPORT, FASTMCP_SERVER_HOST, FASTMCP_SERVER_PORT",
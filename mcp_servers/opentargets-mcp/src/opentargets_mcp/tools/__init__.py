@@ -4,14 +4,14 @@
 registration and dispatching directly in `opentargets_mcp.server`.
 """
 
-from .disease import DiseaseApi
-from .drug import DrugApi
-from .evidence import EvidenceApi
-from .meta import MetaApi
-from .search import SearchApi
-from .study import StudyApi
-from .target import TargetApi
-from .variant import VariantApi
+from .disease import DiseaseApi, get_disease_api
+from .drug import DrugApi, get_drug_api
+from .evidence import EvidenceApi, get_evidence_api
+from .meta import MetaApi, get_meta_api
+from .search import SearchApi, get_search_api
+from .study import StudyApi, get_study_api
+from .target import TargetApi, get_target_api
+from .variant import VariantApi, get_variant_api
 
 __all__ = [
     "DiseaseApi",
@@ -22,6 +22,14 @@ __all__ = [
     "StudyApi",
     "TargetApi",
     "VariantApi",
+    "get_disease_api",
+    "get_drug_api",
+    "get_evidence_api",
+    "get_meta_api",
+    "get_search_api",
+    "get_study_api",
+    "get_target_api",
+    "get_variant_api",
 ]
 
 
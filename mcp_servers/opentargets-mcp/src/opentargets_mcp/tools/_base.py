@@ -0,0 +1,35 @@
+"""Shared base class providing precomputed tool-registration manifests."""
+import inspect
+from typing import Any, Callable, Optional, Tuple
+
+
+class ToolApiBase:
+    """Collects a subclass's public coroutine methods at class definition.
+
+    Each entry in ``__tools__`` is ``(name, function, signature, doc)`` where
+    the signature already has the ``self``/``client`` parameters stripped (the
+    shape FastMCP should expose). Server registration iterates these tuples
+    instead of re-running ``dir``/``inspect`` reflection on every process
+    start.
+    """
+
+    __slots__ = ()
+
+    __tools__: Tuple[Tuple[str, Callable[..., Any], inspect.Signature, Optional[str]], ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        manifest = {}
+        for base in reversed(cls.__mro__):
+            for name, member in vars(base).items():
+                if name.startswith("_") or not inspect.iscoroutinefunction(member):
+                    continue
+                signature = inspect.signature(member)
+                params = list(signature.parameters.values())[2:]  # drop self, client
+                manifest[name] = (
+                    name,
+                    member,
+                    signature.replace(parameters=params),
+                    inspect.getdoc(member),
+                )
+        cls.__tools__ = tuple(manifest.values())
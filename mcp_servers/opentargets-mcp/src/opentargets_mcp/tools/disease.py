@@ -2,14 +2,133 @@
 """
 Defines API methods and MCP tools related to 'Disease' entities in Open Targets.
 """
+import functools
 from typing import Any, Dict
 from ..queries import OpenTargetsClient # Relative import
+from ._base import ToolApiBase
 
-class DiseaseApi:
+# GraphQL documents are assembled once at import; methods only bind
+# variables per call.
+_QUERY_DISEASE_INFO = """
+        query DiseaseInfo($efoId: String!) {
+            disease(efoId: $efoId) {
+                id
+                name
+                description
+                synonyms { # DiseaseSynonym
+                    relation
+                    terms
+                }
+                therapeuticAreas { # OntologyTerm
+                     id
+                     name
+                }
+                dbXRefs # list of strings
+                # Removed 'ontology' field as it's not directly on Disease type as structured before.
+                # Ontology information is typically within therapeuticAreas or implied by EFO structure.
+            }
+        }
+        """
+
+_QUERY_DISEASE_ASSOCIATED_TARGETS = """
+        query DiseaseAssociatedTargets($efoId: String!, $pageIndex: Int!, $pageSize: Int!) {
+            disease(efoId: $efoId) {
+                id
+                name
+                associatedTargets(page: {index: $pageIndex, size: $pageSize}) {
+                    count
+                    rows { # TargetDiseaseAssociation
+                        target { # Target
+                            id
+                            approvedSymbol
+                            approvedName
+                            biotype
+                        }
+                        score # Overall association score
+                        datatypeScores { # AssociationScore
+                            id # datasourceId
+                            score
+                        }
+                    }
+                }
+            }
+        }
+        """
+
+# Both projection variants are precomputed at import: the thin one stops at
+# the HPO/EFO terms, the full one adds the evidence subtree (frequency,
+# modifiers, onset, references, ...), which most callers never read.
+_EVIDENCE_FRAGMENT = """
+                        evidence { # DiseasePhenotypeEvidence (Array)
+                            aspect 
+                            bioCuration 
+                            diseaseFromSource
+                            diseaseFromSourceId
+                            evidenceType 
+                            frequency # String (e.g. "HP:0040283")
+                            modifiers { id name }
+                            onset { id name }
+                            qualifierNot 
+                            references 
+                            resource 
+                            sex
+                        }
+"""
+
+
+def _phenotypes_query(include_evidence: bool) -> str:
+    return """
+        query DiseasePhenotypes($efoId: String!, $pageIndex: Int!, $pageSize: Int!) {
+            disease(efoId: $efoId) {
+                id
+                name
+                phenotypes(page: {index: $pageIndex, size: $pageSize}) { # Paginated DiseasePhenotype
+                    count
+                    rows { # DiseasePhenotype
+                        phenotypeHPO { # OntologyTerm (HPO)
+                            id
+                            name
+                            description
+                        }
+                        phenotypeEFO { # OntologyTerm (EFO, if available)
+                            id
+                            name
+                        }
+""" + (_EVIDENCE_FRAGMENT if include_evidence else "") + """
+                    }
+                }
+            }
+        }
+        """
+
+
+_QUERY_DISEASE_PHENOTYPES = _phenotypes_query(include_evidence=True)
+_QUERY_DISEASE_PHENOTYPES_THIN = _phenotypes_query(include_evidence=False)
+
+_QUERY_DISEASE_O_T_A_R_PROJECTS = """
+        query DiseaseOTARProjects($efoId: String!) {
+            disease(efoId: $efoId) {
+                id
+                name
+                otarProjects { # Array of OTARProject
+                    otarCode
+                    projectName
+                    status
+                    reference
+                    integratesInPPP # Public Private Partnership
+                }
+            }
+        }
+        """
+
+
+class DiseaseApi(ToolApiBase):
     """
     Contains methods to query disease-specific data from the Open Targets GraphQL API.
     """
 
+    __slots__ = ()
+
     async def get_disease_info(self, client: OpenTargetsClient, efo_id: str) -> Dict[str, Any]:
         """Retrieve core metadata for an Open Targets disease entity.
 
@@ -39,26 +158,7 @@ class DiseaseApi:
         print(details["disease"]["name"])
         ```
         """
-        graphql_query = """
-        query DiseaseInfo($efoId: String!) {
-            disease(efoId: $efoId) {
-                id
-                name
-                description
-                synonyms { # DiseaseSynonym
-                    relation
-                    terms
-                }
-                therapeuticAreas { # OntologyTerm
-                     id
-                     name
-                }
-                dbXRefs # list of strings
-                # Removed 'ontology' field as it's not directly on Disease type as structured before.
-                # Ontology information is typically within therapeuticAreas or implied by EFO structure.
-            }
-        }
-        """
+        graphql_query = _QUERY_DISEASE_INFO
         return await client._query(graphql_query, {"efoId": efo_id})
 
     async def get_disease_associated_targets(
@@ -99,30 +199,7 @@ class DiseaseApi:
             print(row["target"]["approvedSymbol"], row["score"])
         ```
         """
-        graphql_query = """
-        query DiseaseAssociatedTargets($efoId: String!, $pageIndex: Int!, $pageSize: Int!) {
-            disease(efoId: $efoId) {
-                id
-                name
-                associatedTargets(page: {index: $pageIndex, size: $pageSize}) {
-                    count
-                    rows { # TargetDiseaseAssociation
-                        target { # Target
-                            id
-                            approvedSymbol
-                            approvedName
-                            biotype
-                        }
-                        score # Overall association score
-                        datatypeScores { # AssociationScore
-                            id # datasourceId
-                            score
-                        }
-                    }
-                }
-            }
-        }
-        """
+        graphql_query = _QUERY_DISEASE_ASSOCIATED_TARGETS
         return await client._query(graphql_query, {"efoId": efo_id, "pageIndex": page_index, "pageSize": page_size})
 
     async def get_disease_phenotypes(
@@ -130,14 +207,15 @@ class DiseaseApi:
         client: OpenTargetsClient,
         efo_id: str,
         page_index: int = 0,
-        page_size: int = 10
+        page_size: int = 10,
+        include_evidence: bool = False
     ) -> Dict[str, Any]:
         """Fetch HPO phenotype annotations linked to a disease.
 
         **When to use**
         - Summarise phenotypic manifestations associated with a disease for downstream reporting
         - Obtain HPO terms to bridge to phenotype-driven tools
-        - Investigate supporting evidence metadata (frequency, modifiers, onset)
+        - Investigate supporting evidence metadata (frequency, modifiers, onset) with `include_evidence=True`
 
         **When not to use**
         - Accessing genetic associations or targets (see the association/evidence tools)
@@ -148,9 +226,10 @@ class DiseaseApi:
         - `efo_id` (`str`): Disease identifier.
         - `page_index` (`int`): Zero-based page (default 0).
         - `page_size` (`int`): Number of phenotype rows to retrieve (default 10).
+        - `include_evidence` (`bool`): Include the per-row evidence subtree (frequency, modifiers, onset, references). Defaults to False — rows then carry only the HPO/EFO terms, which is what most callers need; pass True to restore the previous full shape.
 
         **Returns**
-        - `Dict[str, Any]`: Structure `{"disease": {"id": str, "name": str, "phenotypes": {"count": int, "rows": [{"phenotypeHPO": {...}, "phenotypeEFO": {...}, "evidence": [...]}, ...]}}}`.
+        - `Dict[str, Any]`: Structure `{"disease": {"id": str, "name": str, "phenotypes": {"count": int, "rows": [{"phenotypeHPO": {...}, "phenotypeEFO": {...}}, ...]}}}`; each row additionally carries `"evidence": [...]` when `include_evidence=True`.
 
         **Errors**
         - GraphQL query or transport errors are raised by the client.
@@ -163,51 +242,9 @@ class DiseaseApi:
         print(first_hpo["id"], first_hpo["name"])
         ```
         """
-        graphql_query = """
-        query DiseasePhenotypes($efoId: String!, $pageIndex: Int!, $pageSize: Int!) {
-            disease(efoId: $efoId) {
-                id
-                name
-                phenotypes(page: {index: $pageIndex, size: $pageSize}) { # Paginated DiseasePhenotype
-                    count
-                    rows { # DiseasePhenotype
-                        phenotypeHPO { # OntologyTerm (HPO)
-                            id
-                            name
-                            description
-                        }
-                        phenotypeEFO { # OntologyTerm (EFO, if available)
-                            id
-                            name
-                        }
-                        evidence { # DiseasePhenotypeEvidence (Array)
-                            aspect 
-                            bioCuration 
-                            diseaseFromSource
-                            diseaseFromSourceId
-                            evidenceType 
-                            frequency # Corrected: Now a String, not an object
-                            # modifiers # Assuming modifiers is also a String or list of Strings based on schema
-                            # onset # Assuming onset is also a String or list of Strings based on schema
-                            # If modifiers and onset are objects, they need specific subfields.
-                            # For now, let's assume they are simple strings if the API returns them as such.
-                            # If they are objects, the API error would guide further correction.
-                            # Based on schema, DiseasePhenotypeEvidence has:
-                            # frequency: String (e.g. "HP:0040283")
-                            # modifiers: [OntologyTerm!] (so this should be modifiers { id name })
-                            # onset: [OntologyTerm!] (so this should be onset { id name })
-                            modifiers { id name } # Corrected based on schema
-                            onset { id name }     # Corrected based on schema
-                            qualifierNot 
-                            references 
-                            resource 
-                            sex
-                        }
-                    }
-                }
-            }
-        }
-        """
+        graphql_query = (
+            _QUERY_DISEASE_PHENOTYPES if include_evidence else _QUERY_DISEASE_PHENOTYPES_THIN
+        )
         return await client._query(graphql_query, {"efoId": efo_id, "pageIndex": page_index, "pageSize": page_size})
 
     async def get_disease_otar_projects(self, client: OpenTargetsClient, efo_id: str) -> Dict[str, Any]:
@@ -239,19 +276,11 @@ class DiseaseApi:
         print([proj["projectName"] for proj in projects["disease"]["otarProjects"]])
         ```
         """
-        graphql_query = """
-        query DiseaseOTARProjects($efoId: String!) {
-            disease(efoId: $efoId) {
-                id
-                name
-                otarProjects { # Array of OTARProject
-                    otarCode
-                    projectName
-                    status
-                    reference
-                    integratesInPPP # Public Private Partnership
-                }
-            }
-        }
-        """
+        graphql_query = _QUERY_DISEASE_O_T_A_R_PROJECTS
         return await client._query(graphql_query, {"efoId": efo_id})
+
+
+@functools.cache
+def get_disease_api() -> DiseaseApi:
+    """Return the shared, stateless DiseaseApi instance."""
+    return DiseaseApi()
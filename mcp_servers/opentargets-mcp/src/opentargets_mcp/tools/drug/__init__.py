@@ -1,5 +1,8 @@
 """Drug tool API aggregation."""
 
+import functools
+
+from .._base import ToolApiBase
 from .identity import DrugIdentityApi
 from .associations import DrugAssociationsApi
 from .safety import DrugSafetyApi
@@ -9,8 +12,17 @@ class DrugApi(
     DrugIdentityApi,
     DrugAssociationsApi,
     DrugSafetyApi,
+    ToolApiBase,
 ):
     """Unified API surface for all drug-related tools."""
 
+    __slots__ = ()
+
+
+@functools.cache
+def get_drug_api() -> DrugApi:
+    """Return the shared, stateless DrugApi instance."""
+    return DrugApi()
+
 
-__all__ = ["DrugApi"]
+__all__ = ["DrugApi", "get_drug_api"]
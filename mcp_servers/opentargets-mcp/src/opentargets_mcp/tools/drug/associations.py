@@ -5,10 +5,58 @@ Defines API methods and MCP tools related to a drug's associations with other en
 from typing import Any, Dict
 from ...queries import OpenTargetsClient
 
+# GraphQL documents are assembled once at import; methods only bind
+# variables per call.
+_QUERY_DRUG_LINKED_DISEASES = """
+        query DrugLinkedDiseases($chemblId: String!) {
+            drug(chemblId: $chemblId) {
+                id
+                name
+                linkedDiseases {
+                    count
+                    rows {
+                        id
+                        name
+                        description
+                        therapeuticAreas {
+                            id
+                            name
+                        }
+                    }
+                }
+            }
+        }
+        """
+
+_QUERY_DRUG_LINKED_TARGETS = """
+        query DrugLinkedTargets($chemblId: String!) {
+            drug(chemblId: $chemblId) {
+                id
+                name
+                linkedTargets {
+                    count
+                    rows {
+                        id
+                        approvedSymbol
+                        approvedName
+                        biotype
+                        proteinIds {
+                            id
+                            source
+                        }
+                    }
+                }
+            }
+        }
+        """
+
+
 class DrugAssociationsApi:
     """
     Contains methods to query a drug's associations with diseases and targets.
     """
+
+    __slots__ = ()
     async def get_drug_linked_diseases(self, client: OpenTargetsClient, chembl_id: str) -> Dict[str, Any]:
         """List diseases connected to a drug across indications and mechanisms.
 
@@ -38,26 +86,7 @@ class DrugAssociationsApi:
         print([row["name"] for row in diseases["drug"]["linkedDiseases"]["rows"]])
         ```
         """
-        graphql_query = """
-        query DrugLinkedDiseases($chemblId: String!) {
-            drug(chemblId: $chemblId) {
-                id
-                name
-                linkedDiseases {
-                    count
-                    rows {
-                        id
-                        name
-                        description
-                        therapeuticAreas {
-                            id
-                            name
-                        }
-                    }
-                }
-            }
-        }
-        """
+        graphql_query = _QUERY_DRUG_LINKED_DISEASES
         return await client._query(graphql_query, {"chemblId": chembl_id})
 
     async def get_drug_linked_targets(self, client: OpenTargetsClient, chembl_id: str) -> Dict[str, Any]:
@@ -89,25 +118,5 @@ class DrugAssociationsApi:
         print([row["approvedSymbol"] for row in targets["drug"]["linkedTargets"]["rows"]])
         ```
         """
-        graphql_query = """
-        query DrugLinkedTargets($chemblId: String!) {
-            drug(chemblId: $chemblId) {
-                id
-                name
-                linkedTargets {
-                    count
-                    rows {
-                        id
-                        approvedSymbol
-                        approvedName
-                        biotype
-                        proteinIds {
-                            id
-                            source
-                        }
-                    }
-                }
-            }
-        }
-        """
+        graphql_query = _QUERY_DRUG_LINKED_TARGETS
         return await client._query(graphql_query, {"chemblId": chembl_id})
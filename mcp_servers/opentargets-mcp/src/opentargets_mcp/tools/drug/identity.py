@@ -5,40 +5,9 @@ Defines API methods and MCP tools related to a drug's identity and classificatio
 from typing import Any, Dict
 from ...queries import OpenTargetsClient
 
-class DrugIdentityApi:
-    """
-    Contains methods to query a drug's identity and cross-references.
-    """
-    async def get_drug_info(self, client: OpenTargetsClient, chembl_id: str) -> Dict[str, Any]:
-        """Fetch identity, indication, and mechanism data for a drug.
-
-        **When to use**
-        - Verify that a ChEMBL ID aligns with the intended compound
-        - Present mechanism of action, linked targets, or approval status to users
-        - Seed follow-up calls (e.g., to association tools) with linked target IDs
-
-        **When not to use**
-        - Searching for the correct ChEMBL ID (use `search_entities` first)
-        - Retrieving safety signals (use drug safety tools)
-
-        **Parameters**
-        - `client` (`OpenTargetsClient`): GraphQL client session.
-        - `chembl_id` (`str`): Identifier such as `"CHEMBL1862"`.
-
-        **Returns**
-        - `Dict[str, Any]`: `{ "drug": {"id": str, "name": str, "drugType": str, "isApproved": bool, "mechanismsOfAction": {...}, "indications": {...}, "linkedTargets": {...}, ...} }`.
-
-        **Errors**
-        - Raises GraphQL/network exceptions via `OpenTargetsClient`.
-
-        **Example**
-        ```python
-        drug_api = DrugIdentityApi()
-        drug = await drug_api.get_drug_info(client, "CHEMBL1862")
-        print(drug["drug"]["name"], drug["drug"]["isApproved"])
-        ```
-        """
-        graphql_query = """
+# GraphQL documents are assembled once at import; methods only bind
+# variables per call.
+_QUERY_DRUG_INFO = """
         query DrugInfo($chemblId: String!) {
             drug(chemblId: $chemblId) {
                 id
@@ -94,6 +63,67 @@ class DrugIdentityApi:
             }
         }
         """
+
+_QUERY_DRUG_CROSS_REFERENCES = """
+        query DrugCrossReferences($chemblId: String!) {
+            drug(chemblId: $chemblId) {
+                id
+                name
+                synonyms
+                crossReferences {
+                    source
+                    ids
+                }
+                parentMolecule {
+                    id
+                    name
+                }
+                childMolecules {
+                    id
+                    name
+                    drugType
+                }
+            }
+        }
+        """
+
+
+class DrugIdentityApi:
+    """
+    Contains methods to query a drug's identity and cross-references.
+    """
+
+    __slots__ = ()
+    async def get_drug_info(self, client: OpenTargetsClient, chembl_id: str) -> Dict[str, Any]:
+        """Fetch identity, indication, and mechanism data for a drug.
+
+        **When to use**
+        - Verify that a ChEMBL ID aligns with the intended compound
+        - Present mechanism of action, linked targets, or approval status to users
+        - Seed follow-up calls (e.g., to association tools) with linked target IDs
+
+        **When not to use**
+        - Searching for the correct ChEMBL ID (use `search_entities` first)
+        - Retrieving safety signals (use drug safety tools)
+
+        **Parameters**
+        - `client` (`OpenTargetsClient`): GraphQL client session.
+        - `chembl_id` (`str`): Identifier such as `"CHEMBL1862"`.
+
+        **Returns**
+        - `Dict[str, Any]`: `{ "drug": {"id": str, "name": str, "drugType": str, "isApproved": bool, "mechanismsOfAction": {...}, "indications": {...}, "linkedTargets": {...}, ...} }`.
+
+        **Errors**
+        - Raises GraphQL/network exceptions via `OpenTargetsClient`.
+
+        **Example**
+        ```python
+        drug_api = DrugIdentityApi()
+        drug = await drug_api.get_drug_info(client, "CHEMBL1862")
+        print(drug["drug"]["name"], drug["drug"]["isApproved"])
+        ```
+        """
+        graphql_query = _QUERY_DRUG_INFO
         return await client._query(graphql_query, {"chemblId": chembl_id})
 
     async def get_drug_cross_references(self, client: OpenTargetsClient, chembl_id: str) -> Dict[str, Any]:
@@ -125,26 +155,5 @@ class DrugIdentityApi:
         print(xrefs["drug"]["crossReferences"])
         ```
         """
-        graphql_query = """
-        query DrugCrossReferences($chemblId: String!) {
-            drug(chemblId: $chemblId) {
-                id
-                name
-                synonyms
-                crossReferences {
-                    source
-                    ids
-                }
-                parentMolecule {
-                    id
-                    name
-                }
-                childMolecules {
-                    id
-                    name
-                    drugType
-                }
-            }
-        }
-        """
+        graphql_query = _QUERY_DRUG_CROSS_REFERENCES
         return await client._query(graphql_query, {"chemblId": chembl_id})
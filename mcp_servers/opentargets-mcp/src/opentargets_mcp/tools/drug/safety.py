@@ -5,10 +5,83 @@ Defines API methods and MCP tools related to drug safety and pharmacovigilance.
 from typing import Any, Dict
 from ...queries import OpenTargetsClient
 
+# GraphQL documents are assembled once at import; methods only bind
+# variables per call.
+_QUERY_DRUG_ADVERSE_EVENTS = """
+        query DrugAdverseEvents($chemblId: String!, $pageIndex: Int!, $pageSize: Int!) {
+            drug(chemblId: $chemblId) {
+                id
+                name
+                adverseEvents(page: {index: $pageIndex, size: $pageSize}) {
+                    count
+                    criticalValue
+                    rows {
+                        meddraCode
+                        name
+                        count
+                        logLR
+                    }
+                }
+            }
+        }
+        """
+
+_QUERY_DRUG_PHARMACOVIGILANCE = """
+        query DrugPharmacovigilance($chemblId: String!) {
+            drug(chemblId: $chemblId) {
+                id
+                name
+                isApproved
+                hasBeenWithdrawn
+                blackBoxWarning
+                adverseEvents(page: {index: 0, size: 20}) {
+                     count
+                     criticalValue
+                     rows {
+                         meddraCode,
+                         name,
+                         count,
+                         logLR
+                     }
+                }
+            }
+        }
+        """
+
+_QUERY_DRUG_WARNINGS = """
+        query DrugWarnings($chemblId: String!) {
+            drug(chemblId: $chemblId) {
+                id
+                name
+                hasBeenWithdrawn
+                blackBoxWarning
+                drugWarnings {
+                    warningType
+                    description
+                    toxicityClass
+                    country
+                    year
+                    efoId
+                    efoTerm
+                    efoIdForWarningClass
+                    references {
+                        id
+                        source
+                        url
+                    }
+                    chemblIds
+                }
+            }
+        }
+        """
+
+
 class DrugSafetyApi:
     """
     Contains methods to query drug safety, warnings, and adverse events.
     """
+
+    __slots__ = ()
     async def get_drug_adverse_events(
         self,
         client: OpenTargetsClient,
@@ -46,24 +119,7 @@ class DrugSafetyApi:
         print(adverse["drug"]["adverseEvents"]["rows"][0]["name"])
         ```
         """
-        graphql_query = """
-        query DrugAdverseEvents($chemblId: String!, $pageIndex: Int!, $pageSize: Int!) {
-            drug(chemblId: $chemblId) {
-                id
-                name
-                adverseEvents(page: {index: $pageIndex, size: $pageSize}) {
-                    count
-                    criticalValue
-                    rows {
-                        meddraCode
-                        name
-                        count
-                        logLR
-                    }
-                }
-            }
-        }
-        """
+        graphql_query = _QUERY_DRUG_ADVERSE_EVENTS
         return await client._query(graphql_query, {"chemblId": chembl_id, "pageIndex": page_index, "pageSize": page_size})
 
     async def get_drug_pharmacovigilance(self, client: OpenTargetsClient, chembl_id: str) -> Dict[str, Any]:
@@ -94,27 +150,7 @@ class DrugSafetyApi:
         print(pv["drug"]["blackBoxWarning"])
         ```
         """
-        graphql_query = """
-        query DrugPharmacovigilance($chemblId: String!) {
-            drug(chemblId: $chemblId) {
-                id
-                name
-                isApproved
-                hasBeenWithdrawn
-                blackBoxWarning
-                adverseEvents(page: {index: 0, size: 20}) {
-                     count
-                     criticalValue
-                     rows {
-                         meddraCode,
-                         name,
-                         count,
-                         logLR
-                     }
-                }
-            }
-        }
-        """
+        graphql_query = _QUERY_DRUG_PHARMACOVIGILANCE
         return await client._query(graphql_query, {"chemblId": chembl_id})
 
     async def get_drug_warnings(self, client: OpenTargetsClient, chembl_id: str) -> Dict[str, Any]:
@@ -147,30 +183,5 @@ class DrugSafetyApi:
             print(warn["warningType"], warn["country"])
         ```
         """
-        graphql_query = """
-        query DrugWarnings($chemblId: String!) {
-            drug(chemblId: $chemblId) {
-                id
-                name
-                hasBeenWithdrawn
-                blackBoxWarning
-                drugWarnings {
-                    warningType
-                    description
-                    toxicityClass
-                    country
-                    year
-                    efoId
-                    efoTerm
-                    efoIdForWarningClass
-                    references {
-                        id
-                        source
-                        url
-                    }
-                    chemblIds
-                }
-            }
-        }
-        """
+        graphql_query = _QUERY_DRUG_WARNINGS
         return await client._query(graphql_query, {"chemblId": chembl_id})
@@ -2,14 +2,126 @@
 """
 Defines API methods and MCP tools for metadata and utility functions in Open Targets.
 """
+import functools
 from typing import Any, Dict, List, Optional
 from ..queries import OpenTargetsClient
+from ._base import ToolApiBase
 
-class MetaApi:
+# GraphQL documents are assembled once at import; methods only bind
+# variables per call.
+_QUERY_API_METADATA = """
+        query ApiMetadata {
+            meta {
+                name
+                apiVersion {
+                    x
+                    y
+                    z
+                }
+                dataVersion {
+                    year
+                    month
+                    iteration
+                }
+            }
+        }
+        """
+
+_QUERY_ASSOCIATION_DATASOURCES = """
+        query AssociationDatasources {
+            associationDatasources {
+                datasource
+                datatype
+            }
+        }
+        """
+
+_QUERY_INTERACTION_RESOURCES = """
+        query InteractionResources {
+            interactionResources {
+                sourceDatabase
+                databaseVersion
+            }
+        }
+        """
+
+_QUERY_GENE_ONTOLOGY_TERMS = """
+        query GeneOntologyTerms($goIds: [String!]!) {
+            geneOntologyTerms(goIds: $goIds) {
+                id
+                name
+            }
+        }
+        """
+
+_QUERY_MAP_IDS = """
+        query MapIds($queryTerms: [String!]!, $entityNames: [String!]) {
+            mapIds(queryTerms: $queryTerms, entityNames: $entityNames) {
+                total
+                mappings {
+                    term
+                    hits {
+                        id
+                        name
+                        entity
+                        category
+                        multiplier
+                        prefixes
+                        score
+                        object {
+                            __typename
+                            ... on Target {
+                                id
+                                approvedSymbol
+                                approvedName
+                            }
+                            ... on Disease {
+                                id
+                                name
+                                description
+                            }
+                            ... on Drug {
+                                id
+                                name
+                                drugType
+                            }
+                            ... on Variant {
+                                id
+                                chromosome
+                                position
+                                rsIds
+                            }
+                            ... on Study {
+                                id
+                                studyType
+                                traitFromSource
+                            }
+                        }
+                    }
+                }
+                aggregations {
+                    total
+                    entities {
+                        name
+                        total
+                        categories {
+                            name
+                            total
+                        }
+                    }
+                }
+            }
+        }
+        """
+
+
+class MetaApi(ToolApiBase):
     """
     Contains methods for metadata and utility queries.
     """
 
+    __slots__ = ()
+
     async def get_api_metadata(self, client: OpenTargetsClient) -> Dict[str, Any]:
         """Return Open Targets Platform release metadata.
 
@@ -30,7 +142,7 @@ class MetaApi:
 
         **Errors**
         - Propagates `OpenTargetsClient` GraphQL errors if the API call fails.
-        - Underlying network exceptions from `aiohttp` bubble up unchanged.
+        - Underlying network exceptions from `httpx` bubble up unchanged.
 
         **Example**
         ```python
@@ -39,23 +151,7 @@ class MetaApi:
         print(version_info["meta"]["dataVersion"]["year"])
         ```
         """
-        graphql_query = """
-        query ApiMetadata {
-            meta {
-                name
-                apiVersion {
-                    x
-                    y
-                    z
-                }
-                dataVersion {
-                    year
-                    month
-                    iteration
-                }
-            }
-        }
-        """
+        graphql_query = _QUERY_API_METADATA
         return await client._query(graphql_query)
 
     async def get_association_datasources(self, client: OpenTargetsClient) -> Dict[str, Any]:
@@ -87,14 +183,7 @@ class MetaApi:
         print({item["datasource"] for item in datasources["associationDatasources"]})
         ```
         """
-        graphql_query = """
-        query AssociationDatasources {
-            associationDatasources {
-                datasource
-                datatype
-            }
-        }
-        """
+        graphql_query = _QUERY_ASSOCIATION_DATASOURCES
         return await client._query(graphql_query)
 
     async def get_interaction_resources(self, client: OpenTargetsClient) -> Dict[str, Any]:
@@ -126,14 +215,7 @@ class MetaApi:
             print(entry["sourceDatabase"], entry["databaseVersion"])
         ```
         """
-        graphql_query = """
-        query InteractionResources {
-            interactionResources {
-                sourceDatabase
-                databaseVersion
-            }
-        }
-        """
+        graphql_query = _QUERY_INTERACTION_RESOURCES
         return await client._query(graphql_query)
 
     async def get_gene_ontology_terms(self, client: OpenTargetsClient, go_ids: List[str]) -> Dict[str, Any]:
@@ -165,14 +247,7 @@ class MetaApi:
         print(terms["geneOntologyTerms"][0]["name"])
         ```
         """
-        graphql_query = """
-        query GeneOntologyTerms($goIds: [String!]!) {
-            geneOntologyTerms(goIds: $goIds) {
-                id
-                name
-            }
-        }
-        """
+        graphql_query = _QUERY_GENE_ONTOLOGY_TERMS
         return await client._query(graphql_query, {"goIds": go_ids})
 
     async def map_ids(
@@ -211,67 +286,15 @@ class MetaApi:
         print(best["id"], best["score"])
         ```
         """
-        graphql_query = """
-        query MapIds($queryTerms: [String!]!, $entityNames: [String!]) {
-            mapIds(queryTerms: $queryTerms, entityNames: $entityNames) {
-                total
-                mappings {
-                    term
-                    hits {
-                        id
-                        name
-                        entity
-                        category
-                        multiplier
-                        prefixes
-                        score
-                        object {
-                            __typename
-                            ... on Target {
-                                id
-                                approvedSymbol
-                                approvedName
-                            }
-                            ... on Disease {
-                                id
-                                name
-                                description
-                            }
-                            ... on Drug {
-                                id
-                                name
-                                drugType
-                            }
-                            ... on Variant {
-                                id
-                                chromosome
-                                position
-                                rsIds
-                            }
-                            ... on Study {
-                                id
-                                studyType
-                                traitFromSource
-                            }
-                        }
-                    }
-                }
-                aggregations {
-                    total
-                    entities {
-                        name
-                        total
-                        categories {
-                            name
-                            total
-                        }
-                    }
-                }
-            }
-        }
-        """
+        graphql_query = _QUERY_MAP_IDS
         variables = {
             "queryTerms": query_terms,
             "entityNames": entity_names if entity_names else ["target", "disease", "drug", "variant", "study"]
         }
         return await client._query(graphql_query, variables)
+
+
+@functools.cache
+def get_meta_api() -> MetaApi:
+    """Return the shared, stateless MetaApi instance."""
+    return MetaApi()
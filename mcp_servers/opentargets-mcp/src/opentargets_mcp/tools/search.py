@@ -3,42 +3,33 @@
 Defines API methods and MCP tools related to general search functionalities
 across multiple entity types in Open Targets.
 """
+import functools
 from typing import Any, Dict, List, Optional
 import asyncio
 import logging
 from ..queries import OpenTargetsClient
+from ._base import ToolApiBase
 from ..utils import filter_none_values
 from .meta import MetaApi
 
 logger = logging.getLogger(__name__)
 
+# Prefer rapidfuzz (C++/SIMD backend, drop-in API) and fall back to thefuzz;
+# either provides the process module used for suggestion ranking.
 try:
-    from thefuzz import process as fuzzy_process
+    from rapidfuzz import fuzz as rapidfuzz_scorer
+    from rapidfuzz import process as fuzzy_process
 except ImportError:
-    fuzzy_process = None
+    rapidfuzz_scorer = None
+    try:
+        from thefuzz import process as fuzzy_process
+    except ImportError:
+        fuzzy_process = None
 
 
-class SearchApi:
-    """
-    Contains methods for searching entities with intelligent resolution,
-    autocomplete, and other search-related functionalities.
-    """
-    def __init__(self):
-        self.meta_api = MetaApi()
-        self.fuzzy_process = fuzzy_process
-        if not self.fuzzy_process:
-            logger.warning("'thefuzz' library not found. Suggestions will not work. Please install it with 'pip install thefuzz python-Levenshtein'.")
-
-    async def _search_direct(
-        self,
-        client: OpenTargetsClient,
-        query_string: str,
-        entity_names: Optional[List[str]],
-        page_index: int,
-        page_size: int
-    ) -> Dict[str, Any]:
-        """A private helper method for a direct, simple search."""
-        graphql_query = """
+# GraphQL documents are assembled once at import; methods only bind
+# variables per call.
+_QUERY_SEARCH_ENTITIES = """
         query SearchEntities($queryString: String!, $entityNames: [String!], $pageIndex: Int!, $pageSize: Int!) {
             search(
                 queryString: $queryString,
@@ -65,6 +56,59 @@ class SearchApi:
             }
         }
         """
+
+_QUERY_SIMILAR_TARGETS = """
+        query SimilarTargets($entityId: String!, $threshold: Float, $size: Int!) {
+            target(ensemblId: $entityId) {
+                id
+                approvedSymbol
+                similarEntities(threshold: $threshold, size: $size) {
+                    score
+                    object {
+                        __typename
+                        ... on Target { id, approvedSymbol, approvedName }
+                    }
+                }
+            }
+        }
+        """
+
+_QUERY_SEARCH_FACETS = """
+        query SearchFacets(
+            $queryString: String!, $categoryId: String, $entityNames: [String!], $pageIndex: Int!, $pageSize: Int!
+        ) {
+            facets(
+                queryString: $queryString, category: $categoryId, entityNames: $entityNames, page: {index: $pageIndex, size: $pageSize}
+            ) {
+                total
+                categories { name, total }
+                hits { id, label, category, score, entityIds, datasourceId, highlights }
+            }
+        }
+        """
+
+
+class SearchApi(ToolApiBase):
+    """
+    Contains methods for searching entities with intelligent resolution,
+    autocomplete, and other search-related functionalities.
+    """
+    def __init__(self):
+        self.meta_api = MetaApi()
+        self.fuzzy_process = fuzzy_process
+        if not self.fuzzy_process:
+            logger.warning("Neither 'rapidfuzz' nor 'thefuzz' found. Suggestions will not work. Please install one with 'pip install rapidfuzz'.")
+
+    async def _search_direct(
+        self,
+        client: OpenTargetsClient,
+        query_string: str,
+        entity_names: Optional[List[str]],
+        page_index: int,
+        page_size: int
+    ) -> Dict[str, Any]:
+        """A private helper method for a direct, simple search."""
+        graphql_query = _QUERY_SEARCH_ENTITIES
         variables = {
             "queryString": query_string,
             "entityNames": entity_names if entity_names else ["target", "disease", "drug", "variant", "study"],
@@ -200,12 +244,23 @@ class SearchApi:
             if symbol and symbol not in choices:
                 choices[symbol] = {"id": hit["id"], "entity": hit["entity"]}
         
-        extracted_suggestions = self.fuzzy_process.extractBests(
-            query_prefix,
-            choices.keys(),
-            score_cutoff=70,
-            limit=max_suggestions
-        )
+        if rapidfuzz_scorer is not None:
+            # rapidfuzz returns (choice, score, key) triples; WRatio matches
+            # thefuzz's default scorer.
+            extracted_suggestions = self.fuzzy_process.extract(
+                query_prefix,
+                list(choices.keys()),
+                scorer=rapidfuzz_scorer.WRatio,
+                score_cutoff=70,
+                limit=max_suggestions
+            )
+        else:
+            extracted_suggestions = self.fuzzy_process.extractBests(
+                query_prefix,
+                choices.keys(),
+                score_cutoff=70,
+                limit=max_suggestions
+            )
 
         suggestions = [
             {
@@ -256,21 +311,7 @@ class SearchApi:
         logger.info([hit["object"]["approvedSymbol"] for hit in similar["target"]["similarEntities"]])
         ```
         """
-        graphql_query_target = """
-        query SimilarTargets($entityId: String!, $threshold: Float, $size: Int!) {
-            target(ensemblId: $entityId) {
-                id
-                approvedSymbol
-                similarEntities(threshold: $threshold, size: $size) {
-                    score
-                    object {
-                        __typename
-                        ... on Target { id, approvedSymbol, approvedName }
-                    }
-                }
-            }
-        }
-        """
+        graphql_query_target = _QUERY_SIMILAR_TARGETS
         return await client._query(graphql_query_target, {"entityId": entity_id, "threshold": threshold, "size": size})
 
     async def search_facets(
@@ -317,19 +358,7 @@ class SearchApi:
         if not query_string:
             query_string = "*"
 
-        graphql_query = """
-        query SearchFacets(
-            $queryString: String!, $categoryId: String, $entityNames: [String!], $pageIndex: Int!, $pageSize: Int!
-        ) {
-            facets(
-                queryString: $queryString, category: $categoryId, entityNames: $entityNames, page: {index: $pageIndex, size: $pageSize}
-            ) {
-                total
-                categories { name, total }
-                hits { id, label, category, score, entityIds, datasourceId, highlights }
-            }
-        }
-        """
+        graphql_query = _QUERY_SEARCH_FACETS
         variables = filter_none_values({
             "queryString": query_string,
             "categoryId": category_id,
@@ -338,3 +367,9 @@ class SearchApi:
             "pageSize": page_size
         })
         return await client._query(graphql_query, variables)
+
+
+@functools.cache
+def get_search_api() -> SearchApi:
+    """Return the shared, stateless SearchApi instance."""
+    return SearchApi()
@@ -2,14 +2,18 @@
 """
 Defines API methods and MCP tools related to 'Study' entities in Open Targets.
 """
+import functools
 from typing import Any, Dict, List, Optional
 from ..queries import OpenTargetsClient
+from ._base import ToolApiBase
 
-class StudyApi:
+class StudyApi(ToolApiBase):
     """
     Contains methods to query study-specific data from the Open Targets GraphQL API.
     """
 
+    __slots__ = ()
+
     async def get_study_info(self, client: OpenTargetsClient, study_id: str) -> Dict[str, Any]:
         """Retrieve metadata and cohort details for a GWAS study.
 
@@ -604,3 +608,9 @@ class StudyApi:
         # Remove None values
         variables = {k: v for k, v in variables.items() if v is not None}
         return await client._query(graphql_query, variables)
+
+
+@functools.cache
+def get_study_api() -> StudyApi:
+    """Return the shared, stateless StudyApi instance."""
+    return StudyApi()
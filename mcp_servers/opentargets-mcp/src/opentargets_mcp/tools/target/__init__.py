@@ -0,0 +1,32 @@
+"""Target tool API aggregation."""
+
+import functools
+
+from .._base import ToolApiBase
+from .identity import TargetIdentityApi
+from .associations import TargetAssociationsApi
+from .biology import TargetBiologyApi
+from .profile import TargetProfileApi
+from .safety import TargetSafetyApi
+
+
+class TargetApi(
+    TargetIdentityApi,
+    TargetAssociationsApi,
+    TargetBiologyApi,
+    TargetProfileApi,
+    TargetSafetyApi,
+    ToolApiBase,
+):
+    """Unified API surface for all target-related tools."""
+
+    __slots__ = ()
+
+
+@functools.cache
+def get_target_api() -> TargetApi:
+    """Return the shared, stateless TargetApi instance."""
+    return TargetApi()
+
+
+__all__ = ["TargetApi", "get_target_api"]
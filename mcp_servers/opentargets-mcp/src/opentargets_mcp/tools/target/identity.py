@@ -0,0 +1,167 @@
+# src/opentargets_mcp/tools/target/identity.py
+"""
+Defines API methods and MCP tools related to a target's identity and classification.
+"""
+from typing import Any, Dict, FrozenSet, Optional
+from ...queries import OpenTargetsClient
+from ...utils import build_target_query, select_fields
+
+# Selection maps for "thin" vs "full" projections. Passing `fields` to a method
+# restricts the GraphQL selection to the named keys; `None` keeps the full shape.
+_TARGET_INFO_FIELDS = {
+    "id": "id",
+    "approvedSymbol": "approvedSymbol",
+    "approvedName": "approvedName",
+    "biotype": "biotype",
+    "functionDescriptions": "functionDescriptions",
+    "synonyms": "synonyms { label, source }",
+    "genomicLocation": "genomicLocation { chromosome, start, end, strand }",
+    "proteinIds": "proteinIds { id, source }",
+}
+
+_TARGET_CLASS_FIELDS = {
+    "id": "id",
+    "approvedSymbol": "approvedSymbol",
+    "targetClass": """targetClass {
+                    id
+                    label
+                    level
+                }""",
+}
+
+_TARGET_ALTERNATIVE_GENES_FIELDS = {
+    "id": "id",
+    "approvedSymbol": "approvedSymbol",
+    "alternativeGenes": "alternativeGenes",
+    "transcriptIds": "transcriptIds",
+    "dbXrefs": """dbXrefs {
+                    id
+                    source
+                }""",
+}
+
+
+class TargetIdentityApi:
+    """
+    Contains methods to query a target's identity, classification, and cross-references.
+    """
+
+    __slots__ = ()
+    async def get_target_info(
+        self,
+        client: OpenTargetsClient,
+        ensembl_id: str,
+        fields: Optional[FrozenSet[str]] = None,
+    ) -> Dict[str, Any]:
+        """Retrieve core identity details for a target gene.
+
+        **When to use**
+        - Confirm a target’s approved symbol, name, biotype, and chromosomal location
+        - Provide baseline information prior to showing associations or safety data
+        - Obtain protein identifiers for integration with external resources
+
+        **When not to use**
+        - Searching for the correct Ensembl ID (use `search_entities`)
+        - Listing target classes or cross-references (use dedicated tools below)
+
+        **Parameters**
+        - `client` (`OpenTargetsClient`): GraphQL client.
+        - `ensembl_id` (`str`): Target identifier (`"ENSG..."`).
+        - `fields` (`Optional[FrozenSet[str]]`): Restrict the projection to the named fields (e.g. `{"approvedSymbol"}`); `None` fetches the full shape.
+
+        **Returns**
+        - `Dict[str, Any]`: `{"target": {"id": str, "approvedSymbol": str, "approvedName": str, "biotype": str, "functionDescriptions": [...], "synonyms": [...], "genomicLocation": {...}, "proteinIds": [...]}}`.
+
+        **Errors**
+        - GraphQL/network errors propagate from the client.
+
+        **Example**
+        ```python
+        target_api = TargetIdentityApi()
+        target = await target_api.get_target_info(client, "ENSG00000157764")
+        print(target["target"]["approvedSymbol"])
+        ```
+        """
+        graphql_query = build_target_query(
+            "TargetInfo", select_fields(_TARGET_INFO_FIELDS, fields)
+        )
+        return await client._query(graphql_query, {"ensemblId": ensembl_id})
+
+    async def get_target_class(
+        self,
+        client: OpenTargetsClient,
+        ensembl_id: str,
+        fields: Optional[FrozenSet[str]] = None,
+    ) -> Dict[str, Any]:
+        """Return ChEMBL target class annotations for a gene.
+
+        **When to use**
+        - Display molecular target class hierarchy levels (e.g., Kinase > Ser/Thr kinase)
+        - Support filtering or grouping targets by ChEMBL classification
+        - Provide context before exploring mechanism-of-action data
+
+        **When not to use**
+        - Needing expression, safety, or association data (use specialized tools)
+
+        **Parameters**
+        - `client` (`OpenTargetsClient`): GraphQL client.
+        - `ensembl_id` (`str`): Target identifier.
+        - `fields` (`Optional[FrozenSet[str]]`): Restrict the projection to the named fields; `None` fetches the full shape.
+
+        **Returns**
+        - `Dict[str, Any]`: `{"target": {"id": str, "approvedSymbol": str, "targetClass": [{"id": str, "label": str, "level": int}, ...]}}`.
+
+        **Errors**
+        - GraphQL/network exceptions are raised by the client.
+
+        **Example**
+        ```python
+        target_api = TargetIdentityApi()
+        classes = await target_api.get_target_class(client, "ENSG00000157764")
+        print([cls["label"] for cls in classes["target"]["targetClass"]])
+        ```
+        """
+        graphql_query = build_target_query(
+            "TargetClass", select_fields(_TARGET_CLASS_FIELDS, fields)
+        )
+        return await client._query(graphql_query, {"ensemblId": ensembl_id})
+
+    async def get_target_alternative_genes(
+        self,
+        client: OpenTargetsClient,
+        ensembl_id: str,
+        fields: Optional[FrozenSet[str]] = None,
+    ) -> Dict[str, Any]:
+        """List alternate gene symbols and database cross-references for a target.
+
+        **When to use**
+        - Map the target to other identifier systems (HGNC, RefSeq, UniProt)
+        - Surface alias symbols for NLP or UI experiences
+        - Inspect transcript IDs linked to the gene
+
+        **When not to use**
+        - Retrieving functional annotations or associations (use other target tools)
+
+        **Parameters**
+        - `client` (`OpenTargetsClient`): GraphQL client.
+        - `ensembl_id` (`str`): Target identifier.
+        - `fields` (`Optional[FrozenSet[str]]`): Restrict the projection to the named fields; `None` fetches the full shape.
+
+        **Returns**
+        - `Dict[str, Any]`: `{"target": {"id": str, "approvedSymbol": str, "alternativeGenes": [str, ...], "transcriptIds": [str, ...], "dbXrefs": [{"id": str, "source": str}, ...]}}`.
+
+        **Errors**
+        - Propagates client exceptions if the request fails.
+
+        **Example**
+        ```python
+        target_api = TargetIdentityApi()
+        aliases = await target_api.get_target_alternative_genes(client, "ENSG00000157764")
+        print(aliases["target"]["dbXrefs"][:3])
+        ```
+        """
+        graphql_query = build_target_query(
+            "TargetAlternativeGenes",
+            select_fields(_TARGET_ALTERNATIVE_GENES_FIELDS, fields),
+        )
+        return await client._query(graphql_query, {"ensemblId": ensembl_id})
@@ -0,0 +1,266 @@
+# src/opentargets_mcp/tools/target/profile.py
+"""
+Defines aggregate API methods that fetch several target facets in one query.
+"""
+from typing import Any, Dict, FrozenSet, Optional
+from ...queries import OpenTargetsClient
+from ...utils import build_target_query, select_fields
+
+# One merged document replaces the eight-plus sequential calls an agent makes
+# for "tell me everything about gene X". Fragments keep the per-section
+# selections aligned with the corresponding single-purpose tools.
+_FULL_PROFILE_QUERY = """
+fragment IdentityFields on Target {
+    id
+    approvedSymbol
+    approvedName
+    biotype
+    functionDescriptions
+    synonyms { label, source }
+    genomicLocation { chromosome, start, end, strand }
+    proteinIds { id, source }
+}
+
+fragment ClassFields on Target {
+    targetClass {
+        id
+        label
+        level
+    }
+}
+
+fragment SafetyFields on Target {
+    safetyLiabilities {
+        event
+        eventId
+        effects {
+            direction
+            dosing
+        }
+        datasource
+    }
+}
+
+fragment TractabilityFields on Target {
+    tractability {
+        modality
+        value
+        label
+    }
+}
+
+fragment TEPFields on Target {
+    tep {
+        name
+        therapeuticArea
+        uri
+    }
+}
+
+query TargetFullProfile($ensemblId: String!) {
+    target(ensemblId: $ensemblId) {
+        ...IdentityFields
+        ...ClassFields
+        ...SafetyFields
+        ...TractabilityFields
+        ...TEPFields
+        associatedDiseases(page: {index: 0, size: 10}) {
+            count
+            rows {
+                disease { id, name, description, therapeuticAreas { id, name } }
+                score
+                datatypeScores { id, score }
+            }
+        }
+        knownDrugs {
+            count
+            rows {
+                drugId
+                targetId
+                drug {
+                    id
+                    name
+                    drugType
+                    maximumClinicalTrialPhase
+                    isApproved
+                    description
+                }
+                mechanismOfAction
+                disease {
+                    id
+                    name
+                }
+                phase
+                status
+                urls {
+                    name
+                    url
+                }
+            }
+        }
+    }
+}
+"""
+
+# Section name -> target-level fields that belong to it. Each section mirrors
+# the response shape of the corresponding single-purpose tool method.
+_PROFILE_SECTIONS = {
+    "info": (
+        "id", "approvedSymbol", "approvedName", "biotype",
+        "functionDescriptions", "synonyms", "genomicLocation", "proteinIds",
+    ),
+    "class": ("id", "approvedSymbol", "targetClass"),
+    "safety": ("id", "approvedSymbol", "safetyLiabilities"),
+    "tractability": ("id", "approvedSymbol", "tractability"),
+    "tep": ("id", "approvedSymbol", "tep"),
+    "associated_diseases": ("associatedDiseases",),
+    "known_drugs": ("knownDrugs",),
+}
+
+
+def split_target_full_profile(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Split a merged full-profile response into per-tool shaped sections.
+
+    Each section is shaped like the response of the corresponding
+    single-purpose tool (`{"target": {...}}`), so callers migrating from
+    individual calls can adopt the aggregate incrementally.
+
+    Args:
+        result: Raw response from the `TargetFullProfile` query
+
+    Returns:
+        Mapping of section name ("info", "class", "safety", "tractability",
+        "tep", "associated_diseases", "known_drugs") to a per-tool response
+    """
+    target: Optional[Dict[str, Any]] = result.get("target")
+    if target is None:
+        return {section: {"target": None} for section in _PROFILE_SECTIONS}
+    return {
+        section: {"target": {field: target.get(field) for field in fields}}
+        for section, fields in _PROFILE_SECTIONS.items()
+    }
+
+
+# Selection snippets for get_target_bundle, one per target facet. Paginated
+# sub-fields use a fixed first page; callers needing deeper pages should use
+# the dedicated per-facet tools.
+_BUNDLE_FIELDS = {
+    "id": "id",
+    "approvedSymbol": "approvedSymbol",
+    "approvedName": "approvedName",
+    "biotype": "biotype",
+    "functionDescriptions": "functionDescriptions",
+    "synonyms": "synonyms { label, source }",
+    "genomicLocation": "genomicLocation { chromosome, start, end, strand }",
+    "proteinIds": "proteinIds { id, source }",
+    "targetClass": "targetClass { id, label, level }",
+    "alternativeGenes": "alternativeGenes",
+    "transcriptIds": "transcriptIds",
+    "dbXrefs": "dbXrefs { id, source }",
+    "safetyLiabilities": "safetyLiabilities { event, eventId, effects { direction, dosing }, datasource }",
+    "tractability": "tractability { modality, value, label }",
+    "chemicalProbes": "chemicalProbes { id, control, drugId, isHighQuality, mechanismOfAction, origin, probesDrugsScore, probeMinerScore, scoreInCells, scoreInOrganisms, targetFromSourceId, urls { niceName, url } }",
+    "tep": "tep { name, therapeuticArea, uri }",
+    "prioritisation": "prioritisation { items { key, value } }",
+    "expressions": "expressions { tissue { id, label, organs, anatomicalSystems }, rna { level, unit, value, zscore }, protein { level, reliability, cellType { name, level, reliability } } }",
+    "geneticConstraint": "geneticConstraint { constraintType, score, exp, obs, oe, oeLower, oeUpper, upperBin, upperBin6, upperRank }",
+    "mousePhenotypes": "mousePhenotypes { modelPhenotypeId, modelPhenotypeLabel, biologicalModels { id, allelicComposition, geneticBackground }, modelPhenotypeClasses { id, label } }",
+    "pathways": "pathways { pathway, pathwayId, topLevelTerm }",
+    "geneOntology": "geneOntology { aspect, geneProduct, evidence, source, term { id, name } }",
+    "homologues": "homologues { speciesId, speciesName, targetGeneId, targetGeneSymbol, homologyType, queryPercentageIdentity, targetPercentageIdentity, isHighConfidence }",
+    "subcellularLocations": "subcellularLocations { location, source, termSL, labelSL }",
+    "hallmarks": "hallmarks { attributes { name, description, pmid }, cancerHallmarks { label, impact, description, pmid } }",
+    "isEssential": "isEssential",
+    "depMapEssentiality": "depMapEssentiality { tissueId, tissueName, screens { depmapId, cellLineName, diseaseCellLineId, diseaseFromSource, geneEffect, expression, mutation } }",
+    "interactions": "interactions(page: {index: 0, size: 10}) { count, rows { intA, intB, score, sourceDatabase, targetA { id, approvedSymbol }, targetB { id, approvedSymbol } } }",
+    "associatedDiseases": "associatedDiseases(page: {index: 0, size: 10}) { count, rows { disease { id, name, description, therapeuticAreas { id, name } }, score, datatypeScores { id, score } } }",
+    "knownDrugs": "knownDrugs { count, rows { drugId, targetId, drug { id, name, drugType, maximumClinicalTrialPhase, isApproved, description }, mechanismOfAction, disease { id, name }, phase, status, urls { name, url } } }",
+}
+
+
+class TargetProfileApi:
+    """
+    Contains the aggregate method that collects a target's full profile at once.
+    """
+
+    __slots__ = ()
+    async def fetch_target_full_profile(self, client: OpenTargetsClient, ensembl_id: str) -> Dict[str, Any]:
+        """Fetch identity, class, safety, tractability, TEP, disease and drug data in one round-trip.
+
+        **When to use**
+        - Answer "tell me everything about gene X" workflows without issuing
+          eight sequential tool calls
+        - Warm a conversation with the complete target context up front
+        - Reduce latency when several profile sections are needed together
+
+        **When not to use**
+        - Only one section is needed (use the dedicated tool; the merged
+          query fetches every section regardless)
+        - Paginating deeply into associated diseases (use
+          `get_target_associated_diseases` with explicit paging)
+
+        **Parameters**
+        - `client` (`OpenTargetsClient`): GraphQL client.
+        - `ensembl_id` (`str`): Target identifier (`"ENSG..."`).
+
+        **Returns**
+        - `Dict[str, Any]`: `{"info": {"target": {...}}, "class": {...}, "safety": {...}, "tractability": {...}, "tep": {...}, "associated_diseases": {...}, "known_drugs": {...}}` where each section mirrors the corresponding single-purpose tool's response shape.
+
+        **Errors**
+        - GraphQL/network errors propagate from the client.
+
+        **Example**
+        ```python
+        profile_api = TargetProfileApi()
+        profile = await profile_api.fetch_target_full_profile(client, "ENSG00000157764")
+        print(profile["info"]["target"]["approvedSymbol"])
+        print(profile["tractability"]["target"]["tractability"])
+        ```
+        """
+        result = await client._query(_FULL_PROFILE_QUERY, {"ensemblId": ensembl_id})
+        return split_target_full_profile(result)
+
+    async def get_target_bundle(
+        self,
+        client: OpenTargetsClient,
+        ensembl_id: str,
+        fields: Optional[FrozenSet[str]] = None,
+    ) -> Dict[str, Any]:
+        """Fetch an arbitrary set of target facets in a single fused query.
+
+        **When to use**
+        - Several facets of the same target are needed together (one document,
+          one round-trip, instead of one request per facet)
+        - Test suites or batch jobs that would otherwise issue many
+          `get_target_*` calls against the same `target(ensemblId:)` root
+
+        **When not to use**
+        - Only a single facet is needed (use the dedicated tool)
+        - Deep pagination into interactions or associated diseases (the
+          bundle fetches a fixed first page)
+
+        **Parameters**
+        - `client` (`OpenTargetsClient`): GraphQL client.
+        - `ensembl_id` (`str`): Target identifier (`"ENSG..."`).
+        - `fields` (`Optional[FrozenSet[str]]`): Facet names to include (keys of the bundle selection map, e.g. `{"tractability", "expressions"}`); `None` fetches every facet.
+
+        **Returns**
+        - `Dict[str, Any]`: `{"target": {...}}` with one key per requested facet, each shaped exactly as in the corresponding single-facet tool response.
+
+        **Errors**
+        - GraphQL/network errors propagate from the client.
+        - `ValidationError` for unknown or empty `fields`.
+
+        **Example**
+        ```python
+        profile_api = TargetProfileApi()
+        bundle = await profile_api.get_target_bundle(
+            client, "ENSG00000157764", fields=frozenset({"tractability", "geneticConstraint"})
+        )
+        print(bundle["target"]["tractability"])
+        ```
+        """
+        graphql_query = build_target_query(
+            "TargetBundle", select_fields(_BUNDLE_FIELDS, fields)
+        )
+        return await client._query(graphql_query, {"ensemblId": ensembl_id})
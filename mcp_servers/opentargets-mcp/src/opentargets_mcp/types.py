@@ -0,0 +1,35 @@
+"""Typed response shapes for Open Targets GraphQL payloads.
+
+These TypedDicts document the wire contract for responses the tools
+post-process. They are used with `typing.cast`, which is free at runtime:
+the shape is guaranteed by the GraphQL schema, and any mismatch is caught
+at the single try/except boundary in the consuming tool rather than by
+per-field runtime checks.
+"""
+from typing import List, Optional, TypedDict
+
+
+class LiteratureRow(TypedDict, total=False):
+    """A single literature co-occurrence row."""
+    pmid: str
+    pmcid: str
+    publicationDate: str
+
+
+class LiteratureOccurrences(TypedDict, total=False):
+    """The `literatureOcurrences` payload on a target (API spelling)."""
+    count: int
+    filteredCount: int
+    earliestPubYear: int
+    cursor: Optional[str]
+    rows: List[LiteratureRow]
+
+
+class TargetLiterature(TypedDict, total=False):
+    """Target subtree returned by the literature occurrences query."""
+    literatureOcurrences: Optional[LiteratureOccurrences]
+
+
+class TargetLiteratureResponse(TypedDict, total=False):
+    """Top-level response for `TargetLiteratureOcurrences`."""
+    target: Optional[TargetLiterature]
@@ -1,6 +1,9 @@
 """Utility functions for Open Targets MCP server."""
+import functools
 import json
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+
+from .exceptions import ValidationError
 
 
 def filter_none_values(variables: Dict[str, Any]) -> Dict[str, Any]:
@@ -43,3 +46,62 @@ def generate_cache_key(query: str, variables: Optional[Dict[str, Any]] = None) -
     # Use JSON serialization with sorted keys for consistent, collision-free cache keys
     vars_str = json.dumps(variables, sort_keys=True, separators=(',', ':'))
     return f"{query}:{vars_str}"
+
+
+def select_fields(
+    field_map: Mapping[str, str],
+    fields: Optional[Iterable[str]] = None,
+) -> Tuple[str, ...]:
+    """Resolve a caller-requested field projection against a selection map.
+
+    Tool methods that support "thin" projections declare a mapping of public
+    field names to GraphQL selection snippets. Callers pass a set of field
+    names to fetch only what they need; `None` keeps the full (legacy) shape.
+
+    Args:
+        field_map: Ordered mapping of field name to GraphQL selection snippet
+        fields: Optional subset of field names to request
+
+    Returns:
+        Tuple of GraphQL selection snippets, in declaration order
+
+    Raises:
+        ValidationError: If a requested field name is not in the map
+    """
+    if fields is None:
+        return tuple(field_map.values())
+    requested = frozenset(fields)
+    if not requested:
+        raise ValidationError(
+            f"At least one field must be requested; valid fields: {sorted(field_map)}"
+        )
+    unknown = requested - field_map.keys()
+    if unknown:
+        raise ValidationError(
+            f"Unknown field(s) {sorted(unknown)}; valid fields: {sorted(field_map)}"
+        )
+    return tuple(snippet for name, snippet in field_map.items() if name in requested)
+
+
+@functools.lru_cache(maxsize=None)
+def build_target_query(operation_name: str, selections: Tuple[str, ...]) -> str:
+    """Build (and cache) a single-target GraphQL query for a field projection.
+
+    The query string is cached per `(operation_name, selections)` so repeated
+    calls with the same projection reuse the same string object.
+
+    Args:
+        operation_name: GraphQL operation name (e.g. "TargetInfo")
+        selections: Selection snippets as produced by `select_fields`
+
+    Returns:
+        A complete GraphQL query string parameterised on `$ensemblId`
+    """
+    body = "\n                ".join(selections)
+    return f"""
+        query {operation_name}($ensemblId: String!) {{
+            target(ensemblId: $ensemblId) {{
+                {body}
+            }}
+        }}
+        """
@@ -1,8 +1,16 @@
 # tests/conftest.py
-import pytest
 import asyncio
+import os
+
+import pytest
+import pytest_asyncio
 from opentargets_mcp.queries import OpenTargetsClient
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Common test identifiers that can be used across different test files
 TEST_TARGET_ID_BRAF = "ENSG00000157764"      # BRAF
 TEST_TARGET_ID_EGFR = "ENSG00000146648"      # EGFR
@@ -15,16 +23,50 @@ TEST_VARIANT_ID_RS699 = "rs699"             # Example rsID variant
 TEST_STUDY_ID = "GCST90002357"       # Example GWAS study
 TEST_STUDY_LOCUS_ID = "GCST004131_1_109817651" # Example credible set
 
-@pytest.fixture(scope="function")
+def pytest_asyncio_loop_factories(config, item):
+    """
+    Runs the whole suite on uvloop when available. This is pytest-asyncio's
+    supported customisation point in >=1.4 (overriding the event_loop or
+    event_loop_policy fixtures is deprecated/unsupported there).
+    """
+    if uvloop is not None:
+        return {"uvloop": uvloop.new_event_loop}
+    return {"asyncio": asyncio.new_event_loop}
+
+
+@pytest_asyncio.fixture(scope="session")
 async def client():
     """
-    Provides an OpenTargetsClient instance for each test function.
-    Ensures the client session is created in the correct event loop and closed afterwards.
+    Provides a single OpenTargetsClient shared across the whole test session,
+    so the HTTP session (and its connection pool) is set up once instead of
+    per test function. OPEN_TARGETS_API_URL redirects the suite to a local
+    stub; the disk cache is disabled so runs stay hermetic.
     """
-    ot_client = OpenTargetsClient()
+    kwargs = {"disk_cache_dir": None}
+    api_url = os.getenv("OPEN_TARGETS_API_URL")
+    if api_url:
+        kwargs["base_url"] = api_url
+    ot_client = OpenTargetsClient(**kwargs)
     # Ensure the client has an active session before yielding
     # This can be important if _ensure_session is not called by the first operation in a test
     await ot_client._ensure_session()
     yield ot_client
-    # Ensure client session is closed after each test
-    await ot_client.close()
\ No newline at end of file
+    # Close the shared session once the whole suite is done
+    await ot_client.close()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def braf_bundle(client):
+    """
+    Fetches the full BRAF target bundle once per session; the target tests
+    assert against its facets instead of issuing ~20 separate queries.
+    """
+    from opentargets_mcp.tools.target import get_target_api
+    return await get_target_api().get_target_bundle(client, TEST_TARGET_ID_BRAF)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def egfr_bundle(client):
+    """Full EGFR target bundle, fetched once per session (see braf_bundle)."""
+    from opentargets_mcp.tools.target import get_target_api
+    return await get_target_api().get_target_bundle(client, TEST_TARGET_ID_EGFR)
\ No newline at end of file
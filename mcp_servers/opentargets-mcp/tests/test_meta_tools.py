@@ -3,7 +3,6 @@ import pytest
 from opentargets_mcp.queries import OpenTargetsClient
 from opentargets_mcp.tools.meta import MetaApi
 
-@pytest.mark.asyncio
 class TestMetaTools:
     """Tests for metadata and utility tools."""
     meta_api = MetaApi()
@@ -12,20 +11,20 @@ class TestMetaTools:
         result = await self.meta_api.get_api_metadata(client)
         assert result is not None
         assert "meta" in result
-        if result.get("meta"):
-            assert "name" in result["meta"]
-            assert "apiVersion" in result["meta"]
-            assert "dataVersion" in result["meta"]
+        if (meta := result.get("meta")) is not None:
+            assert "name" in meta
+            assert "apiVersion" in meta
+            assert "dataVersion" in meta
 
     async def test_get_association_datasources(self, client: OpenTargetsClient):
         result = await self.meta_api.get_association_datasources(client)
         assert result is not None
         assert "associationDatasources" in result
-        if result.get("associationDatasources"):
-            assert isinstance(result["associationDatasources"], list)
-            if result["associationDatasources"]:
-                assert "datasource" in result["associationDatasources"][0]
-                assert "datatype" in result["associationDatasources"][0]
+        if (datasources := result.get("associationDatasources")) is not None:
+            assert isinstance(datasources, list)
+            if datasources:
+                assert "datasource" in datasources[0]
+                assert "datatype" in datasources[0]
 
     async def test_get_interaction_resources(self, client: OpenTargetsClient):
         result = await self.meta_api.get_interaction_resources(client)
@@ -37,17 +36,17 @@ class TestMetaTools:
         result = await self.meta_api.get_gene_ontology_terms(client, go_ids)
         assert result is not None
         assert "geneOntologyTerms" in result
-        if result.get("geneOntologyTerms"):
-            assert isinstance(result["geneOntologyTerms"], list)
+        if (terms := result.get("geneOntologyTerms")) is not None:
+            assert isinstance(terms, list)
 
     async def test_map_ids(self, client: OpenTargetsClient):
         query_terms = ["BRAF", "melanoma", "vemurafenib"]
         result = await self.meta_api.map_ids(client, query_terms)
         assert result is not None
         assert "mapIds" in result
-        if result.get("mapIds"):
-            assert "mappings" in result["mapIds"]
-            assert "total" in result["mapIds"]
+        if (map_ids := result.get("mapIds")) is not None:
+            assert "mappings" in map_ids
+            assert "total" in map_ids
 
     async def test_map_ids_variant(self, client: OpenTargetsClient):
         query_terms = ["rs699"]
@@ -4,7 +4,6 @@ from opentargets_mcp.queries import OpenTargetsClient
 from opentargets_mcp.tools.search import SearchApi
 from .conftest import TEST_TARGET_ID_BRAF, TEST_TARGET_ID_EGFR
 
-@pytest.mark.asyncio
 class TestSearchTools:
     """Tests for general Search tools, including intelligent resolution and autocomplete features."""
     search_api = SearchApi()
@@ -74,16 +73,16 @@ class TestSearchTools:
         result = await self.search_api.get_similar_targets(client, TEST_TARGET_ID_BRAF, size=1)
         assert result is not None
         assert "target" in result
-        if result.get("target"):
-            assert "similarEntities" in result["target"]
+        if (target := result.get("target")) is not None:
+            assert "similarEntities" in target
 
     async def test_search_facets(self, client: OpenTargetsClient):
         result = await self.search_api.search_facets(client, query_string="cancer", page_size=1)
         assert result is not None
         assert "facets" in result
-        if result.get("facets"):
-            assert "categories" in result["facets"]
-            assert "hits" in result["facets"]
+        if (facets := result.get("facets")) is not None:
+            assert "categories" in facets
+            assert "hits" in facets
 
     async def test_search_entities_variant(self, client: OpenTargetsClient):
         result = await self.search_api.search_entities(client, "rs699", entity_names=["variant"], page_size=1)
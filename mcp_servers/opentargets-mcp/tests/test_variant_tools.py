@@ -4,7 +4,6 @@ from opentargets_mcp.queries import OpenTargetsClient
 from opentargets_mcp.tools.variant import VariantApi
 from .conftest import TEST_VARIANT_ID_1
 
-@pytest.mark.asyncio
 class TestVariantTools:
     """Tests for tools related to Variants."""
     variant_api = VariantApi()
@@ -13,55 +12,55 @@ class TestVariantTools:
         result = await self.variant_api.get_variant_info(client, TEST_VARIANT_ID_1)
         assert result is not None
         assert "variant" in result
-        if result.get("variant"):
-            assert result["variant"]["id"] == TEST_VARIANT_ID_1
-            assert "chromosome" in result["variant"]
-            assert "position" in result["variant"]
-            assert "referenceAllele" in result["variant"]
-            assert "alternateAllele" in result["variant"]
+        if (variant := result.get("variant")) is not None:
+            assert variant["id"] == TEST_VARIANT_ID_1
+            assert "chromosome" in variant
+            assert "position" in variant
+            assert "referenceAllele" in variant
+            assert "alternateAllele" in variant
 
     async def test_get_variant_credible_sets(self, client: OpenTargetsClient):
         result = await self.variant_api.get_variant_credible_sets(client, TEST_VARIANT_ID_1, page_size=1)
         assert result is not None
         assert "variant" in result
-        if result.get("variant"):
-            assert "credibleSets" in result["variant"]
-            if result["variant"]["credibleSets"]:
-                assert "rows" in result["variant"]["credibleSets"]
+        if (variant := result.get("variant")) is not None:
+            assert "credibleSets" in variant
+            if variant["credibleSets"]:
+                assert "rows" in variant["credibleSets"]
 
     async def test_get_variant_pharmacogenomics(self, client: OpenTargetsClient):
         result = await self.variant_api.get_variant_pharmacogenomics(client, TEST_VARIANT_ID_1, page_size=1)
         assert result is not None
         assert "variant" in result
-        if result.get("variant"):
-            assert "pharmacogenomics" in result["variant"]
+        if (variant := result.get("variant")) is not None:
+            assert "pharmacogenomics" in variant
 
     async def test_get_variant_evidences(self, client: OpenTargetsClient):
         result = await self.variant_api.get_variant_evidences(client, TEST_VARIANT_ID_1, size=1)
         assert result is not None
         assert "variant" in result
-        if result.get("variant"):
-            assert "evidences" in result["variant"]
-            if result["variant"]["evidences"]:
-                assert "rows" in result["variant"]["evidences"]
+        if (variant := result.get("variant")) is not None:
+            assert "evidences" in variant
+            if variant["evidences"]:
+                assert "rows" in variant["evidences"]
 
     async def test_get_variant_intervals(self, client: OpenTargetsClient):
         result = await self.variant_api.get_variant_intervals(client, TEST_VARIANT_ID_1, page_size=5)
         assert result is not None
         assert "variant" in result
-        if result.get("variant"):
-            assert "intervals" in result["variant"]
-            if result["variant"]["intervals"]:
-                assert "count" in result["variant"]["intervals"]
-                assert "rows" in result["variant"]["intervals"]
+        if (variant := result.get("variant")) is not None:
+            assert "intervals" in variant
+            if variant["intervals"]:
+                assert "count" in variant["intervals"]
+                assert "rows" in variant["intervals"]
 
     async def test_get_variant_protein_coordinates(self, client: OpenTargetsClient):
         # Use BRAF V600E variant which has protein coding consequences
         result = await self.variant_api.get_variant_protein_coordinates(client, "7_140753336_A_T", page_size=5)
         assert result is not None
         assert "variant" in result
-        if result.get("variant"):
-            assert "proteinCodingCoordinates" in result["variant"]
-            if result["variant"]["proteinCodingCoordinates"]:
-                assert "count" in result["variant"]["proteinCodingCoordinates"]
-                assert "rows" in result["variant"]["proteinCodingCoordinates"]
\ No newline at end of file
+        if (variant := result.get("variant")) is not None:
+            assert "proteinCodingCoordinates" in variant
+            if variant["proteinCodingCoordinates"]:
+                assert "count" in variant["proteinCodingCoordinates"]
+                assert "rows" in variant["proteinCodingCoordinates"]
\ No newline at end of file